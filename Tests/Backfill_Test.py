@@ -0,0 +1,95 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from src.Utils import backfill as backfill_module
+from src.Utils.backfill import TokenBucket, backfill
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+        for _ in range(7):
+            bucket.acquire()
+        self.assertEqual(clock.sleeps, [0.5] * 4)  # three free, then one token every 1 / rate seconds
+
+    def test_refills_while_idle(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 10
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+
+class TestBackfill(unittest.TestCase):
+
+    def test_batches_written_on_calling_thread(self):
+        batches, threads = [], set()
+
+        def write_batch(batch):
+            threads.add(threading.get_ident())
+            batches.append(sorted(batch))
+
+        errors = backfill(range(7), lambda job: job * 10, write_batch, workers=3, batch_size=3)
+        self.assertEqual(errors, {})
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+        self.assertEqual(sorted(pair for batch in batches for pair in batch), [(job, job * 10) for job in range(7)])
+        self.assertEqual(threads, {threading.get_ident()})
+
+    def test_failures_are_reported_not_written(self):
+        def fetch(job):
+            if job == 2:
+                raise ConnectionError("reset")
+            return job
+
+        written = []
+        errors = backfill(range(4), fetch, written.extend, workers=2, batch_size=10)
+        self.assertEqual(list(errors), [2])
+        self.assertEqual(sorted(written), [(0, 0), (1, 1), (3, 3)])
+
+    def test_writer_error_stops_the_backfill(self):
+        started = []
+        release = threading.Event()
+
+        class ReleasingPool(ThreadPoolExecutor):
+            """ Lets the blocked fetch finish only once the queued jobs have been cancelled. """
+
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                super().shutdown(wait=False, cancel_futures=cancel_futures)
+                release.set()
+                super().shutdown(wait=wait)
+
+        def fetch(job):
+            started.append(job)
+            if job > 0:  # every job after the first waits for the pool's shutdown, so none can finish early
+                release.wait(10)
+            return job
+
+        def write_batch(batch):
+            raise RuntimeError("disk full")
+
+        with mock.patch.object(backfill_module, 'ThreadPoolExecutor', ReleasingPool):
+            with self.assertRaises(RuntimeError):
+                backfill(range(1000), fetch, write_batch, workers=1, batch_size=1)
+        # job 0 was written; at most job 1 was running when the write failed, the rest were cancelled
+        self.assertLessEqual(len(started), 2)
@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.Utils import storage
+from src.Utils.Dictionaries import team_index_current
+from src.Utils.dataset_builder import (build_dataset, read_watermarks, season_games, sync_feature_store,
+                                      update_dataset)
+from src.Utils.feature_store import FeatureStore
+from src.Utils.team_stats_store import TeamStatsStore
+
+FIRST_NAME = {position: team for team, position in reversed(team_index_current.items())}  # skips aliases
+TEAMS = [FIRST_NAME[position] for position in range(30)]
+DATES = ['2023-10-25', '2023-10-26', '2023-10-27']
+SEASON_RANGES = {'2023-24': {'start_date': '2023-10-24', 'end_date': '2024-04-28'}}
+
+
+def snapshots():
+    rng = np.random.default_rng(0)
+    frames = []
+    for day, date in enumerate(DATES):
+        teams = TEAMS if day != 1 else TEAMS[:-1]  # an incomplete day is skipped
+        frames.append(pd.DataFrame({
+            'index': range(len(teams)),
+            'TEAM_ID': np.arange(len(teams)) + 1610612737,
+            'TEAM_NAME': teams,
+            'GP': day + 1,
+            'PTS': rng.normal(112, 5, len(teams)),
+            'Date': date,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def odds():
+    rng = np.random.default_rng(1)
+    rows = []
+    for date in DATES:
+        for home, away in rng.permutation(30).reshape(15, 2):
+            points = float(rng.integers(200, 240))
+            rows.append({'Date': date, 'Home': TEAMS[home], 'Away': TEAMS[away], 'OU': float(rng.choice([points, 220.5])),
+                         'Spread': 1.5, 'ML_Home': -110, 'ML_Away': 100, 'Points': points,
+                         'Win_Margin': float(rng.integers(-20, 20)), 'Days_Rest_Home': 2, 'Days_Rest_Away': 1})
+    return pd.DataFrame(rows)
+
+
+def per_row_build(odds_df, snapshots_df):
+    """ The Create_Games.py loop this replaces: one snapshot per odds row, one Series per game. """
+    games, targets = [], []
+    for row in odds_df.itertuples():
+        team_df = snapshots_df[snapshots_df['Date'] == row[1]].set_index('index')
+        if len(team_df.index) == 30:
+            targets.append([row[8], 1 if row[9] > 0 else 0, row[4],
+                            0 if row[8] < row[4] else 1 if row[8] > row[4] else 2, row[10], row[11]])
+            home_team_series = team_df.iloc[team_index_current.get(row[2])]
+            away_team_series = team_df.iloc[team_index_current.get(row[3])]
+            games.append(pd.concat([home_team_series, away_team_series.rename(
+                index={col: f"{col}.1" for col in team_df.columns.values})]))
+    frame = pd.concat(games, ignore_index=True, axis=1).T.drop(columns=['TEAM_ID', 'TEAM_ID.1'])
+    targets = np.asarray(targets)
+    for i, name in enumerate(['Score', 'Home-Team-Win', 'OU', 'OU-Cover', 'Days-Rest-Home', 'Days-Rest-Away']):
+        frame[name] = targets[:, i]
+    return frame
+
+
+def as_float(frame):
+    for field in frame.columns.values:
+        if 'TEAM_' not in field and 'Date' not in field:
+            frame[field] = frame[field].astype(float)
+    return frame
+
+
+def publish(directory, through='2023-10-27'):
+    """ Writes the fixture odds and snapshots through `through`; returns (odds_db, team_db). """
+    odds_db, team_db = os.path.join(directory, 'odds.sqlite'), os.path.join(directory, 'team.sqlite')
+    odds_df, snapshots_df = odds(), snapshots()
+    con = sqlite3.connect(odds_db)
+    odds_df[odds_df['Date'] <= through].to_sql('odds_2023-24_new', con, if_exists='replace')
+    con.close()
+    store = TeamStatsStore.open(team_db)
+    store.insert(snapshots_df[snapshots_df['Date'] <= through])
+    store.close()
+    return odds_db, team_db
+
+
+class TestDatasetBuilder(unittest.TestCase):
+
+    def test_matches_per_row_build(self):
+        expected = as_float(per_row_build(odds(), snapshots()))
+        built = as_float(season_games(odds(), snapshots(), '2023-24'))
+        self.assertEqual(len(built), 30)
+        self.assertEqual(list(built.columns), list(expected.columns))
+        for column in built.columns:
+            self.assertEqual(built[column].tolist(), expected[column].tolist(), column)
+
+    def test_unknown_team_raises(self):
+        odds_df = odds()
+        odds_df.loc[0, 'Home'] = 'Springfield Isotopes'
+        with self.assertRaises(KeyError):
+            season_games(odds_df, snapshots(), '2023-24')
+
+    def test_build_dataset_stacks_seasons_in_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            odds_db, team_db = os.path.join(directory, 'odds.sqlite'), os.path.join(directory, 'team.sqlite')
+            con = sqlite3.connect(odds_db)
+            for season in ['2022-23', '2023-24']:
+                odds().to_sql(f'odds_{season}_new', con)
+            con.close()
+            store = TeamStatsStore.open(team_db)
+            store.insert(snapshots())
+            store.close()
+
+            frame = build_dataset(['2022-23', '2023-24'], odds_db, team_db, workers=2)
+        self.assertEqual(len(frame), 60)
+        self.assertEqual(frame['PTS'].dtype, float)
+        self.assertEqual(frame['TEAM_NAME'].iloc[:30].tolist(), frame['TEAM_NAME'].iloc[30:].tolist())
+
+    def test_incremental_build_appends_only_new_games(self):
+        with tempfile.TemporaryDirectory() as directory:
+            odds_db, team_db = os.path.join(directory, 'odds.sqlite'), os.path.join(directory, 'team.sqlite')
+            dataset_con = sqlite3.connect(os.path.join(directory, 'dataset.sqlite'))
+            odds_df, snapshots_df = odds(), snapshots()
+
+            def publish(through):
+                con = sqlite3.connect(odds_db)
+                odds_df[odds_df['Date'] <= through].to_sql('odds_2023-24_new', con, if_exists='replace')
+                con.close()
+                store = TeamStatsStore.open(team_db)
+                store.insert(snapshots_df[snapshots_df['Date'] <= through])
+                store.close()
+
+            publish('2023-10-26')
+            self.assertEqual(len(update_dataset(['2023-24'], odds_db, team_db, dataset_con, 'games')), 15)
+            self.assertEqual(read_watermarks(dataset_con, 'games'), {'2023-24': '2023-10-25'})
+
+            publish('2023-10-27')
+            new = update_dataset(['2023-24'], odds_db, team_db, dataset_con, 'games')
+            self.assertEqual(new.index.tolist(), list(range(15, 30)))
+            self.assertEqual(set(new['Date']), {'2023-10-27'})
+            incremental = pd.read_sql_query('select * from games', dataset_con, index_col='index')
+
+            full = update_dataset(['2023-24'], odds_db, team_db, dataset_con, 'games', full=True)
+            dataset_con.close()
+        pd.testing.assert_frame_equal(incremental, full, check_names=False, check_dtype=False)
+
+    def test_interrupted_full_build_keeps_the_previous_table(self):
+        with tempfile.TemporaryDirectory() as directory:
+            odds_db, team_db = publish(directory)
+            con = sqlite3.connect(os.path.join(directory, 'dataset.sqlite'))
+            self.assertEqual(len(update_dataset(['2023-24'], odds_db, team_db, con, 'games')), 30)
+
+            with mock.patch.object(storage, 'insert_rows', side_effect=KeyboardInterrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    update_dataset(['2023-24'], odds_db, team_db, con, 'games', full=True)
+            self.assertEqual(con.execute('select count(*) from games').fetchone()[0], 30)
+            self.assertEqual(read_watermarks(con, 'games'), {'2023-24': '2023-10-27'})
+
+            self.assertEqual(len(update_dataset(['2023-24'], odds_db, team_db, con, 'games')), 0)
+            self.assertEqual(con.execute('select count(*) from games').fetchone()[0], 30)
+            con.close()
+
+    def test_table_without_watermarks_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as directory:
+            odds_db, team_db = publish(directory)
+            con = sqlite3.connect(os.path.join(directory, 'dataset.sqlite'))
+            storage.write_frame(con, 'games', build_dataset(['2023-24'], odds_db, team_db, workers=1))
+            self.assertEqual(len(update_dataset(['2023-24'], odds_db, team_db, con, 'games')), 30)
+            self.assertEqual(con.execute('select count(*) from games').fetchone()[0], 30)
+            con.close()
+
+    def test_feature_store_is_repaired_from_the_table(self):
+        with tempfile.TemporaryDirectory() as directory:
+            odds_db, team_db = publish(directory)
+            con = sqlite3.connect(os.path.join(directory, 'dataset.sqlite'))
+            frame = update_dataset(['2023-24'], odds_db, team_db, con, 'games')
+            store = FeatureStore(os.path.join(directory, 'features'))
+            self.assertEqual(sync_feature_store(con, 'games', store, SEASON_RANGES), ['2023-24'])
+            self.assertEqual(sync_feature_store(con, 'games', store, SEASON_RANGES), [])
+
+            store.append(frame, SEASON_RANGES)  # the duplicated rows an interrupted run used to leave
+            self.assertEqual(store.num_rows('2023-24'), 60)
+            self.assertEqual(sync_feature_store(con, 'games', store, SEASON_RANGES), ['2023-24'])
+            self.assertEqual(store.num_rows('2023-24'), 30)
+            np.testing.assert_array_equal(store.to_frame()['PTS'], frame['PTS'].to_numpy(dtype=np.float32))
+            con.close()
@@ -1,4 +1,7 @@
 import unittest
+
+import numpy as np
+
 from src.Utils import Expected_Value
 
 
@@ -35,3 +38,16 @@ class TestExpectedValue(unittest.TestCase):
     def test_expected_value_8(self):
         result = Expected_Value.expected_value(.638, 275)
         self.assertEqual(result, 139.25)
+
+    def test_expected_values_grid_matches_scalar(self):
+        rng = np.random.default_rng(7)
+        probs = rng.random((15, 1, 2))
+        odds = rng.choice(np.r_[-2000:-99, 100:2001], size=(15, 6, 2))
+        result = Expected_Value.expected_values(probs, odds)
+        self.assertEqual(result.shape, (15, 6, 2))
+        for g, b, s in np.ndindex(*result.shape):
+            self.assertEqual(result[g, b, s], Expected_Value.expected_value(float(probs[g, 0, s]), int(odds[g, b, s])))
+
+    def test_round_half_even_matches_round(self):
+        values = np.array([1.005, 2.675, 0.285, -8.345, 33.335, 0.125])
+        self.assertEqual(Expected_Value.round_half_even(values, 2).tolist(), [round(float(v), 2) for v in values])
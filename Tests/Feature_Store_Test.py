@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.Utils.feature_store import FeatureStore
+
+SEASONS = {
+    '2022-23': {'start_date': '2022-10-18', 'end_date': '2023-6-12'},
+    '2023-24': {'start_date': '2023-10-24', 'end_date': '2024-6-17'},
+}
+
+
+def dataset(n=40):
+    rng = np.random.default_rng(0)
+    dates = pd.Series(['2022-11-01', '2023-03-15', '2023-11-02', '2024-01-20'] * (n // 4))
+    return pd.DataFrame({
+        'TEAM_NAME': 'Boston Celtics', 'GP': rng.integers(1, 82, n).astype(float), 'W_PCT': rng.random(n), 'Date': dates,
+        'TEAM_NAME.1': 'Miami Heat', 'GP.1': rng.integers(1, 82, n).astype(float), 'W_PCT.1': rng.random(n), 'Date.1': dates,
+        'Score': rng.integers(190, 250, n).astype(float), 'Home-Team-Win': rng.integers(0, 2, n).astype(float),
+        'OU': rng.choice([215.5, 220.0, 231.5], n), 'OU-Cover': rng.integers(0, 3, n).astype(float),
+        'Days-Rest-Home': rng.integers(1, 10, n).astype(float), 'Days-Rest-Away': rng.integers(1, 10, n).astype(float),
+    })
+
+
+def trainer_xy(data, target):
+    """ What each training script used to do with the SQLite table. """
+    data = data.copy()
+    label = data['Home-Team-Win' if target == 'ML' else 'OU-Cover']
+    total = data['OU']
+    data.drop(['Score', 'Home-Team-Win', 'TEAM_NAME', 'Date', 'TEAM_NAME.1', 'Date.1', 'OU-Cover', 'OU'], axis=1, inplace=True)
+    if target == 'UO':
+        data['OU'] = np.asarray(total)
+    return data.values.astype(float), np.asarray(label)
+
+
+class TestFeatureStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = FeatureStore(self.directory.name)
+        self.data = dataset()
+        self.store.write(self.data, SEASONS)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_partitions_by_season(self):
+        self.assertEqual(self.store.seasons(), ['2022-23', '2023-24'])
+        self.assertEqual(self.store.load(['2023-24']).num_rows, 20)
+
+    def test_xy_matches_the_trainers(self):
+        order = np.argsort(self.data['Date'].map({'2022-11-01': 0, '2023-03-15': 0, '2023-11-02': 1, '2024-01-20': 1}),
+                           kind='stable')
+        for target in ('ML', 'UO'):
+            expected_x, expected_y = trainer_xy(self.data.iloc[order], target)
+            x, y = self.store.xy(target)
+            self.assertEqual(x.dtype, np.float32)
+            np.testing.assert_array_equal(x, expected_x.astype(np.float32))
+            np.testing.assert_array_equal(y, expected_y.astype(int))
+        self.assertEqual(self.store.feature_columns('UO')[-1], 'OU')
+
+    def test_append_touches_only_seasons_with_new_games(self):
+        before = os.path.getmtime(self.store.path('2022-23'))
+        new = dataset(4).iloc[2:]
+        self.store.append(new, SEASONS)
+        self.assertEqual(os.path.getmtime(self.store.path('2022-23')), before)
+        self.assertEqual(self.store.load(['2023-24']).num_rows, 22)
+        self.assertEqual(self.store.load(['2023-24']).column('W_PCT').to_pylist()[-2:],
+                         new['W_PCT'].astype(np.float32).tolist())
+
+    def test_projection(self):
+        table = self.store.load(columns=['GP', 'Date'])
+        self.assertEqual(table.column_names, ['GP', 'Date'])
+        self.assertEqual(table.column('Date').to_pylist()[:2], ['2022-11-01', '2023-03-15'])
+
+    def test_games_outside_every_season_are_rejected(self):
+        data = dataset(4)
+        data.loc[0, 'Date'] = '2023-08-01'
+        with self.assertRaises(ValueError):
+            self.store.write(data, SEASONS)
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src.Utils.http_client import FOREVER, HttpClient
+
+
+class FakeResponse:
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, timeout))
+        return FakeResponse({'n': len(self.calls)})
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.client = HttpClient(cache_dir=self.cache_dir.name, ttl=60, timeout=(1, 2))
+        self.client.session = FakeSession()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_second_fetch_is_served_from_cache(self):
+        self.assertEqual(self.client.get_json('https://stats.nba.com/a'), {'n': 1})
+        self.assertEqual(self.client.get_json('https://stats.nba.com/a'), {'n': 1})
+        self.assertEqual(self.client.session.calls, [('https://stats.nba.com/a', (1, 2))])
+
+    def test_stale_entries_are_refetched(self):
+        self.client.get_json('https://stats.nba.com/a')
+        stale = time.time() - 120
+        os.utime(self.client.cache_path('https://stats.nba.com/a'), (stale, stale))
+        self.assertEqual(self.client.get_json('https://stats.nba.com/a'), {'n': 2})
+        self.assertEqual(self.client.get_json('https://stats.nba.com/a', ttl=FOREVER), {'n': 2})
+
+    def test_zero_ttl_bypasses_cache(self):
+        self.client.get_json('https://stats.nba.com/a', ttl=0)
+        self.client.get_json('https://stats.nba.com/a', ttl=0)
+        self.assertEqual(len(self.client.session.calls), 2)
+        self.assertFalse(os.path.exists(self.client.cache_path('https://stats.nba.com/a')))
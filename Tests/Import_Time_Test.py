@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+import unittest
+
+IMPORT_BUDGET_SECONDS = 2.0
+HEAVY_MODULES = ['tensorflow', 'keras', 'xgboost', 'selenium', 'webdriver_manager']
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def probe_import(module):
+    """
+    Imports `module` in a fresh interpreter and returns (seconds spent, heavy modules that got imported).
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    elapsed, heavy = out.stdout.split('\n')[:2]
+    return float(elapsed), [m for m in heavy.split(',') if m]
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_main_import_within_budget(self):
+        elapsed, _ = probe_import('main')
+        self.assertLess(elapsed, IMPORT_BUDGET_SECONDS)
+
+    def test_main_import_skips_heavy_modules(self):
+        _, heavy = probe_import('main')
+        self.assertEqual(heavy, [])
+
+    def test_xgboost_runner_import_loads_no_model(self):
+        _, heavy = probe_import('src.Predict.XGBoost_Runner')
+        self.assertEqual(heavy, [])
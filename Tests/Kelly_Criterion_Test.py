@@ -1,4 +1,7 @@
 import unittest
+
+import numpy as np
+
 from src.Utils import Kelly_Criterion as kc
 
 
@@ -23,3 +26,12 @@ class TestKellyCriterion(unittest.TestCase):
     def test_calculate_kelly_criterion_5(self):
         result = kc.calculate_kelly_criterion(100, .99)
         self.assertEqual(result, 98)
+
+    def test_kelly_fractions_grid_matches_scalar(self):
+        rng = np.random.default_rng(11)
+        probs = rng.random((15, 1, 2))
+        odds = rng.choice(np.r_[-2000:-99, 100:2001], size=(15, 6, 2))
+        result = kc.kelly_fractions(odds, probs)
+        self.assertEqual(result.shape, (15, 6, 2))
+        for g, b, s in np.ndindex(*result.shape):
+            self.assertEqual(result[g, b, s], kc.calculate_kelly_criterion(int(odds[g, b, s]), float(probs[g, 0, s])))
@@ -0,0 +1,39 @@
+import threading
+import unittest
+
+import numpy as np
+
+from src.Predict.Micro_Batcher import MicroBatcher
+
+
+class TestMicroBatcher(unittest.TestCase):
+
+    def test_results_are_sliced_per_caller(self):
+        batcher = MicroBatcher(lambda rows: (rows.sum(axis=1), rows[:, 0]))
+        totals, firsts = batcher.predict([[1, 2], [3, 4]])
+        np.testing.assert_array_equal(totals, [3, 7])
+        np.testing.assert_array_equal(firsts, [1, 3])
+
+    def test_concurrent_requests_share_one_call(self):
+        calls = []
+        release = threading.Event()
+
+        def predict_fn(rows):
+            release.wait()
+            calls.append(len(rows))
+            return rows * 2
+
+        batcher = MicroBatcher(predict_fn, max_wait=0.5)
+        futures = [batcher.submit([[i, i]]) for i in range(5)]
+        release.set()
+        for i, future in enumerate(futures):
+            np.testing.assert_array_equal(future.result(1), [[2 * i, 2 * i]])
+        self.assertEqual(calls, [5])
+
+    def test_errors_reach_every_caller(self):
+        def predict_fn(rows):
+            raise ValueError("bad batch")
+
+        batcher = MicroBatcher(predict_fn)
+        with self.assertRaises(ValueError):
+            batcher.predict([[1.0]], timeout=1)
@@ -0,0 +1,30 @@
+import unittest
+
+import numpy as np
+
+from src.Predict.Model_Registry import ModelRegistry, discover_models
+
+
+class TestModelRegistry(unittest.TestCase):
+
+    def test_discovers_boosters_and_networks(self):
+        specs = {(spec.kind, spec.target) for spec in discover_models()}
+        self.assertIn(('xgb', 'ML'), specs)
+        self.assertIn(('nn', 'ML'), specs)
+        self.assertIn(('nn', 'UO'), specs)
+
+    def test_blend_is_mean_of_models(self):
+        registry = ModelRegistry()
+        data = np.random.default_rng(0).uniform(0, 50, size=(15, 106))
+        per_model, blended = registry.score(data, target='ML', kind='xgb')
+        self.assertEqual(len(per_model), len(registry.models('ML', kind='xgb')))
+        np.testing.assert_allclose(blended, np.mean(list(per_model.values()), axis=0), rtol=1e-6)
+        np.testing.assert_allclose(blended.sum(axis=1), 1, rtol=1e-6)
+
+    def test_weights_select_a_single_model(self):
+        registry = ModelRegistry()
+        names = [spec.name for spec in registry.models('ML', kind='xgb')]
+        data = np.random.default_rng(1).uniform(0, 50, size=(4, 106))
+        weights = {name: float(i == 0) for i, name in enumerate(names)}
+        per_model, blended = registry.score(data, target='ML', kind='xgb', weights=weights)
+        np.testing.assert_allclose(blended, per_model[names[0]], rtol=1e-6)
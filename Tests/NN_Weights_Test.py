@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.Predict import NN_Runner, NN_Weights
+from src.Predict.Model_Loader import NN_ML_MODEL, NN_UO_MODEL
+from src.Utils.tools import normalize
+
+# tf.keras predict() of the SavedModels on keras_inputs(), recorded with TensorFlow 2.14
+KERAS_ML = [[0.3848515450954437, 0.6151484251022339], [0.46183741092681885, 0.5381626486778259],
+            [0.22404642403125763, 0.7759535312652588]]
+KERAS_UO = [[0.4331885576248169, 0.5605131387710571, 0.006298290565609932],
+            [0.45331960916519165, 0.5431193113327026, 0.0035611360799521208],
+            [0.35047799348831177, 0.6442211270332336, 0.005300896242260933]]
+
+
+def keras_inputs(n_features):
+    return normalize((np.arange(3 * n_features).reshape(3, n_features) % 17 + 1).astype(float), axis=1)
+
+
+class TestNNWeights(unittest.TestCase):
+
+    def test_matches_keras(self):
+        for path, n_features, expected in ((NN_ML_MODEL, 106, KERAS_ML), (NN_UO_MODEL, 107, KERAS_UO)):
+            NN_Runner.get_forward.cache_clear()
+            np.testing.assert_allclose(NN_Runner.predict(path, keras_inputs(n_features)), expected, atol=1e-6)
+        self.assertNotIn('tensorflow', sys.modules)
+
+    def test_forward(self):
+        layers = [(np.array([[1.0, -1.0], [2.0, 10.0]], dtype=np.float32), np.array([0.5, 0.0], dtype=np.float32), 'relu6'),
+                  (np.eye(2, dtype=np.float32), np.zeros(2, dtype=np.float32), 'softmax')]
+        hidden = np.clip(np.array([[1.0, 1.0]]) @ layers[0][0] + layers[0][1], 0, 6)  # [3.5, 6]
+        expected = np.exp(hidden) / np.exp(hidden).sum()
+        np.testing.assert_allclose(NN_Weights.forward(layers, [[1.0, 1.0]]), expected, rtol=1e-6)
+
+    def test_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'model.npz')
+            np.savez(path, activations=np.array(['relu', 'softmax']), kernel_0=np.ones((3, 4)), bias_0=np.zeros(4),
+                     kernel_1=np.ones((4, 2)), bias_1=np.zeros(2))
+            layers = NN_Weights.load_weights(path)
+            self.assertEqual([(kernel.shape, activation) for kernel, bias, activation in layers],
+                             [((3, 4), 'relu'), ((4, 2), 'softmax')])
+            np.testing.assert_allclose(NN_Weights.forward(layers, np.ones((5, 3))), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
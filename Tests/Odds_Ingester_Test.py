@@ -0,0 +1,91 @@
+import sqlite3
+import unittest
+from datetime import date
+
+import pandas as pd
+
+from src.Utils.backfill import TokenBucket
+from src.Utils.odds_ingester import ingest_season, read_watermark
+
+SLATES = {
+    date(2023, 10, 24): [('Boston Celtics', 'New York Knicks')],
+    date(2023, 10, 25): [('Miami Heat', 'Detroit Pistons')],
+    date(2023, 10, 27): [('New York Knicks', 'Miami Heat'), ('Utah Jazz', 'Boston Celtics')],
+}
+
+
+def game(home, away):
+    return {'home_team': home, 'away_team': away, 'total': {'fanduel': 220.5}, 'away_spread': {'fanduel': 3.5},
+            'home_ml': {'fanduel': -150}, 'away_ml': {'fanduel': 130}, 'home_score': 110, 'away_score': 100}
+
+
+class TestOddsIngester(unittest.TestCase):
+
+    def setUp(self):
+        self.con = sqlite3.connect(':memory:')
+        self.fetched = []
+
+    def tearDown(self):
+        self.con.close()
+
+    def fetch_games(self, day):
+        self.fetched.append(day)
+        return [game(home, away) for home, away in SLATES.get(day, [])]
+
+    def ingest(self, season, today):
+        return ingest_season(self.con, season, date(2023, 10, 24), date(2024, 4, 28), fetch_games=self.fetch_games,
+                             workers=2, limiter=TokenBucket(1000, capacity=1000), today=today)
+
+    def table(self, season):
+        return pd.read_sql_query(f'select * from "{season}"', self.con, index_col="index")
+
+    def test_daily_run_fetches_only_yesterday(self):
+        self.assertEqual(self.ingest('2023-24', today=date(2023, 10, 27)), 2)
+        self.assertEqual(read_watermark(self.con, '2023-24'), date(2023, 10, 26))
+
+        self.fetched.clear()
+        self.assertEqual(self.ingest('2023-24', today=date(2023, 10, 28)), 2)
+        self.assertEqual(self.fetched, [date(2023, 10, 27)])
+        self.assertEqual(self.ingest('2023-24', today=date(2023, 10, 28)), 0)
+
+        table = self.table('2023-24')
+        self.assertEqual(table.index.tolist(), [0, 1, 2, 3])
+        self.assertEqual(table['Days_Rest_Home'].tolist(), [7, 7, 3, 7])  # the Knicks last played on the 24th
+        self.assertEqual(table['Days_Rest_Away'].tolist(), [7, 7, 2, 3])
+
+    def test_seasons_do_not_accumulate(self):
+        self.ingest('2022-23', today=date(2023, 10, 26))
+        self.ingest('2023-24', today=date(2023, 10, 28))
+        self.assertEqual(len(self.table('2022-23')), 2)
+        self.assertEqual(len(self.table('2023-24')), 4)
+
+    def test_games_without_odds_still_count_for_rest(self):
+        def fetch_games(day):
+            games = self.fetch_games(day)
+            for g in games:
+                if day == date(2023, 10, 24):
+                    del g['total']
+            return games
+
+        ingest_season(self.con, '2023-24', date(2023, 10, 24), date(2024, 4, 28), fetch_games=fetch_games,
+                      workers=1, limiter=TokenBucket(1000, capacity=1000), today=date(2023, 10, 28))
+        table = self.table('2023-24')
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table['Days_Rest_Home'].tolist(), [7, 3, 7])
+
+    def test_failed_day_keeps_committed_batches(self):
+        def fetch_games(day):
+            if day == date(2023, 10, 27):
+                raise ConnectionError("scoreboard down")
+            return self.fetch_games(day)
+
+        with self.assertRaises(ConnectionError):
+            ingest_season(self.con, '2023-24', date(2023, 10, 24), date(2024, 4, 28), fetch_games=fetch_games,
+                          workers=2, limiter=TokenBucket(1000, capacity=1000), today=date(2023, 10, 29), batch_days=2)
+        self.assertEqual(read_watermark(self.con, '2023-24'), date(2023, 10, 25))
+        self.assertEqual(len(self.table('2023-24')), 2)
+
+        self.fetched.clear()
+        self.assertEqual(self.ingest('2023-24', today=date(2023, 10, 29)), 2)
+        self.assertEqual(self.fetched, [date(2023, 10, 26), date(2023, 10, 27), date(2023, 10, 28)])
+        self.assertEqual(self.table('2023-24')['Days_Rest_Home'].tolist(), [7, 7, 3, 7])
@@ -0,0 +1,113 @@
+import contextlib
+import io
+import json
+import sys
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.Predict.Results import build_ensemble, build_results, build_xgb_dict, render_ensemble
+from src.Utils import Kelly_Criterion as kc
+from src.Utils.darko_analyzer import build_dark_table
+from src.Utils.output_sinks import CsvSink, JsonLinesSink, ParquetSink, TerminalSink, make_sink
+
+
+def sample_results():
+    games = [['Boston Celtics', 'New York Knicks'], ['Miami Heat', 'Utah Jazz']]
+    return build_results('xgb', games, [220.5, 210], [-150, None], [130, None],
+                         [[.4, .6], [.7, .3]], [[.3, .7, 0], [.6, .4, 0]])
+
+
+class TestResults(unittest.TestCase):
+
+    def test_build_results_columns(self):
+        results = sample_results()
+        self.assertEqual(results['winner_side'].tolist(), ['home', 'away'])
+        self.assertEqual(results['ou_pick'].tolist(), ['over', 'under'])
+        self.assertEqual(results['ev_home'].tolist(), [0.0, 0.0])
+        self.assertEqual(results['ev_away'].tolist(), [-8.0, 0.0])
+        self.assertEqual(results['kelly_home'].tolist(), [kc.calculate_kelly_criterion(-150, .6), 0.0])
+
+    def test_build_xgb_dict(self):
+        xgb_dict = build_xgb_dict(sample_results())
+        self.assertEqual(xgb_dict[('Miami Heat', 'Utah Jazz')]['winner_side'], 'away')
+        self.assertAlmostEqual(xgb_dict[('Boston Celtics', 'New York Knicks')]['home_prob'], .6)
+
+    def test_dark_table_moneylines_stay_integers(self):
+        odds = {'Boston Celtics:New York Knicks': {'under_over_odds': 220.5, 'Boston Celtics': {'money_line_odds': -150},
+                                                   'New York Knicks': {'money_line_odds': 130}}}
+        table = build_dark_table([('Boston Celtics', 'New York Knicks'), ('Miami Heat', 'Utah Jazz')],
+                                 build_xgb_dict(sample_results()), {}, {}, odds_data=odds)
+        self.assertEqual(str(table['home_ml'].dtype), 'Int64')
+        self.assertEqual(f"{table['home_ml'].iloc[0]:>4}", '-150')
+        self.assertTrue(pd.isna(table['away_ml'].iloc[1]))
+        self.assertTrue(pd.isna(table['kelly_home'].iloc[1]))
+
+    def test_build_ensemble(self):
+        games = [['Boston Celtics', 'New York Knicks'], ['Miami Heat', 'Utah Jazz']]
+        per_model = {'a': [[.4, .6], [.7, .3]], 'b': [[.2, .8], [.5, .5]]}
+        table = build_ensemble(games, per_model, [[.3, .7], [.6, .4]])
+        self.assertEqual(table['model'].tolist(), ['a', 'b', 'blend'] * 2)
+        self.assertEqual(table['home_team'].tolist(), ['Boston Celtics'] * 3 + ['Miami Heat'] * 3)
+        self.assertEqual(table['home_prob'].tolist(), [.6, .8, .7, .3, .5, .4])
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            render_ensemble(table)
+        self.assertIn('Miami Heat vs Utah Jazz home win => a: 30.0%, b: 50.0% | ', out.getvalue())
+
+
+class TestOutputSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_csv_appends_with_one_header(self):
+        sink = CsvSink(self.directory.name)
+        sink.write('predictions', sample_results())
+        sink.write('predictions', sample_results())
+        table = pd.read_csv(os.path.join(self.directory.name, 'predictions.csv'))
+        self.assertEqual(len(table), 4)
+
+    def test_jsonl_writes_one_object_per_row(self):
+        JsonLinesSink(self.directory.name).write('predictions', sample_results())
+        with open(os.path.join(self.directory.name, 'predictions.jsonl')) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual([row['home_team'] for row in rows], ['Boston Celtics', 'Miami Heat'])
+
+    def test_parquet_keeps_each_models_table(self):
+        sink = ParquetSink(self.directory.name)
+        sink.write('predictions', sample_results())
+        sink.write('predictions', sample_results().assign(model='nn'))
+        tables = [pd.read_parquet(os.path.join(self.directory.name, name))
+                  for name in sorted(os.listdir(self.directory.name))]
+        self.assertEqual([table['model'].tolist() for table in tables], [['nn', 'nn'], ['xgb', 'xgb']])
+
+    def test_parquet_names_mixed_model_tables_once(self):
+        ParquetSink(self.directory.name).write('ensemble', pd.DataFrame({'model': ['a', 'blend'], 'home_prob': [.6, .7]}))
+        self.assertEqual([name.split('_')[0] for name in os.listdir(self.directory.name)], ['ensemble'])
+        self.assertEqual(len(os.listdir(self.directory.name)[0]), len('ensemble_YYYYMMDD.parquet'))
+
+    def test_terminal_dispatches_on_table_name(self):
+        seen = []
+        sink = make_sink('terminal', {'predictions': lambda table, kelly_criterion: seen.append((len(table), kelly_criterion))},
+                         kelly_criterion=True)
+        self.assertIsInstance(sink, TerminalSink)
+        sink.write('predictions', sample_results())
+        self.assertEqual(seen, [(2, True)])
+
+    def test_terminal_wraps_stdout_only_while_rendering(self):
+        out, seen = io.StringIO(), []
+        sink = make_sink('terminal', {'predictions': lambda table: seen.append(sys.stdout)})
+        with contextlib.redirect_stdout(out):
+            sink.write('predictions', sample_results())
+            self.assertIsNot(seen[0], out)  # colorama's wrapper
+            self.assertIs(sys.stdout, out)
+
+    def test_unknown_output_is_rejected(self):
+        with self.assertRaises(ValueError):
+            make_sink('xml:logs', {})
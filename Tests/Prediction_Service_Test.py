@@ -0,0 +1,66 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.Predict import Prediction_Service
+
+STATS = pd.DataFrame({'TEAM_ID': [1610612738, 1610612752], 'TEAM_NAME': ['Boston Celtics', 'New York Knicks'],
+                      'PTS': [118.0, 112.0]})
+GAME = {'home_team': 'Boston Celtics', 'away_team': 'New York Knicks', 'ou': 221.5, 'home_odds': -150,
+        'away_odds': 130}
+
+
+def build_games(games, df, odds):
+    """ main.createTodaysGames' return shape: one feature row per game, O/U lines and both sides' moneylines. """
+    frame_ml = pd.DataFrame({'PTS': df['PTS'].iloc[0], 'PTS.1': df['PTS'].iloc[1]}, index=range(len(games)))
+    return (None, [odds[f'{home}:{away}']['under_over_odds'] for home, away in games], frame_ml,
+            [odds[f'{home}:{away}'][home]['money_line_odds'] for home, away in games],
+            [odds[f'{home}:{away}'][away]['money_line_odds'] for home, away in games])
+
+
+def constant_predict(data_uo):
+    rows = len(data_uo)
+    return np.tile([.4, .6], (rows, 1)), np.tile([.3, .7, 0], (rows, 1))
+
+
+class TestPredictionService(unittest.TestCase):
+
+    def setUp(self):
+        models = {'const': (constant_predict, lambda: None)}
+        with mock.patch.dict(Prediction_Service.MODELS, models):
+            self.app = Prediction_Service.create_app('unused', build_games, models=['const'])
+        self.client = self.app.test_client()
+        self.stats = mock.patch.object(Prediction_Service.TeamStatsCache, 'get', return_value=STATS)
+        self.stats.start()
+
+    def tearDown(self):
+        self.stats.stop()
+
+    def test_valid_slate(self):
+        response = self.client.post('/predict', json={'games': [GAME, GAME]})
+        self.assertEqual(response.status_code, 200)
+        rows = response.get_json()['const']
+        self.assertEqual([row['winner_side'] for row in rows], ['home', 'home'])
+        self.assertEqual([row['ou_pick'] for row in rows], ['over', 'over'])
+        self.assertEqual(rows[0]['home_odds'], -150)
+
+    def test_malformed_payloads_are_rejected(self):
+        no_away_odds = {field: value for field, value in GAME.items() if field != 'away_odds'}
+        for payload in ([GAME], {'games': []}, {'games': [{**GAME, 'ou': None}]}, {'games': [no_away_odds]},
+                        {'games': [{**GAME, 'home_odds': '-150'}]}, {'games': [{**GAME, 'home_team': 'Nowhere'}]},
+                        {'games': [GAME], 'models': ['xgb']}):
+            with self.subTest(payload=payload):
+                response = self.client.post('/predict', json=payload)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.get_json())
+
+    def test_missing_stats_are_unavailable(self):
+        with mock.patch.object(Prediction_Service.TeamStatsCache, 'get', return_value=pd.DataFrame()):
+            response = self.client.post('/predict', json={'games': [GAME]})
+        self.assertEqual(response.status_code, 503)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.Utils.rest_days import rest_days
+
+
+def per_row_rest_days(dates, home, away):
+    """ The Add_Days_Rest.py loop this replaces. """
+    teams_last_played = {}
+    home_rest, away_rest = [], []
+    for current_date, home_team, away_team in zip(dates, home, away):
+        for team, rest in ((home_team, home_rest), (away_team, away_rest)):
+            if team not in teams_last_played:
+                rest.append(10)
+            else:
+                days = (current_date - teams_last_played[team]).days
+                rest.append(days if 0 < days < 9 else 9)
+            teams_last_played[team] = current_date
+    return home_rest, away_rest
+
+
+class TestRestDays(unittest.TestCase):
+
+    def test_matches_per_row_loop(self):
+        rng = np.random.default_rng(0)
+        teams = [f"Team {i}" for i in range(12)]
+        dates, home, away = [], [], []
+        day = datetime(2022, 10, 18)
+        for _ in range(400):
+            day += timedelta(days=int(rng.choice([0, 0, 1, 1, 2, 12, -1])))  # includes out-of-order rows
+            pair = rng.choice(len(teams), 2, replace=False)
+            dates.append(day)
+            home.append(teams[pair[0]])
+            away.append(teams[pair[1]])
+
+        expected_home, expected_away = per_row_rest_days(dates, home, away)
+        home_rest, away_rest = rest_days(dates, home, away)
+        self.assertEqual(home_rest.tolist(), expected_home)
+        self.assertEqual(away_rest.tolist(), expected_away)
+
+    def test_first_game_and_cap(self):
+        home_rest, away_rest = rest_days(['2023-01-01', '2023-01-03', '2023-01-20'], ['A', 'B', 'A'], ['B', 'A', 'B'])
+        self.assertEqual(home_rest.tolist(), [10, 2, 9])
+        self.assertEqual(away_rest.tolist(), [10, 2, 9])
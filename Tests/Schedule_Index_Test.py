@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.Utils.schedule_index import ScheduleIndex, SCHEDULE_CSV
+
+
+def rest_days_by_scan(schedule_df, team, when):
+    """The per-game filter/sort createTodaysGames used before the index."""
+    games = schedule_df[(schedule_df['Home Team'] == team) | (schedule_df['Away Team'] == team)]
+    previous = games.loc[schedule_df['Date'] <= when].sort_values('Date', ascending=False).head(1)['Date']
+    if len(previous) > 0:
+        return (timedelta(days=1) + when - previous.iloc[0]).days
+    return 7
+
+
+class TestScheduleIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schedule_df = pd.read_csv(SCHEDULE_CSV, parse_dates=['Date'], date_format='%d/%m/%Y %H:%M')
+        cls.index = ScheduleIndex(cls.schedule_df)
+
+    def test_rest_days_match_scan(self):
+        for when in [datetime(2024, 10, 20), datetime(2024, 11, 2, 12), datetime(2025, 1, 28, 3, 15), datetime(2025, 4, 20)]:
+            for team in ['Boston Celtics', 'LA Clippers', 'Utah Jazz', 'Los Angeles Lakers']:
+                self.assertEqual(self.index.rest_days(team, when), rest_days_by_scan(self.schedule_df, team, when))
+
+    def test_unknown_team_gets_default_rest(self):
+        self.assertEqual(self.index.rest_days('Seattle SuperSonics', datetime(2025, 1, 1)), 7)
+
+    def test_games_in_last(self):
+        team = 'Boston Celtics'
+        first, second = self.index.game_dates[team][:2]
+        when = pd.Timestamp(second).to_pydatetime()
+        self.assertEqual(self.index.games_in_last(team, when, 365), 2)
+        self.assertEqual(self.index.games_in_last(team, when, 0), 0)
+
+    def test_back_to_back_on_known_dates(self):
+        # the Celtics played 2024-11-01 23:00 and 2024-11-02 22:00 UTC, then 2024-11-17 01:00 and 2024-11-20 00:00
+        team = 'Boston Celtics'
+        self.assertTrue(self.index.is_back_to_back(team, datetime(2024, 11, 2, 12)))
+        self.assertFalse(self.index.is_back_to_back(team, datetime(2024, 10, 24, 12)))  # last played 10-22
+        self.assertFalse(self.index.is_back_to_back(team, datetime(2024, 11, 19, 20)))
+        self.assertEqual(self.index.rest_days(team, datetime(2024, 11, 19, 20)), 3)
@@ -0,0 +1,76 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.Utils import storage
+
+
+class TestConnect(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.sqlite')
+
+    def tearDown(self):
+        storage.connect(self.path).close()
+        self.directory.cleanup()
+
+    def test_pragmas(self):
+        con = storage.connect(self.path)
+        self.assertEqual(con.execute('pragma journal_mode').fetchone()[0], 'wal')
+        self.assertEqual(con.execute('pragma synchronous').fetchone()[0], 1)  # NORMAL
+        self.assertEqual(con.execute('pragma cache_size').fetchone()[0], storage.PRAGMAS['cache_size'])
+
+    def test_shared_per_thread_and_reopened_after_close(self):
+        con = storage.connect(self.path)
+        self.assertIs(storage.connect(os.path.join(self.directory.name, '.', 'test.sqlite')), con)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(storage.connect(self.path)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], con)
+
+        con.close()
+        reopened = storage.connect(self.path)
+        self.assertIsNot(reopened, con)
+        self.assertEqual(reopened.execute('select 1').fetchone()[0], 1)
+
+
+class TestBulkWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.con = sqlite3.connect(':memory:')
+
+    def tearDown(self):
+        self.con.close()
+
+    def test_insert_rows_in_chunks(self):
+        self.con.execute('create table t (a INTEGER, b TEXT)')
+        rows = [(i, str(i)) for i in range(25)]
+        with mock.patch.object(storage, 'MAX_VARIABLES', 6), self.con:  # three rows per statement
+            storage.insert_rows(self.con, 't', ['a', 'b'], iter(rows))
+        self.assertEqual(self.con.execute('select a, b from t order by a').fetchall(), rows)
+
+    def test_write_frame_matches_to_sql(self):
+        frame = pd.DataFrame({'Date': ['2023-10-24', '2023-10-25', None], 'GP': [1, 2, 3], 'PTS': [110.5, np.nan, 99.0]},
+                             index=[5, 6, 7])
+        frame.to_sql('expected', self.con)
+        storage.write_frame(self.con, 'actual', frame)
+        storage.write_frame(self.con, 'actual', frame)  # replaced, not appended
+
+        expected = pd.read_sql_query('select * from expected', self.con, index_col='index')
+        actual = pd.read_sql_query('select * from actual', self.con, index_col='index')
+        pd.testing.assert_frame_equal(actual, expected)
+        self.assertEqual([row[2] for row in self.con.execute('pragma table_info(actual)')],
+                         [row[2] for row in self.con.execute('pragma table_info(expected)')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import math
+import sqlite3
+import unittest
+
+from src.Utils.sweep import TrialStore, budgets, sample_configs, successive_halving
+
+SPACE = {'x': [0, 1, 2, 3, 4, 5, 6, 7, 8], 'y': [0, 1, 2]}
+
+
+def quadratic(config, budget):
+    # more budget brings every config closer to its true loss; x = 5, y = 1 is best
+    return (config['x'] - 5) ** 2 + (config['y'] - 1) ** 2 + 10 / budget
+
+
+def diverging(config, budget):
+    return float('nan')
+
+
+def unreachable(config, budget):
+    raise AssertionError("finished trials are not rerun")
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.con = sqlite3.connect(':memory:')
+        self.store = TrialStore(self.con)
+
+    def tearDown(self):
+        self.con.close()
+
+    def test_budgets(self):
+        self.assertEqual(budgets(28, 750), [28, 84, 252, 750])
+        self.assertEqual(budgets(1, 9), [1, 3, 9])
+
+    def test_sample_configs(self):
+        self.assertEqual(len(sample_configs(SPACE, 100)), 27)
+        configs = sample_configs(SPACE, 10, seed=1)
+        self.assertEqual(len({tuple(sorted(config.items())) for config in configs}), 10)
+        self.assertEqual(configs, sample_configs(SPACE, 10, seed=1))
+
+    def test_halving_finds_best_and_resumes(self):
+        best, loss = successive_halving('toy', SPACE, quadratic, 27, 1, 9, store=self.store, workers=2)
+        self.assertEqual(best, {'x': 5, 'y': 1})
+        self.assertAlmostEqual(loss, 10 / 9)
+        trials = self.store.results('toy')
+        self.assertEqual([budget for config, budget, loss in trials].count(1), 27)
+        self.assertEqual([budget for config, budget, loss in trials].count(3), 9)
+        self.assertEqual([budget for config, budget, loss in trials].count(9), 3)  # 39 trials instead of 81
+
+        self.assertEqual(successive_halving('toy', SPACE, unreachable, 27, 1, 9, store=self.store, workers=2),
+                         (best, loss))
+        self.assertEqual(self.store.best('toy'), best)
+
+    def test_nan_losses_rank_last(self):
+        best, loss = successive_halving('nan', {'x': [0, 1, 2]}, diverging, 3, 1, 3, store=self.store, workers=1)
+        self.assertEqual(loss, math.inf)
+        self.assertEqual(successive_halving('nan', {'x': [0, 1, 2]}, unreachable, 3, 1, 3, store=self.store,
+                                            workers=1), (best, math.inf))  # resumed from NULL losses
+
+    def test_no_trials(self):
+        with self.assertRaises(ValueError):
+            self.store.best('missing')
+
+
+if __name__ == '__main__':
+    unittest.main()
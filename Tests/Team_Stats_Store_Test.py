@@ -0,0 +1,62 @@
+import sqlite3
+import unittest
+
+import pandas as pd
+
+from src.Utils.team_stats_store import TeamStatsStore, legacy_date_tables, migrate_date_tables
+
+
+def snapshot(gp):
+    return pd.DataFrame({
+        'TEAM_ID': [1610612738, 1610612752, 1610612737],
+        'TEAM_NAME': ['Boston Celtics', 'New York Knicks', 'Atlanta Hawks'],
+        'GP': [gp, gp, gp - 1],
+        'W_PCT': [0.75, 0.5, None],
+    })
+
+
+class TestTeamStatsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.con = sqlite3.connect(':memory:')
+        self.store = TeamStatsStore(self.con)
+
+    def tearDown(self):
+        self.con.close()
+
+    def legacy_table(self, date, df):
+        df.assign(Date=date).to_sql(date, self.con, if_exists="replace")
+
+    def test_migration_matches_per_date_tables(self):
+        for date, gp in [('2023-10-26', 1), ('2023-10-27', 2)]:
+            self.legacy_table(date, snapshot(gp))
+        expected = {date: pd.read_sql_query(f'select * from "{date}"', self.con, index_col="index")
+                    for date in legacy_date_tables(self.con)}
+
+        self.assertEqual(migrate_date_tables(self.con), 2)
+        self.assertEqual(legacy_date_tables(self.con), [])
+        self.assertEqual(self.store.dates(), ['2023-10-26', '2023-10-27'])
+        for date, table in expected.items():
+            pd.testing.assert_frame_equal(self.store.read_date(date), table)
+
+    def test_write_snapshot_replaces_the_day(self):
+        self.store.write_snapshot('2023-10-26', snapshot(1))
+        self.store.write_snapshot('2023-10-26', snapshot(1).iloc[:2])
+        self.assertEqual(self.store.read_date('2023-10-26')['TEAM_NAME'].tolist(), ['Boston Celtics', 'New York Knicks'])
+
+    def test_fetched_dates_include_empty_days(self):
+        self.store.write_snapshots([('2023-10-26', snapshot(1)), ('2023-10-27', pd.DataFrame())])
+        self.assertEqual(self.store.dates(), ['2023-10-26'])
+        self.assertEqual(self.store.fetched_dates(), {'2023-10-26', '2023-10-27'})
+
+    def test_read_range_across_dates_and_teams(self):
+        for day, gp in [(26, 1), (27, 2), (28, 3)]:
+            self.store.write_snapshot(f'2023-10-{day}', snapshot(gp))
+        rows = self.store.read_range('2023-10-27', '2023-10-28', team_ids=[1610612737])
+        self.assertEqual(rows['Date'].tolist(), ['2023-10-27', '2023-10-28'])
+        self.assertEqual(rows['GP'].tolist(), [1, 2])
+        self.assertEqual(len(self.store.read_range(start='2023-10-27')), 6)
+
+    def test_empty_store(self):
+        self.assertEqual(self.store.dates(), [])
+        self.assertEqual(len(self.store.read_date('2023-10-26')), 0)
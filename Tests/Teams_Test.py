@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.Utils import Dictionaries
+from src.Utils.teams import UNKNOWN, canonical_names, snapshot_rows, team_ids, team_names
+from src.Utils.tools import build_darko_sums
+
+SEASON_DICTS = {
+    '2007-08': Dictionaries.team_index_07,
+    '2010-11': Dictionaries.team_index_08,
+    '2012-13': Dictionaries.team_index_12,
+    '2013-14': Dictionaries.team_index_13,
+    '2017-18': Dictionaries.team_index_14,
+    '2023-24': Dictionaries.team_index_current,
+}
+
+
+class TestTeams(unittest.TestCase):
+
+    def test_every_name_form_resolves_to_one_id(self):
+        ids = team_ids(['LA Clippers', 'Los Angeles Clippers', 'LAClippers', 'lac', ' la clippers '])
+        self.assertEqual(len(set(ids.tolist())), 1)
+        self.assertNotEqual(ids[0], UNKNOWN)
+        self.assertEqual(team_ids(['Seattle SuperSonics'])[0], team_ids(['Oklahoma City Thunder'])[0])
+        self.assertEqual(team_ids(['Springfield Isotopes']).tolist(), [UNKNOWN])
+
+    def test_snapshot_rows_match_the_season_dicts(self):
+        for season, team_index in SEASON_DICTS.items():
+            rows = snapshot_rows(season, team_ids(list(team_index)))
+            self.assertEqual(rows.tolist(), list(team_index.values()), season)
+
+    def test_names(self):
+        self.assertEqual(canonical_names(['Los Angeles Clippers', 'Charlotte Bobcats', 'Nowhere']).tolist(),
+                         ['LA Clippers', 'Charlotte Hornets', 'Nowhere'])
+        self.assertEqual(team_names([1610612738, 1]).tolist(), ['Boston Celtics', None])
+
+    def test_darko_sums_join_on_franchise(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'daily.csv')
+            pd.DataFrame({'SearchTeam': ['Los Angeles Clippers', 'LA Clippers', 'Boston Celtics', 'Nowhere'],
+                          'PTS': [20.0, 10.5, 30.0, 99.0]}).to_csv(path, index=False)
+            sums = build_darko_sums(path, [('LA Clippers', 'Boston Celtics'), ('Miami Heat', 'Utah Jazz')])
+        self.assertEqual(sums, {('LA Clippers', 'Boston Celtics'): (30.5, 30.0), ('Miami Heat', 'Utah Jazz'): (0.0, 0.0)})
@@ -0,0 +1,43 @@
+import threading
+import unittest
+from datetime import datetime
+
+import pandas as pd
+
+from src.Utils.tools import fetch_concurrently, get_date, normalize_sbr_dates
+
+
+class TestFetchConcurrently(unittest.TestCase):
+
+    def test_fetches_run_at_the_same_time(self):
+        barrier = threading.Barrier(3, timeout=2)
+        results, errors = fetch_concurrently({name: (lambda n=name: (barrier.wait(), n)[1]) for name in ['odds', 'games', 'stats']})
+        self.assertEqual(results, {'odds': 'odds', 'games': 'games', 'stats': 'stats'})
+        self.assertEqual(errors, {})
+
+    def test_failures_are_collected(self):
+        def fail():
+            raise ConnectionError("stats.nba.com timed out")
+
+        results, errors = fetch_concurrently({'odds': lambda: {'a:b': {}}, 'stats': fail})
+        self.assertEqual(results, {'odds': {'a:b': {}}})
+        self.assertIsInstance(errors['stats'], ConnectionError)
+
+
+class TestNormalizeSbrDates(unittest.TestCase):
+
+    def test_season_rollover(self):
+        dates = normalize_sbr_dates(pd.Series(['2019-20-1022', '2019-20-1231', '2019-20-0101', '2019-20-0730', '2019-20-1011'],
+                                              index=[3, 4, 5, 6, 7]))
+        self.assertEqual(dates.index.tolist(), [3, 4, 5, 6, 7])
+        self.assertEqual(dates.dt.strftime('%Y-%m-%d').tolist(),
+                         ['2019-10-22', '2019-12-31', '2020-01-01', '2020-07-30', '2020-10-11'])
+
+    def test_iso_dates_pass_through_and_garbage_is_nat(self):
+        dates = normalize_sbr_dates(['2023-10-24', 'garbage'])
+        self.assertEqual(dates[0], pd.Timestamp('2023-10-24'))
+        self.assertTrue(pd.isna(dates[1]))
+
+    def test_get_date(self):
+        self.assertEqual(get_date('2022-23-0105'), datetime(2023, 1, 5))
+        self.assertEqual(get_date('2022-23-1105'), datetime(2022, 11, 5))
@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.Utils.feature_store import FeatureStore
+from src.Utils.walk_forward import FoldCache, evaluate, fold_metrics
+
+SEASONS = {f'{year}-{str(year + 1)[2:]}': {'start_date': f'{year}-10-01', 'end_date': f'{year + 1}-6-30'}
+           for year in range(2019, 2023)}
+
+
+def dataset():
+    rng = np.random.default_rng(0)
+    dates = [f'{year}-11-0{day}' for year in range(2019, 2023) for day in range(1, 6)]
+    n = len(dates)
+    return pd.DataFrame({
+        'TEAM_NAME': 'Boston Celtics', 'GP': rng.integers(1, 82, n).astype(float), 'Date': dates,
+        'TEAM_NAME.1': 'Miami Heat', 'GP.1': rng.integers(1, 82, n).astype(float), 'Date.1': dates,
+        'Score': rng.integers(190, 250, n).astype(float), 'Home-Team-Win': rng.integers(0, 2, n).astype(float),
+        'OU': 220.5, 'OU-Cover': rng.integers(0, 3, n).astype(float),
+    })
+
+
+class TestFoldMetrics(unittest.TestCase):
+
+    def test_roi_and_pushes(self):
+        probabilities = np.array([[0.2, 0.7, 0.1], [0.6, 0.3, 0.1], [0.1, 0.8, 0.1], [0.1, 0.1, 0.8]])
+        y = np.array([1, 1, 2, 2])
+        odds = np.tile([-110.0, -110.0, np.nan], (4, 1))
+        metrics = fold_metrics(probabilities, y, odds, push_class=2)
+        self.assertEqual(metrics['Bets'], 3)  # no bet when the push is the pick
+        self.assertAlmostEqual(metrics['ROI'], (100 / 110 - 1 + 0) / 3)  # a win, a loss, a refunded push
+        self.assertAlmostEqual(metrics['Accuracy'], 0.5)
+        self.assertAlmostEqual(metrics['Log-Loss'], -np.mean(np.log([0.7, 0.3, 0.1, 0.8])))
+
+    def test_moneyline_payouts(self):
+        metrics = fold_metrics([[0.4, 0.6], [0.7, 0.3]], [1, 0], np.array([[-150.0, 130.0], [200.0, -250.0]]))
+        self.assertAlmostEqual(metrics['ROI'], (1.3 + 2.0) / 2)
+
+
+class TestFoldCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = FeatureStore(os.path.join(self.directory.name, 'features'))
+        self.data = dataset()
+        self.store.write(self.data, SEASONS)
+        odds_db = os.path.join(self.directory.name, 'odds.sqlite')
+        con = sqlite3.connect(odds_db)
+        odds = pd.DataFrame({'Date': self.data['Date'], 'Home': 'Boston', 'Away': 'Miami',
+                             'ML_Home': -150.0, 'ML_Away': 130.0})
+        odds[odds['Date'] >= '2022-01-01'].to_sql('odds_2022-23_new', con)
+        con.close()
+        self.cache = FoldCache(self.store, os.path.join(self.directory.name, 'folds'), odds_db)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_folds_walk_forward_by_season(self):
+        folds = list(self.cache.folds('ML', min_train_seasons=2))
+        self.assertEqual([fold.season for fold in folds], ['2021-22', '2022-23'])
+        self.assertEqual([(len(fold.y_train), len(fold.y_test)) for fold in folds], [(10, 5), (15, 5)])
+        x, y = self.store.xy('ML')
+        np.testing.assert_array_equal(folds[1].x_test, x[15:])
+        np.testing.assert_array_equal(folds[1].y_train, y[:15])
+        self.assertIsInstance(folds[1].x_train, np.memmap)
+        self.assertTrue(np.isnan(folds[0].odds_test).all())  # no odds table for 2021-22
+        np.testing.assert_array_equal(folds[1].odds_test, np.tile([130.0, -150.0], (5, 1)))
+
+    def test_cache_is_reused_until_the_store_changes(self):
+        list(self.cache.folds('UO'))
+        with mock.patch.object(FoldCache, 'build', side_effect=AssertionError("rebuilt")):
+            list(self.cache.folds('UO'))
+        self.store.write(self.data[self.data['Date'] < '2022-11-04'], SEASONS)
+        self.assertEqual(len(list(self.cache.folds('UO'))[-1].y_test), 3)
+
+    def test_evaluate(self):
+        def always_home(x_train, y_train, x_test):
+            return np.tile([0.2, 0.8], (len(x_test), 1))
+        results = evaluate(always_home, 'ML', self.cache, min_train_seasons=3)
+        self.assertEqual(results['Season'].tolist(), ['2022-23'])
+        expected = self.data['Home-Team-Win'].to_numpy()[15:]
+        self.assertAlmostEqual(results['Accuracy'][0], expected.mean())
+        self.assertAlmostEqual(results['ROI'][0], np.mean(np.where(expected == 1, 100 / 150, -1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import xgboost as xgb
+
+from src.Utils.xgb_training import init_worker, save_model, split_indices, train_seed, train_seeds, validation_loss
+
+PARAMS = {'max_depth': 2, 'eta': 0.3, 'objective': 'multi:softprob', 'num_class': 2}
+
+
+def dataset(n=600):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(n, 4)).astype(np.float32)
+    y = (x[:, 0] + 0.3 * rng.normal(size=n) > 0).astype(int)
+    return x, y
+
+
+class TestXGBTraining(unittest.TestCase):
+
+    def test_split_is_a_partition(self):
+        train, validation, test = split_indices(100, seed=3)
+        self.assertEqual(sorted(np.concatenate([train, validation, test])), list(range(100)))
+        self.assertEqual(len(test), 10)
+        np.testing.assert_array_equal(split_indices(100, seed=3)[2], test)
+
+    def test_stops_early_and_matches_across_processes(self):
+        x, y = dataset()
+        init_worker(x, y, PARAMS, nthread=1)
+        local = train_seed(7, num_rounds=2000, early_stopping_rounds=10)
+        self.assertLess(local.rounds, 2000)
+        self.assertGreater(local.accuracy, 80)
+
+        runs = {run.seed: run for run in train_seeds(x, y, PARAMS, [7, 8, 9], 2000, workers=2,
+                                                      early_stopping_rounds=10)}
+        self.assertEqual(sorted(runs), [7, 8, 9])
+        self.assertEqual((runs[7].accuracy, runs[7].rounds), (local.accuracy, local.rounds))
+
+    def test_validation_loss_improves_with_rounds(self):
+        x, y = dataset()
+        init_worker(x, y, PARAMS, nthread=1)
+        self.assertLess(validation_loss({'eta': 0.1}, 100), validation_loss({'eta': 0.1}, 3))
+
+    def test_save_model_is_loadable(self):
+        x, y = dataset()
+        init_worker(x, y, PARAMS, nthread=1)
+        run = train_seed(1, num_rounds=20)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'XGBoost_50.0%_ML-1.json')
+            save_model(run.model, path)
+            self.assertEqual(os.listdir(directory), ['XGBoost_50.0%_ML-1.json'])
+            booster = xgb.Booster(model_file=path)
+            self.assertEqual(booster.num_boosted_rounds(), run.rounds)
+
+
+if __name__ == '__main__':
+    unittest.main()
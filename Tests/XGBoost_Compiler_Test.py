@@ -0,0 +1,66 @@
+import glob
+import json
+import pathlib
+import unittest
+from unittest import mock
+
+import numpy as np
+import xgboost as xgb
+
+from src.Predict import XGBoost_Compiler
+from src.Predict.XGBoost_Compiler import compile_booster
+
+
+def features(n, n_features, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0, 50, size=(n, n_features))
+    x[rng.random(x.shape) < 0.05] = np.nan
+    return x
+
+
+def train(max_depth, objective='multi:softprob'):
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(2000, 6)).astype(np.float32)
+    x[rng.random(x.shape) < 0.1] = np.nan
+    y = rng.integers(0, 3, 2000)
+    return xgb.train({'objective': objective, 'num_class': 3, 'max_depth': max_depth, 'eta': 0.3},
+                     xgb.DMatrix(x, y), 20), x
+
+
+class TestXGBoostCompiler(unittest.TestCase):
+
+    def test_matches_shipped_boosters(self):
+        for path in glob.glob('Models/XGBoost_Models/*.json'):
+            booster = xgb.Booster(model_file=path)
+            x = features(500, booster.num_features())
+            np.testing.assert_allclose(compile_booster(path).predict(x), booster.inplace_predict(x), atol=1e-6)
+
+    def test_matches_shallow_and_deep_trees(self):
+        for max_depth in (3, XGBoost_Compiler.HEAP_DEPTH + 4):
+            booster, x = train(max_depth)
+            compiled = compile_booster(booster.save_raw('json'))
+            self.assertEqual(compiled.heap is not None, max_depth <= XGBoost_Compiler.HEAP_DEPTH)
+            np.testing.assert_allclose(compiled.predict(x), booster.predict(xgb.DMatrix(x)), atol=1e-6)
+
+    def test_chunks_and_single_rows(self):
+        booster, x = train(4)
+        compiled = compile_booster(json.loads(booster.save_raw('json')))
+        expected = compiled.predict(x)
+        with mock.patch.object(XGBoost_Compiler, 'ROW_CHUNK_ELEMENTS', 7 * len(compiled.roots)):
+            np.testing.assert_array_equal(compiled.predict(x), expected)
+        np.testing.assert_allclose(compiled.predict(x[0]), expected[:1])
+
+    def test_missing_model_file(self):
+        with self.assertRaises(FileNotFoundError):
+            compile_booster('Models/XGBoost_Models/missing.json')
+        with self.assertRaises(FileNotFoundError):
+            compile_booster(pathlib.Path('Models/XGBoost_Models/missing.json'))
+
+    def test_other_objectives_are_rejected(self):
+        booster, x = train(3, objective='multi:softmax')
+        with self.assertRaises(ValueError):
+            compile_booster(booster.save_raw('json'))
+
+
+if __name__ == '__main__':
+    unittest.main()
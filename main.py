@@ -1,23 +1,19 @@
 import argparse
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import pandas as pd
-import tensorflow as tf
 from colorama import Fore, Style
 
 from src.DataProviders.SbrOddsProvider import SbrOddsProvider
-from src.Predict import NN_Runner, XGBoost_Runner
-from src.Utils.Dictionaries import team_index_current
-from src.Utils.tools import create_todays_games_from_odds, get_json_data, to_data_frame, get_todays_games_json, create_todays_games, build_darko_sums, load_skill_data, load_lineup_data
-from src.Utils.darko_scraper import (
-    scrape_daily_player_projections_by_team,
-    scrape_lineup_projections_by_team,
-    scrape_current_player_skill_by_team,
-    scrape_dark_data_for_date
-)
-
+from src.Utils.schedule_index import load_schedule_index
+from src.Utils.teams import UNKNOWN, snapshot_rows, team_ids
+from src.Utils.tools import create_todays_games_from_odds, fetch_concurrently, get_json_data, to_data_frame, get_todays_games_json, create_todays_games, build_darko_sums, load_skill_data, load_lineup_data, normalize
+# Heavy modules (tensorflow, xgboost, selenium) and the models themselves are imported/loaded
+# inside main() only when the matching flag is selected.
 from src.Utils.darko_metrics import load_skill_data, load_lineup_data, load_daily_data, compute_weighted_dpm, compute_off_def_splits, compute_momentum_score, build_team_metrics
-from src.Utils.darko_analyzer import deep_dark_analysis
+from src.Utils.darko_analyzer import build_dark_table, render_dark_table
+from src.Utils.output_sinks import make_sink
+from src.Predict.Results import build_ensemble, build_xgb_dict, render_ensemble, render_predictions
 # Optional advanced
 from src.Utils.simulate_injury import simulate_lineups
 from src.Utils.monte_carlo import simulate_monte_carlo
@@ -33,6 +29,14 @@ data_url = 'https://stats.nba.com/stats/leaguedashteamstats?' \
            'StarterBench=&TeamID=0&TwoWay=0&VsConference=&VsDivision='
 
 
+# terminal renderer per output table; file sinks (-output csv:<dir> etc.) write the tables as they are
+renderers = {
+    'predictions': render_predictions,
+    'ensemble': render_ensemble,
+    'darko': render_dark_table,
+}
+
+
 def createTodaysGames(games, df, odds):
     match_data = []
     todays_games_uo = []
@@ -41,11 +45,15 @@ def createTodaysGames(games, df, odds):
 
     home_team_days_rest = []
     away_team_days_rest = []
+    schedule = load_schedule_index()
+    today = datetime.today()
 
-    for game in games:
+    # each team's row in the league stats frame, resolved for the whole slate at once
+    rows = snapshot_rows(None, team_ids([team for game in games for team in game[:2]])).reshape(-1, 2)
+    for game, (home_row, away_row) in zip(games, rows):
         home_team = game[0]
         away_team = game[1]
-        if home_team not in team_index_current or away_team not in team_index_current:
+        if home_row == UNKNOWN or away_row == UNKNOWN:
             continue
         if odds is not None:
             game_odds = odds[home_team + ':' + away_team]
@@ -61,30 +69,17 @@ def createTodaysGames(games, df, odds):
             away_team_odds.append(input(away_team + ' odds: '))
 
         # calculate days rest for both teams
-        schedule_df = pd.read_csv('Data/nba-2024-UTC.csv', parse_dates=['Date'], date_format='%d/%m/%Y %H:%M')
-        home_games = schedule_df[(schedule_df['Home Team'] == home_team) | (schedule_df['Away Team'] == home_team)]
-        away_games = schedule_df[(schedule_df['Home Team'] == away_team) | (schedule_df['Away Team'] == away_team)]
-        previous_home_games = home_games.loc[schedule_df['Date'] <= datetime.today()].sort_values('Date',ascending=False).head(1)['Date']
-        previous_away_games = away_games.loc[schedule_df['Date'] <= datetime.today()].sort_values('Date',ascending=False).head(1)['Date']
-        if len(previous_home_games) > 0:
-            last_home_date = previous_home_games.iloc[0]
-            home_days_off = timedelta(days=1) + datetime.today() - last_home_date
-        else:
-            home_days_off = timedelta(days=7)
-        if len(previous_away_games) > 0:
-            last_away_date = previous_away_games.iloc[0]
-            away_days_off = timedelta(days=1) + datetime.today() - last_away_date
-        else:
-            away_days_off = timedelta(days=7)
-        # print(f"{away_team} days off: {away_days_off.days} @ {home_team} days off: {home_days_off.days}")
-
-        home_team_days_rest.append(home_days_off.days)
-        away_team_days_rest.append(away_days_off.days)
-        home_team_series = df.iloc[team_index_current.get(home_team)]
-        away_team_series = df.iloc[team_index_current.get(away_team)]
+        home_days_off = schedule.rest_days(home_team, today)
+        away_days_off = schedule.rest_days(away_team, today)
+        # print(f"{away_team} days off: {away_days_off} @ {home_team} days off: {home_days_off}")
+
+        home_team_days_rest.append(home_days_off)
+        away_team_days_rest.append(away_days_off)
+        home_team_series = df.iloc[home_row]
+        away_team_series = df.iloc[away_row]
         stats = pd.concat([home_team_series, away_team_series])
-        stats['Days-Rest-Home'] = home_days_off.days
-        stats['Days-Rest-Away'] = away_days_off.days
+        stats['Days-Rest-Home'] = home_days_off
+        stats['Days-Rest-Away'] = away_days_off
         match_data.append(stats)
 
     games_data_frame = pd.concat(match_data, ignore_index=True, axis=1)
@@ -103,9 +98,24 @@ def main():
     teams_list = []
     xgb_dict = {}
 
+    if args.serve:
+        from src.Predict import Prediction_Service
+        models = ['xgb', 'nn'] if args.A else [name for name in ('xgb', 'nn') if getattr(args, name)] or ['xgb']
+        Prediction_Service.serve(data_url, createTodaysGames, models, host=args.host, port=args.port)
+        return
 
+    # odds / today's games and the team stats don't depend on each other, so fetch them concurrently
+    fetchers = {'stats': lambda: get_json_data(data_url)}
     if args.odds:
-        odds = SbrOddsProvider(sportsbook=args.odds).get_odds()
+        fetchers['odds'] = lambda: SbrOddsProvider(sportsbook=args.odds).get_odds()
+    else:
+        fetchers['games'] = lambda: get_todays_games_json(todays_games_url)
+    fetched, errors = fetch_concurrently(fetchers)
+    for name, e in errors.items():
+        print(Fore.RED + f"Failed to fetch {name}: {e}" + Style.RESET_ALL)
+
+    if 'odds' in fetched:
+        odds = fetched['odds']
         games = create_todays_games_from_odds(odds)
         if len(games) == 0:
             print("No games found.")
@@ -124,29 +134,46 @@ def main():
 
      
     else:
-        data = get_todays_games_json(todays_games_url)
-        games = create_todays_games(data)
-    data = get_json_data(data_url)
-    df = to_data_frame(data)
+        if 'games' not in fetched:
+            # odds fetch failed => fall back to the schedule feed
+            try:
+                fetched['games'] = get_todays_games_json(todays_games_url)
+            except Exception as e:
+                print(Fore.RED + f"Failed to fetch games: {e}" + Style.RESET_ALL)
+                return
+        games = create_todays_games(fetched['games'])
+    df = to_data_frame(fetched.get('stats'))
+    if df.empty:
+        print("No team stats found.")
+        return
     data, todays_games_uo, frame_ml, home_team_odds, away_team_odds = createTodaysGames(games, df, odds)
+    sinks = [make_sink(spec, renderers, kelly_criterion=args.kc) for spec in args.output or ['terminal']]
+    results = []
     if args.nn:
-        print("------------Neural Network Model Predictions-----------")
-        data = tf.keras.utils.normalize(data, axis=1)
-        NN_Runner.nn_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds, args.kc)
-        print("-------------------------------------------------------")
+        from src.Predict import NN_Runner
+        data = normalize(data, axis=1)
+        results.append(NN_Runner.nn_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds))
     if args.xgb:
-        print("---------------XGBoost Model Predictions---------------")
-        xgb_dict =XGBoost_Runner.xgb_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds, args.kc)
-        print("-------------------------------------------------------")
+        from src.Predict import XGBoost_Runner
+        results.append(XGBoost_Runner.xgb_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds))
+        xgb_dict = build_xgb_dict(results[-1])
     if args.A:
-        print("---------------XGBoost Model Predictions---------------")
-        XGBoost_Runner.xgb_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds, args.kc)
-        print("-------------------------------------------------------")
-        data = tf.keras.utils.normalize(data, axis=1)
-        print("------------Neural Network Model Predictions-----------")
-        NN_Runner.nn_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds, args.kc)
-        print("-------------------------------------------------------")
+        from src.Predict import NN_Runner, XGBoost_Runner
+        results.append(XGBoost_Runner.xgb_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds))
+        xgb_dict = build_xgb_dict(results[-1])
+        data = normalize(data, axis=1)
+        results.append(NN_Runner.nn_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds))
+    for table in results:
+        for sink in sinks:
+            sink.write('predictions', table)
+    if args.ensemble:
+        from src.Predict.Model_Registry import ModelRegistry
+        per_model, blended = ModelRegistry().score(frame_ml.to_numpy(dtype=float), target='ML')
+        ensemble = build_ensemble(games, per_model, blended)
+        for sink in sinks:
+            sink.write('ensemble', ensemble)
     if args.darko:
+        from src.Utils.darko_scraper import scrape_dark_data_for_date
         print("Daily Adjusted & Regressed Kalman Optimized - DARKO")
         all_teams = [match[0] for match in today_matches] + [match[1] for match in today_matches]
         odds_data = odds
@@ -163,14 +190,15 @@ def main():
         df_skill = load_skill_data(skill_csv)
         df_lineup = load_lineup_data(lineup_csv)
         team_metrics = build_team_metrics(all_teams, df_skill, df_lineup)
-        deep_dark_analysis(
+        dark_table = build_dark_table(
             today_matches,
             xgb_dict,        
             darko_sums,      
             team_metrics,     
-            odds_data=odds_data,
-            kelly_criterion=args.kc  # Pass the kelly_criterion flag
+            odds_data=odds_data
         )
+        for sink in sinks:
+            sink.write('darko', dark_table)
 
 
 if __name__ == "__main__":
@@ -181,6 +209,11 @@ if __name__ == "__main__":
     parser.add_argument('-nn', action='store_true', help='Run with Neural Network Model')
     parser.add_argument('-A', action='store_true', help='Run all Models')
     parser.add_argument('-odds', help='Sportsbook to fetch from. (fanduel, draftkings, betmgm, pointsbet, caesars, wynn, bet_rivers_ny')
+    parser.add_argument('-ensemble', action='store_true', help='Score the slate against every model under Models/ and blend their money line probabilities')
     parser.add_argument('-kc', action='store_true', help='Calculates percentage of bankroll to bet based on model edge')
+    parser.add_argument('-output', action='append', help='Where results go, repeatable: terminal (default), jsonl:<dir>, csv:<dir> or parquet:<dir>')
+    parser.add_argument('-serve', action='store_true', help='Run as a prediction service that keeps the selected models (-xgb, -nn, -A) loaded')
+    parser.add_argument('-host', default='127.0.0.1', help='Host for -serve')
+    parser.add_argument('-port', type=int, default=5000, help='Port for -serve')
     args = parser.parse_args()
     main()
@@ -1,5 +1,7 @@
 from sbrscrape import Scoreboard
 
+from src.Utils.teams import canonical_names
+
 
 class SbrOddsProvider:
     """ Abbreviations dictionary for team location which are sometimes saved with abbrev instead of full name.
@@ -20,10 +22,10 @@ class SbrOddsProvider:
             dictionary: [home_team_name + ':' + away_team_name: { home_team: money_line_odds, away_team: money_line_odds }, under_over_odds: val]
         """
         dict_res = {}
-        for game in self.games:
-            # Get team names
-            home_team_name = game['home_team'].replace("Los Angeles Clippers", "LA Clippers")
-            away_team_name = game['away_team'].replace("Los Angeles Clippers", "LA Clippers")
+        # Team names as stats.nba.com spells them, e.g. "LA Clippers" for "Los Angeles Clippers"
+        home_team_names = canonical_names([game['home_team'] for game in self.games])
+        away_team_names = canonical_names([game['away_team'] for game in self.games])
+        for game, home_team_name, away_team_name in zip(self.games, home_team_names, away_team_names):
 
             money_line_home_value = money_line_away_value = totals_value = None
 
@@ -0,0 +1,67 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+
+class MicroBatcher:
+    """ Coalesces feature rows submitted by concurrent callers into a single model call.
+    A worker thread waits up to `max_wait` seconds (or until `max_batch_size` rows are queued),
+    stacks everything it collected, calls `predict_fn` once and hands each caller its own slice.
+    `predict_fn` takes a 2D array and returns one array, or a tuple of arrays, with one row per input row.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=256, max_wait=0.005):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, rows):
+        """Queues `rows` for the next batch and returns a Future resolving to their predictions."""
+        future = Future()
+        self._queue.put((np.atleast_2d(np.asarray(rows, dtype=float)), future))
+        return future
+
+    def predict(self, rows, timeout=None):
+        return self.submit(rows).result(timeout)
+
+    def _collect(self):
+        pending = [self._queue.get()]
+        size = len(pending[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending.append(item)
+            size += len(item[0])
+        return pending
+
+    def _run(self):
+        while True:
+            pending = self._collect()
+            try:
+                outputs = self.predict_fn(np.concatenate([rows for rows, _ in pending]))
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            single = not isinstance(outputs, tuple)
+            if single:
+                outputs = (outputs,)
+            start = 0
+            for rows, future in pending:
+                stop = start + len(rows)
+                result = tuple(output[start:stop] for output in outputs)
+                future.set_result(result[0] if single else result)
+                start = stop
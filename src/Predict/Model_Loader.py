@@ -0,0 +1,38 @@
+from functools import lru_cache
+
+XGB_ML_MODEL = 'Models/XGBoost_Models/XGBoost_68.7%_ML-4.json'
+XGB_UO_MODEL = 'Models/XGBoost_Models/XGBoost_53.7%_UO-9.json'
+NN_ML_MODEL = 'Models/NN_Models/Trained-Model-ML-1699315388.285516'
+NN_UO_MODEL = 'Models/NN_Models/Trained-Model-OU-1699315414.2268295'
+
+
+@lru_cache(maxsize=None)
+def load_xgb_model(path):
+    """
+    Imports xgboost and loads the booster on first use; later calls return the cached booster.
+    """
+    import xgboost as xgb
+
+    booster = xgb.Booster()
+    booster.load_model(path)
+    return booster
+
+
+@lru_cache(maxsize=None)
+def load_compiled_xgb_model(path):
+    """
+    Compiles the booster JSON into NumPy node arrays (see XGBoost_Compiler) on first use; xgboost is never imported.
+    """
+    from src.Predict.XGBoost_Compiler import compile_booster
+
+    return compile_booster(path)
+
+
+@lru_cache(maxsize=None)
+def load_nn_model(path):
+    """
+    Imports keras and loads the SavedModel on first use; later calls return the cached model.
+    """
+    from keras.models import load_model
+
+    return load_model(path)
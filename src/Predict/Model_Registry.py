@@ -0,0 +1,75 @@
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from src.Utils.tools import normalize
+
+MODELS_DIR = 'Models'
+XGB_PATTERN = re.compile(r'^XGBoost_(?P<accuracy>[\d.]+)%_(?P<target>ML|UO)-(?P<version>\d+)\.json$')
+NN_PATTERN = re.compile(r'^Trained-Model-(?P<target>ML|OU)-(?P<version>[\d.]+)$')
+
+ModelSpec = namedtuple('ModelSpec', ['name', 'kind', 'target', 'path'])
+
+
+def discover_models(models_dir=MODELS_DIR):
+    """
+    Walks `models_dir` for XGBoost JSON boosters and Keras SavedModel directories.
+    Returns ModelSpecs with target 'ML' or 'UO' (the NN models spell it 'OU' on disk).
+    """
+    specs = []
+    for root, dirs, files in os.walk(models_dir):
+        dirs.sort()
+        for file in sorted(files):
+            match = XGB_PATTERN.match(file)
+            if match:
+                specs.append(ModelSpec(file[:-len('.json')], 'xgb', match['target'], os.path.join(root, file)))
+        for directory in list(dirs):
+            match = NN_PATTERN.match(directory)
+            if match:
+                target = 'UO' if match['target'] == 'OU' else 'ML'
+                specs.append(ModelSpec(directory, 'nn', target, os.path.join(root, directory)))
+                dirs.remove(directory)  # don't walk into the SavedModel itself
+    return specs
+
+
+class ModelRegistry:
+    """ Every model found under `models_dir`, loaded on first use and cached (see Model_Loader),
+    so one process can score a slate against any number of boosters and networks.
+    """
+
+    def __init__(self, models_dir=MODELS_DIR):
+        self.specs = discover_models(models_dir)
+
+    def models(self, target='ML', kind=None, names=None):
+        return [spec for spec in self.specs
+                if spec.target == target
+                and (kind is None or spec.kind == kind)
+                and (names is None or spec.name in names)]
+
+    @staticmethod
+    def predict(spec, data):
+        """
+        Scores the raw feature matrix with one batched call; NN models get the row-normalized copy they were trained on.
+        """
+        if spec.kind == 'xgb':
+            from src.Predict import XGBoost_Runner
+            return XGBoost_Runner.predict(spec.path, data)
+        from src.Predict import NN_Runner
+        return NN_Runner.predict(spec.path, normalize(data, axis=1))
+
+    def score(self, data, target='ML', kind=None, names=None, weights=None):
+        """
+        Scores the whole slate against every matching model, one batched call per model.
+        Returns ({model name: (n_games, n_classes) probabilities}, blended probabilities),
+        where the blend is the `weights`-weighted mean (equal weights by default).
+        """
+        specs = self.models(target, kind, names)
+        if not specs:
+            raise ValueError(f"No {target} models found.")
+        data = np.asarray(data, dtype=float)
+        per_model = {spec.name: np.asarray(self.predict(spec, data)) for spec in specs}
+        w = np.ones(len(specs)) if weights is None else np.asarray([weights[spec.name] for spec in specs], dtype=float)
+        blended = np.tensordot(w / w.sum(), np.stack(list(per_model.values())), axes=1)
+        return per_model, blended
@@ -1,83 +1,70 @@
-import copy
+import os
+from functools import lru_cache
 
 import numpy as np
-import tensorflow as tf
-from colorama import Fore, Style, init, deinit
-from keras.models import load_model
-
-from src.Utils import Expected_Value
-from src.Utils import Kelly_Criterion as kc
-
-init()
-model = load_model('Models/NN_Models/Trained-Model-ML-1699315388.285516')
-ou_model = load_model("Models/NN_Models/Trained-Model-OU-1699315414.2268295")
-
-
-def nn_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds, kelly_criterion):
-    ml_predictions_array = []
-
-    for row in data:
-        ml_predictions_array.append(model.predict(np.array([row])))
-
-    frame_uo = copy.deepcopy(frame_ml)
-    frame_uo['OU'] = np.asarray(todays_games_uo)
-    data = frame_uo.values
-    data = data.astype(float)
-    data = tf.keras.utils.normalize(data, axis=1)
-
-    ou_predictions_array = []
-
-    for row in data:
-        ou_predictions_array.append(ou_model.predict(np.array([row])))
-
-    count = 0
-    for game in games:
-        home_team = game[0]
-        away_team = game[1]
-        winner = int(np.argmax(ml_predictions_array[count]))
-        under_over = int(np.argmax(ou_predictions_array[count]))
-        winner_confidence = ml_predictions_array[count]
-        un_confidence = ou_predictions_array[count]
-        if winner == 1:
-            winner_confidence = round(winner_confidence[0][1] * 100, 1)
-            if under_over == 0:
-                un_confidence = round(ou_predictions_array[count][0][0] * 100, 1)
-                print(Fore.GREEN + home_team + Style.RESET_ALL + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL + ' vs ' + Fore.RED + away_team + Style.RESET_ALL + ': ' +
-                      Fore.MAGENTA + 'UNDER ' + Style.RESET_ALL + str(todays_games_uo[count]) + Style.RESET_ALL + Fore.CYAN + f" ({un_confidence}%)" + Style.RESET_ALL)
-            else:
-                un_confidence = round(ou_predictions_array[count][0][1] * 100, 1)
-                print(Fore.GREEN + home_team + Style.RESET_ALL + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL + ' vs ' + Fore.RED + away_team + Style.RESET_ALL + ': ' +
-                      Fore.BLUE + 'OVER ' + Style.RESET_ALL + str(todays_games_uo[count]) + Style.RESET_ALL + Fore.CYAN + f" ({un_confidence}%)" + Style.RESET_ALL)
-        else:
-            winner_confidence = round(winner_confidence[0][0] * 100, 1)
-            if under_over == 0:
-                un_confidence = round(ou_predictions_array[count][0][0] * 100, 1)
-                print(Fore.RED + home_team + Style.RESET_ALL + ' vs ' + Fore.GREEN + away_team + Style.RESET_ALL + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL + ': ' +
-                      Fore.MAGENTA + 'UNDER ' + Style.RESET_ALL + str(todays_games_uo[count]) + Style.RESET_ALL + Fore.CYAN + f" ({un_confidence}%)" + Style.RESET_ALL)
-            else:
-                un_confidence = round(ou_predictions_array[count][0][1] * 100, 1)
-                print(Fore.RED + home_team + Style.RESET_ALL + ' vs ' + Fore.GREEN + away_team + Style.RESET_ALL + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL + ': ' +
-                      Fore.BLUE + 'OVER ' + Style.RESET_ALL + str(todays_games_uo[count]) + Style.RESET_ALL + Fore.CYAN + f" ({un_confidence}%)" + Style.RESET_ALL)
-        count += 1
-    if kelly_criterion:
-        print("------------Expected Value & Kelly Criterion-----------")
-    else:
-        print("---------------------Expected Value--------------------")
-    count = 0
-    for game in games:
-        home_team = game[0]
-        away_team = game[1]
-        ev_home = ev_away = 0
-        if home_team_odds[count] and away_team_odds[count]:
-            ev_home = float(Expected_Value.expected_value(ml_predictions_array[count][0][1], int(home_team_odds[count])))
-            ev_away = float(Expected_Value.expected_value(ml_predictions_array[count][0][0], int(away_team_odds[count])))
-        expected_value_colors = {'home_color': Fore.GREEN if ev_home > 0 else Fore.RED, 'away_color': Fore.GREEN if ev_away > 0 else Fore.RED}
-        bankroll_descriptor = ' Fraction of Bankroll: '
-        bankroll_fraction_home = bankroll_descriptor + str(kc.calculate_kelly_criterion(home_team_odds[count], ml_predictions_array[count][0][1])) + '%'
-        bankroll_fraction_away = bankroll_descriptor + str(kc.calculate_kelly_criterion(away_team_odds[count], ml_predictions_array[count][0][0])) + '%'
-
-        print(home_team + ' EV: ' + expected_value_colors['home_color'] + str(ev_home) + Style.RESET_ALL + (bankroll_fraction_home if kelly_criterion else ''))
-        print(away_team + ' EV: ' + expected_value_colors['away_color'] + str(ev_away) + Style.RESET_ALL + (bankroll_fraction_away if kelly_criterion else ''))
-        count += 1
-
-    deinit()
+
+from src.Predict import NN_Weights
+from src.Predict.Model_Loader import NN_ML_MODEL, NN_UO_MODEL, load_nn_model
+from src.Predict.Results import build_results
+from src.Utils.tools import build_uo_data, normalize
+
+
+def compile_predict(keras_model):
+    """
+    Traces a single forward pass with a fixed (batch, features) float32 signature.
+    The concrete function is built on the first call and reused for every slate after that,
+    skipping the per-call setup of keras' predict().
+    """
+    import tensorflow as tf
+
+    signature = [tf.TensorSpec(shape=(None, keras_model.input_shape[-1]), dtype=tf.float32)]
+
+    @tf.function(input_signature=signature)
+    def forward(x):
+        return keras_model(x, training=False)
+
+    return forward
+
+
+@lru_cache(maxsize=None)
+def get_forward(path):
+    """
+    The NumPy forward pass when the model's weights have been exported next to it (see NN_Weights),
+    so TensorFlow is never imported; the traced Keras model otherwise.
+    """
+    if os.path.exists(NN_Weights.weights_path(path)):
+        layers = NN_Weights.load_weights(NN_Weights.weights_path(path))
+        return lambda x: NN_Weights.forward(layers, x)
+    return compile_predict(load_nn_model(path))
+
+
+def predict(path, data):
+    """
+    Scores the whole (normalized) slate with the model at `path` in one forward pass => array of shape (n_games, n_classes).
+    """
+    return np.asarray(get_forward(path)(np.asarray(data, dtype=np.float32)))
+
+
+def predict_ml(data):
+    """
+    [away_prob, home_prob] per row.
+    """
+    return predict(NN_ML_MODEL, data)
+
+
+def predict_uo(data_uo):
+    """
+    Under prob first.
+    """
+    return predict(NN_UO_MODEL, data_uo)
+
+
+def nn_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds):
+    """
+    Scores the (normalized) slate with both networks => results table (see Results.build_results).
+    """
+    ml_predictions_array = predict_ml(data)
+
+    data = normalize(build_uo_data(frame_ml, todays_games_uo), axis=1)
+    ou_predictions_array = predict_uo(data)
+    return build_results('nn', games, todays_games_uo, home_team_odds, away_team_odds, ml_predictions_array, ou_predictions_array)
@@ -0,0 +1,78 @@
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+
+def softmax(x):
+    e = np.exp(x - x.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0),
+    'relu6': lambda x: np.clip(x, 0, 6),
+    'sigmoid': lambda x: 1 / (1 + np.exp(-x)),
+    'softmax': softmax,
+}
+
+
+def weights_path(model_path):
+    """ Where the exported weights of the SavedModel at `model_path` live: next to it, with an .npz suffix. """
+    return os.path.normpath(model_path) + '.npz'
+
+
+def export_weights(model_path, path=None):
+    """
+    Loads the Keras model at `model_path` (needs TensorFlow) and writes every Dense layer's kernel, bias and
+    activation to an .npz file (weights_path by default). Only Flatten and Dense layers are supported.
+    """
+    from src.Predict.Model_Loader import load_nn_model
+
+    arrays, activations = {}, []
+    for layer in load_nn_model(model_path).layers:
+        kind = type(layer).__name__
+        if kind == 'Flatten':  # the inputs are already (batch, features)
+            continue
+        activation = layer.get_config().get('activation')
+        if kind != 'Dense' or activation not in ACTIVATIONS:
+            raise ValueError(f"Can't export {kind} layer {layer.name} with activation {activation}")
+        kernel, bias = layer.get_weights()
+        arrays[f'kernel_{len(activations)}'] = kernel.astype(np.float32)
+        arrays[f'bias_{len(activations)}'] = bias.astype(np.float32)
+        activations.append(activation)
+
+    path = path or weights_path(model_path)
+    with open(path + '.tmp', 'wb') as file:
+        np.savez(file, activations=np.array(activations), **arrays)
+    os.replace(path + '.tmp', path)
+    return path
+
+
+@lru_cache(maxsize=None)
+def load_weights(path):
+    """ [(kernel, bias, activation name), ...] from an exported .npz file, cached per path. """
+    with np.load(path) as weights:
+        return [(weights[f'kernel_{i}'], weights[f'bias_{i}'], str(activation))
+                for i, activation in enumerate(weights['activations'])]
+
+
+def forward(layers, x):
+    """
+    The network's forward pass in float32 NumPy => array of shape (n_rows, n_classes).
+    `x` must already be row-normalized like the training data (tools.normalize).
+    """
+    x = np.asarray(x, dtype=np.float32)
+    for kernel, bias, activation in layers:
+        x = ACTIVATIONS[activation](x @ kernel + bias)
+    return x
+
+
+# python -m src.Predict.NN_Weights [model dir ...] exports the given SavedModels, or every one under Models/
+if __name__ == '__main__':
+    from src.Predict.Model_Registry import discover_models
+
+    for model_path in sys.argv[1:] or [spec.path for spec in discover_models() if spec.kind == 'nn']:
+        print(f"Exported {export_weights(model_path)}")
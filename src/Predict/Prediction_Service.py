@@ -0,0 +1,155 @@
+import json
+import math
+import threading
+import time
+
+from flask import Flask, jsonify, request
+
+from src.Predict.Micro_Batcher import MicroBatcher
+from src.Predict.Model_Loader import NN_ML_MODEL, NN_UO_MODEL, XGB_ML_MODEL, XGB_UO_MODEL, load_compiled_xgb_model
+from src.Predict.Results import build_results
+from src.Utils.teams import UNKNOWN, canonical_names, team_ids
+from src.Utils.tools import build_uo_data, get_json_data, normalize, to_data_frame
+
+STATS_TTL_SECONDS = 600
+
+
+class TeamStatsCache:
+    """ Keeps the league team stats frame in memory and refetches it once it is older than `ttl` seconds. """
+
+    def __init__(self, url, ttl=STATS_TTL_SECONDS):
+        self.url = url
+        self.ttl = ttl
+        self._df = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._df is None or time.monotonic() - self._fetched_at > self.ttl:
+                df = to_data_frame(get_json_data(self.url, ttl=self.ttl))
+                if len(df.index) or self._df is None:
+                    self._df = df
+                self._fetched_at = time.monotonic()
+            return self._df
+
+
+def parse_number(game, field):
+    """ `game[field]` as a float; anything but a finite JSON number is rejected. """
+    value = game.get(field)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"'{field}' must be a number, got {value!r}")
+    return float(value)
+
+
+def parse_games(payload_games):
+    """
+    ([home, away] per game, odds dict in the SbrOddsProvider shape) from the request's games; raises ValueError
+    with a message for the client on anything build_games or build_uo_data would choke on.
+    """
+    if not isinstance(payload_games, list) or not payload_games:
+        raise ValueError("No games given.")
+    games, odds = [], {}
+    for game in payload_games:
+        if not isinstance(game, dict):
+            raise ValueError(f"Each game must be an object, got {game!r}")
+        home_team, away_team = game.get("home_team"), game.get("away_team")
+        if (team_ids([home_team, away_team]) == UNKNOWN).any():
+            raise ValueError(f"Unknown team in {away_team} @ {home_team}")
+        ou, home_odds, away_odds = (parse_number(game, field) for field in ("ou", "home_odds", "away_odds"))
+        home_team, away_team = canonical_names([home_team, away_team])
+        games.append([home_team, away_team])
+        odds[home_team + ':' + away_team] = {
+            'under_over_odds': ou,
+            home_team: {'money_line_odds': home_odds},
+            away_team: {'money_line_odds': away_odds},
+        }
+    return games, odds
+
+
+def xgb_predict(data_uo):
+    """ML features are the O/U features minus the trailing O/U column."""
+    from src.Predict import XGBoost_Runner
+    return XGBoost_Runner.predict_ml(data_uo[:, :-1]), XGBoost_Runner.predict_uo(data_uo)
+
+
+def nn_predict(data_uo):
+    """Both models see row-normalized inputs, so rows from different requests can share a batch."""
+    from src.Predict import NN_Runner
+    return NN_Runner.predict_ml(normalize(data_uo[:, :-1], axis=1)), NN_Runner.predict_uo(normalize(data_uo, axis=1))
+
+
+def xgb_warm_up():
+    load_compiled_xgb_model(XGB_ML_MODEL)
+    load_compiled_xgb_model(XGB_UO_MODEL)
+
+
+def nn_warm_up():
+    from src.Predict import NN_Runner
+    NN_Runner.get_forward(NN_ML_MODEL)
+    NN_Runner.get_forward(NN_UO_MODEL)
+
+
+# name => (batched predictor, model loader run at startup)
+MODELS = {
+    'xgb': (xgb_predict, xgb_warm_up),
+    'nn': (nn_predict, nn_warm_up),
+}
+
+
+def create_app(data_url, build_games, models=('xgb',), max_batch_size=256, max_wait=0.005):
+    """
+    Builds the Flask app. `build_games` is main.createTodaysGames; `models` picks which predictors
+    are kept warm. POST /predict accepts
+        {"games": [{"home_team", "away_team", "ou", "home_odds", "away_odds"}, ...], "models": ["xgb", "nn"]}
+    """
+    stats = TeamStatsCache(data_url)
+    batchers = {}
+    for name in models:
+        predict_fn, warm_up = MODELS[name]
+        warm_up()
+        batchers[name] = MicroBatcher(predict_fn, max_batch_size, max_wait)
+
+    app = Flask(__name__)
+
+    @app.get("/health")
+    def health():
+        return jsonify({"status": "ok", "models": list(batchers)})
+
+    @app.post("/predict")
+    def predict():
+        payload = request.get_json(force=True, silent=True)
+        if not isinstance(payload, dict):
+            return jsonify({"error": "Expected a JSON object."}), 400
+        requested = payload.get("models") or list(batchers)
+        if not isinstance(requested, list):
+            return jsonify({"error": "'models' must be a list."}), 400
+        unknown = [name for name in requested if name not in batchers]
+        if unknown:
+            return jsonify({"error": f"Models not loaded: {unknown}"}), 400
+
+        try:
+            games, odds = parse_games(payload.get("games"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        df = stats.get()
+        if df.empty:
+            return jsonify({"error": "Team stats are unavailable, try again later."}), 503
+        _, todays_games_uo, frame_ml, home_team_odds, away_team_odds = build_games(games, df, odds)
+        data_uo = build_uo_data(frame_ml, todays_games_uo)
+        futures = {name: batchers[name].submit(data_uo) for name in requested}
+
+        out = {}
+        for name, future in futures.items():
+            ml_predictions, ou_predictions = future.result()
+            results = build_results(name, games, todays_games_uo, home_team_odds, away_team_odds, ml_predictions, ou_predictions)
+            out[name] = json.loads(results.to_json(orient="records"))
+        return jsonify(out)
+
+    return app
+
+
+def serve(data_url, build_games, models=('xgb',), host="127.0.0.1", port=5000):
+    app = create_app(data_url, build_games, models)
+    app.run(host=host, port=port, threaded=True)
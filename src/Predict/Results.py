@@ -0,0 +1,116 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from colorama import Fore, Style
+
+from src.Utils import Expected_Value
+from src.Utils import Kelly_Criterion as kc
+from src.Utils.tools import moneyline_odds
+
+MODEL_TITLES = {
+    'xgb': "---------------XGBoost Model Predictions---------------",
+    'nn': "------------Neural Network Model Predictions-----------",
+}
+
+
+def build_results(model, games, todays_games_uo, home_team_odds, away_team_odds, ml_predictions, ou_predictions):
+    """
+    One row per game with the model's picks, probabilities, EV and Kelly fractions, computed column-wise.
+    `ml_predictions` rows are [away_prob, home_prob]; `ou_predictions` rows are [under_prob, over_prob, ...].
+    """
+    ml_predictions = np.asarray(ml_predictions, dtype=float).reshape(-1, 2)
+    ou_predictions = np.asarray(ou_predictions, dtype=float).reshape(len(ml_predictions), -1)
+    odds = moneyline_odds(home_team_odds, away_team_odds)
+    ev = np.nan_to_num(Expected_Value.expected_values(ml_predictions, odds))
+    kelly = kc.kelly_fractions(odds, ml_predictions)
+    ou_pick = np.where(np.argmax(ou_predictions, axis=1) == 0, 'under', 'over')
+    return pd.DataFrame({
+        'date': str(date.today()),
+        'model': model,
+        'home_team': [game[0] for game in games],
+        'away_team': [game[1] for game in games],
+        'winner_side': np.where(ml_predictions[:, 1] >= ml_predictions[:, 0], 'home', 'away'),
+        'home_prob': ml_predictions[:, 1],
+        'away_prob': ml_predictions[:, 0],
+        'ou': np.asarray(todays_games_uo, dtype=float),
+        'ou_pick': ou_pick,
+        'under_prob': ou_predictions[:, 0],
+        'over_prob': ou_predictions[:, 1],
+        'home_odds': odds[:, 1],
+        'away_odds': odds[:, 0],
+        'ev_home': ev[:, 1],
+        'ev_away': ev[:, 0],
+        'kelly_home': kelly[:, 1],
+        'kelly_away': kelly[:, 0],
+    })
+
+
+def build_xgb_dict(results):
+    """
+    (home, away) => {winner_side, home_prob, away_prob, ev_home, ev_away}, the shape deep_dark_analysis reads.
+    """
+    columns = ["winner_side", "home_prob", "away_prob", "ev_home", "ev_away"]
+    return {(row.home_team, row.away_team): {column: getattr(row, column) for column in columns}
+            for row in results.itertuples(index=False)}
+
+
+def build_ensemble(games, per_model, blended):
+    """
+    One row per game and model with its home win probability; the blend is the last row of each game, model 'blend'.
+    `per_model` and `blended` are ModelRegistry.score's outputs.
+    """
+    models = [*per_model, 'blend']
+    home_probs = np.column_stack([np.asarray(probs)[:, 1] for probs in (*per_model.values(), blended)])
+    return pd.DataFrame({
+        'date': str(date.today()),
+        'home_team': np.repeat([game[0] for game in games], len(models)),
+        'away_team': np.repeat([game[1] for game in games], len(models)),
+        'model': np.tile(models, len(games)),
+        'home_prob': home_probs.ravel(),
+    })
+
+
+def render_ensemble(table, kelly_criterion=False):
+    """
+    One line per game: every model's home win probability, then the blend.
+    """
+    print("---------------Model Ensemble Predictions--------------")
+    for (home_team, away_team), game in table.groupby(['home_team', 'away_team'], sort=False):
+        probs = dict(zip(game['model'], game['home_prob']))
+        blend = probs.pop('blend')
+        model_probs = ', '.join(f"{name}: {prob * 100:.1f}%" for name, prob in probs.items())
+        print(f"{home_team} vs {away_team} home win => {model_probs} | " + Fore.CYAN + f"Blend: {blend * 100:.1f}%" + Style.RESET_ALL)
+    print("-------------------------------------------------------")
+
+
+def render_predictions(results, kelly_criterion=False):
+    """
+    Colored terminal report: the pick lines, then the EV (and Kelly) lines.
+    """
+    if results.empty:
+        return
+    model = results['model'].iloc[0]
+    print(MODEL_TITLES.get(model, f"---------------{model} Model Predictions---------------"))
+    for row in results.itertuples(index=False):
+        winner_confidence = round((row.home_prob if row.winner_side == 'home' else row.away_prob) * 100, 1)
+        if row.ou_pick == 'under':
+            ou_text = Fore.MAGENTA + 'UNDER ' + Style.RESET_ALL + str(row.ou) + Style.RESET_ALL + Fore.CYAN + f" ({round(row.under_prob * 100, 1)}%)" + Style.RESET_ALL
+        else:
+            ou_text = Fore.BLUE + 'OVER ' + Style.RESET_ALL + str(row.ou) + Style.RESET_ALL + Fore.CYAN + f" ({round(row.over_prob * 100, 1)}%)" + Style.RESET_ALL
+        if row.winner_side == 'home':
+            print(Fore.GREEN + row.home_team + Style.RESET_ALL + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL
+                  + ' vs ' + Fore.RED + row.away_team + Style.RESET_ALL + ': ' + ou_text)
+        else:
+            print(Fore.RED + row.home_team + Style.RESET_ALL + ' vs ' + Fore.GREEN + row.away_team + Style.RESET_ALL
+                  + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL + ': ' + ou_text)
+
+    if kelly_criterion:
+        print("------------Expected Value & Kelly Criterion-----------")
+    else:
+        print("---------------------Expected Value--------------------")
+    for row in results.itertuples(index=False):
+        for team, ev, kelly in [(row.home_team, row.ev_home, row.kelly_home), (row.away_team, row.ev_away, row.kelly_away)]:
+            color = Fore.GREEN if ev > 0 else Fore.RED
+            print(f"{team} EV: {color}{ev}{Style.RESET_ALL}" + (f", Kelly fraction: {kelly}%" if kelly_criterion else ""))
+    print("-------------------------------------------------------")
@@ -1,159 +1,38 @@
-import copy
-
 import numpy as np
-import pandas as pd
-import xgboost as xgb
-from colorama import Fore, Style, init, deinit
-from src.Utils import Expected_Value
-from src.Utils import Kelly_Criterion as kc
+from src.Predict.Model_Loader import XGB_ML_MODEL, XGB_UO_MODEL, load_compiled_xgb_model
+from src.Predict.Results import build_results
+from src.Utils.tools import build_uo_data
 
 
 # from src.Utils.Dictionaries import team_index_current
 # from src.Utils.tools import get_json_data, to_data_frame, get_todays_games_json, create_todays_games
-init()
-xgb_ml = xgb.Booster()
-xgb_ml.load_model('Models/XGBoost_Models/XGBoost_68.7%_ML-4.json')
-xgb_uo = xgb.Booster()
-xgb_uo.load_model('Models/XGBoost_Models/XGBoost_53.7%_UO-9.json')
-
-def build_xgb_dict(games, ml_predictions, ev_results):
-    xgb_out = {}
-    for i, (home, away) in enumerate(games):
-        ml = ml_predictions[i]
-        ev = ev_results[i]
-        xgb_out[(home, away)] = {
-            "winner_side": ml["winner_side"],
-            "home_prob": ml["home_prob"],
-            "away_prob": ml["away_prob"],
-            "ev_home": ev["ev_home"],
-            "ev_away": ev["ev_away"]
-        }
-    return xgb_out
-
-def xgb_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds, kelly_criterion):
-    ml_predictions_array = []
-
-    for row in data:
-        ml_predictions_array.append(xgb_ml.predict(xgb.DMatrix(np.array([row]))))
-
-    frame_uo = copy.deepcopy(frame_ml)
-    frame_uo['OU'] = np.asarray(todays_games_uo)
-    data = frame_uo.values
-    data = data.astype(float)
-
-    ou_predictions_array = []
-
-    for row in data:
-        ou_predictions_array.append(xgb_uo.predict(xgb.DMatrix(np.array([row]))))
-    ml_info_list = []   ### NEW CODE ###
-    count = 0
-    for game in games:
-        home_team = game[0]
-        away_team = game[1]
-        ml_array = ml_predictions_array[count]  # shape => [[away_prob, home_prob]]
-        away_prob = ml_array[0][0]
-        home_prob = ml_array[0][1]
-        winner_idx = 1 if home_prob >= away_prob else 0
-
-        # under/over
-        ou_array = ou_predictions_array[count]  # shape => [[under_prob, over_prob, or depends? we have 3 classes if U/O?
-        under_over = int(np.argmax(ou_array[0]))  # 2 classes => 0=under,1=over?
-        
-        if winner_idx == 1:
-            # home wins
-            winner_confidence = round(home_prob * 100, 1)
-            if under_over == 0:
-                un_confidence = round(ou_array[0][0]*100, 1)
-                print(
-                    Fore.GREEN + home_team + Style.RESET_ALL + Fore.CYAN + f" ({winner_confidence}%)" 
-                    + Style.RESET_ALL + ' vs ' + Fore.RED + away_team + Style.RESET_ALL 
-                    + ': ' + Fore.MAGENTA + 'UNDER ' + Style.RESET_ALL + str(todays_games_uo[count]) 
-                    + Style.RESET_ALL + Fore.CYAN + f" ({un_confidence}%)" + Style.RESET_ALL
-                )
-            else:
-                over_conf = round(ou_array[0][1]*100,1)
-                print(
-                    Fore.GREEN + home_team + Style.RESET_ALL + Fore.CYAN + f" ({winner_confidence}%)" 
-                    + Style.RESET_ALL + ' vs ' + Fore.RED + away_team + Style.RESET_ALL 
-                    + ': ' + Fore.BLUE + 'OVER ' + Style.RESET_ALL + str(todays_games_uo[count]) 
-                    + Style.RESET_ALL + Fore.CYAN + f" ({over_conf}%)" + Style.RESET_ALL
-                )
-            # also store in ml_info_list
-            ml_info_list.append({
-                "winner_side": "home",
-                "home_prob": float(home_prob),
-                "away_prob": float(away_prob)
-            })
-        else:
-            # away wins
-            winner_confidence = round(away_prob * 100, 1)
-            if under_over == 0:
-                un_confidence = round(ou_array[0][0]*100,1)
-                print(
-                    Fore.RED + home_team + Style.RESET_ALL + ' vs ' + Fore.GREEN + away_team + Style.RESET_ALL 
-                    + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL 
-                    + ': ' + Fore.MAGENTA + 'UNDER ' + Style.RESET_ALL + str(todays_games_uo[count]) 
-                    + Style.RESET_ALL + Fore.CYAN + f" ({un_confidence}%)" + Style.RESET_ALL
-                )
-            else:
-                over_conf = round(ou_array[0][1]*100,1)
-                print(
-                    Fore.RED + home_team + Style.RESET_ALL + ' vs ' + Fore.GREEN + away_team + Style.RESET_ALL 
-                    + Fore.CYAN + f" ({winner_confidence}%)" + Style.RESET_ALL 
-                    + ': ' + Fore.BLUE + 'OVER ' + Style.RESET_ALL + str(todays_games_uo[count]) 
-                    + Style.RESET_ALL + Fore.CYAN + f" ({over_conf}%)" + Style.RESET_ALL
-                )
-            ml_info_list.append({
-                "winner_side": "away",
-                "home_prob": float(home_prob),
-                "away_prob": float(away_prob)
-            })
-
-        count += 1
-
-
-    if kelly_criterion:
-        print("------------Expected Value & Kelly Criterion-----------")
-    else:
-        print("---------------------Expected Value--------------------")
-
-    # PASS 2: EV lines
-    ev_results = []
-    count = 0
-    for game in games:
-        home_team, away_team = game[0], game[1]
-        away_prob = ml_predictions_array[count][0][0]
-        home_prob = ml_predictions_array[count][0][1]
-        ev_home = ev_away = 0
-        if home_team_odds[count] and away_team_odds[count]:
-            ev_home = float(Expected_Value.expected_value(home_prob, int(home_team_odds[count])))
-            ev_away = float(Expected_Value.expected_value(away_prob, int(away_team_odds[count])))
-
-        home_color = Fore.GREEN if ev_home>0 else Fore.RED
-        away_color = Fore.GREEN if ev_away>0 else Fore.RED
-
-        ev_results.append({
-            "ev_home": ev_home,
-            "ev_away": ev_away
-        })
-
-        if kelly_criterion:
-            frac_home = kc.calculate_kelly_criterion(home_team_odds[count], home_prob)
-            frac_away = kc.calculate_kelly_criterion(away_team_odds[count], away_prob)
-            print(f"{home_team} EV: {home_color}{ev_home}{Style.RESET_ALL}, Kelly fraction: {frac_home}%")
-            print(f"{away_team} EV: {away_color}{ev_away}{Style.RESET_ALL}, Kelly fraction: {frac_away}%")
-        else:
-            print(f"{home_team} EV: {home_color}{ev_home}{Style.RESET_ALL}")
-            print(f"{away_team} EV: {away_color}{ev_away}{Style.RESET_ALL}")
-
-        count += 1
-
-    print("-------------------------------------------------------")
-
-    # Now build final dictionary: we have ml_info_list and ev_results, each same length as games
-    xgb_dict = build_xgb_dict(games, ml_info_list, ev_results)  ### FIXED => pass ml_info_list
-    deinit()
-    return xgb_dict
+
+def predict(path, data):
+    """
+    Scores the whole slate with the booster at `path` in one call => array of shape (n_games, n_classes).
+    Uses the compiled NumPy evaluator, which matches Booster.predict without loading xgboost.
+    """
+    return load_compiled_xgb_model(path).predict(np.asarray(data, dtype=float))
+
+def predict_ml(data):
+    """
+    [away_prob, home_prob] per row.
+    """
+    return predict(XGB_ML_MODEL, data)
+
+def predict_uo(data_uo):
+    """
+    Under prob first.
+    """
+    return predict(XGB_UO_MODEL, data_uo)
+
+def xgb_runner(data, todays_games_uo, frame_ml, games, home_team_odds, away_team_odds):
+    """
+    Scores the slate with both boosters => results table (see Results.build_results); rendering is up to the caller.
+    """
+    ml_predictions_array = predict_ml(data)
+    ou_predictions_array = predict_uo(build_uo_data(frame_ml, todays_games_uo))
+    return build_results('xgb', games, todays_games_uo, home_team_odds, away_team_odds, ml_predictions_array, ou_predictions_array)
 
 
 
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pandas as pd
+import toml
+
+sys.path.insert(1, os.path.join(sys.path[0], '../..'))
+from src.Utils import storage
+from src.Utils.feature_store import FeatureStore
+
+# Copies an existing dataset.sqlite table into the feature store without rebuilding it from raw data.
+dataset = sys.argv[1] if len(sys.argv) > 1 else "dataset_2012-24_new"
+config = toml.load("../../config.toml")
+
+con = storage.connect(storage.DATASET_DB)
+frame = pd.read_sql_query(f"select * from \"{dataset}\"", con, index_col="index")
+con.close()
+
+FeatureStore("../../Data/features").write(frame, config['create-games'])
+print(f"Exported {len(frame)} games from {dataset}")
@@ -1,40 +1,67 @@
 import os
-import random
-import sqlite3
 import sys
-import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 import toml
 
 sys.path.insert(1, os.path.join(sys.path[0], '../..'))
-from src.Utils.tools import get_json_data, to_data_frame
+from src.Utils import storage
+from src.Utils.backfill import TokenBucket, backfill
+from src.Utils.http_client import DEFAULT_TTL, FOREVER, get_http_client
+from src.Utils.team_stats_store import TeamStatsStore
+from src.Utils.tools import data_headers, to_data_frame
+
+WORKERS = 4  # requests in flight at once
+REQUESTS_PER_SECOND = 1.0  # stats.nba.com throttles aggressive clients; cached responses don't count
+BATCH_SIZE = 50  # days written per transaction
 
 config = toml.load("../../config.toml")
 
 url = config['data_url']
 
-con = sqlite3.connect("../../Data/TeamData.sqlite")
+store = TeamStatsStore.open(storage.TEAM_DB)
+limiter = TokenBucket(REQUESTS_PER_SECOND, capacity=WORKERS)
+
+
+def is_final(snapshot_date):
+    """ Whether the stats behind `snapshot_date` (through the day before it) can no longer change. """
+    return snapshot_date <= str(date.today())
+
+
+def fetch(job):
+    snapshot_date, day_url = job
+    # past dates never change, so their responses are cached for good; today's stats are still moving
+    ttl = FOREVER if is_final(snapshot_date) else DEFAULT_TTL
+    client = get_http_client()
+    if client.read_cache(day_url, ttl) is None:
+        limiter.acquire()
+    return to_data_frame(client.get_json(day_url, headers=data_headers, ttl=ttl).get('resultSets'))
+
 
+def write_batch(batch):
+    store.write_snapshots([(snapshot_date, df) for (snapshot_date, day_url), df in batch])
+    print(f"Saved {len(batch)} days, latest {max(snapshot_date for (snapshot_date, day_url), df in batch)}")
+
+
+jobs = []
 for key, value in config['get-data'].items():
     date_pointer = datetime.strptime(value['start_date'], "%Y-%m-%d").date()
     end_date = datetime.strptime(value['end_date'], "%Y-%m-%d").date()
 
     while date_pointer <= end_date:
-        print("Getting data: ", date_pointer)
-
-        raw_data = get_json_data(
-            url.format(date_pointer.month, date_pointer.day, value['start_year'], date_pointer.year, key))
-        df = to_data_frame(raw_data)
-
+        # stats through date_pointer are stored under the next day, the day they are known before tip-off
+        jobs.append(((date_pointer + timedelta(days=1)).strftime("%Y-%m-%d"),
+                     url.format(date_pointer.month, date_pointer.day, value['start_year'], date_pointer.year, key)))
         date_pointer = date_pointer + timedelta(days=1)
 
-        df['Date'] = str(date_pointer)
-
-        df.to_sql(date_pointer.strftime("%Y-%m-%d"), con, if_exists="replace")
-
-        time.sleep(random.randint(1, 3))
+fetched = store.fetched_dates()
+pending = [job for job in jobs if job[0] not in fetched or not is_final(job[0])]  # unfinished days are refetched
+print(f"Getting data: {len(pending)} of {len(jobs)} days left")
 
-        # TODO: Add tests
+errors = backfill(pending, fetch, write_batch, workers=WORKERS, batch_size=BATCH_SIZE)
+for (snapshot_date, day_url), e in sorted(errors.items()):
+    print(f"Failed {snapshot_date}: {e}")
+if errors:
+    print(f"{len(errors)} days failed; rerun to retry them.")
 
-con.close()
+store.close()
@@ -0,0 +1,13 @@
+import os
+import sys
+
+sys.path.insert(1, os.path.join(sys.path[0], '../..'))
+from src.Utils import storage
+from src.Utils.team_stats_store import migrate_date_tables
+
+# One-off: folds the per-date tables written by older versions of Get_Data.py into the team_stats table.
+# Pass --keep to leave the per-date tables in place.
+con = storage.connect(storage.TEAM_DB)
+count = migrate_date_tables(con, drop='--keep' not in sys.argv)
+print(f"Migrated {count} daily tables into team_stats")
+con.close()
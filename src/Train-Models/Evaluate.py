@@ -0,0 +1,56 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(1, os.path.join(sys.path[0], '../..'))
+from src.Utils.walk_forward import evaluate
+
+# python -m Evaluate <xgb|logistic|nn> <ML|UO> tests each season on a model trained on every season before it,
+# with the trainers' parameters. Fold matrices are cached under Data/folds and reused until the feature store changes.
+XGB_PARAMS = {
+    'ML': {'max_depth': 3, 'eta': 0.01, 'objective': 'multi:softprob', 'num_class': 2},
+    'UO': {'max_depth': 20, 'eta': 0.05, 'objective': 'multi:softprob', 'num_class': 3},
+}
+NN_LAYERS = {'ML': [512, 256, 128], 'UO': [128]}
+
+
+def xgb_trainer(target):
+    import xgboost as xgb
+
+    def fit_predict(x_train, y_train, x_test):
+        booster = xgb.train(XGB_PARAMS[target], xgb.QuantileDMatrix(x_train, y_train), 750)
+        return booster.inplace_predict(x_test)
+    return fit_predict
+
+
+def logistic_trainer(target):
+    from sklearn.linear_model import LogisticRegression
+
+    def fit_predict(x_train, y_train, x_test):
+        model = LogisticRegression().fit(np.asarray(x_train, dtype=float), y_train)
+        return model.predict_proba(np.asarray(x_test, dtype=float))
+    return fit_predict
+
+
+def nn_trainer(target):
+    import tensorflow as tf
+    from src.Utils.nn_training import build_model
+
+    def fit_predict(x_train, y_train, x_test):
+        model = build_model(NN_LAYERS[target], 2 if target == 'ML' else 3)
+        model.fit(tf.keras.utils.normalize(x_train, axis=1), np.asarray(y_train), epochs=50, validation_split=0.1,
+                  batch_size=32, verbose=0,
+                  callbacks=[tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True)])
+        return model.predict(tf.keras.utils.normalize(x_test, axis=1), verbose=0)
+    return fit_predict
+
+
+TRAINERS = {'xgb': xgb_trainer, 'logistic': logistic_trainer, 'nn': nn_trainer}
+
+if __name__ == '__main__':
+    kind, target = sys.argv[1], sys.argv[2]
+    results = evaluate(TRAINERS[kind](target), target)
+    print(results.to_string(index=False, float_format=lambda value: f"{value:.3f}"))
+    print(f"Mean accuracy {results['Accuracy'].mean():.3f}, log-loss {results['Log-Loss'].mean():.3f}, "
+          f"ROI {results['ROI'].mean():+.3f}")
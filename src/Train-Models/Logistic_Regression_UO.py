@@ -1,24 +1,14 @@
-import sqlite3
+import os
+import sys
 
-import numpy as np
-import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, accuracy_score
 from sklearn.model_selection import train_test_split
 
-dataset = "dataset_2012-23"
-con = sqlite3.connect("../../Data/dataset.sqlite")
-data = pd.read_sql_query(f"select * from \"{dataset}\"", con, index_col="index")
-con.close()
+sys.path.insert(1, os.path.join(sys.path[0], '../..'))
+from src.Utils.feature_store import FeatureStore
 
-OU = data['OU-Cover']
-total = data['OU']
-data.drop(['Score', 'Home-Team-Win', 'TEAM_NAME', 'Date', 'TEAM_NAME.1', 'Date.1', 'OU-Cover', 'OU'], axis=1,
-          inplace=True)
-
-data['OU'] = np.asarray(total)
-data = data.values
-data = data.astype(float)
+data, OU = FeatureStore("../../Data/features").xy('UO', dtype=float)
 
 X_train, X_test, y_train, y_test = train_test_split(data, OU, test_size=0.1, random_state=42)
 
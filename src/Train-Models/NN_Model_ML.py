@@ -1,40 +1,36 @@
-import sqlite3
+import os
+import sys
 import time
 
 import numpy as np
-import pandas as pd
 import tensorflow as tf
 from keras.callbacks import TensorBoard, EarlyStopping, ModelCheckpoint
 
+sys.path.insert(1, os.path.join(sys.path[0], '../..'))
+from src.Predict.NN_Weights import export_weights
+from src.Utils.feature_store import FeatureStore
+from src.Utils.nn_training import build_model
+from src.Utils.sweep import TrialStore
+
 current_time = str(time.time())
 
 tensorboard = TensorBoard(log_dir='../../Logs/{}'.format(current_time))
 earlyStopping = EarlyStopping(monitor='val_loss', patience=10, verbose=0, mode='min')
 mcp_save = ModelCheckpoint('../../Models/Trained-Model-ML-' + current_time, save_best_only=True, monitor='val_loss', mode='min')
 
-dataset = "dataset_2012-24_new"
-con = sqlite3.connect("../../Data/dataset.sqlite")
-data = pd.read_sql_query(f"select * from \"{dataset}\"", con, index_col="index")
-con.close()
-
-scores = data['Score']
-margin = data['Home-Team-Win']
-data.drop(['Score', 'Home-Team-Win', 'TEAM_NAME', 'Date', 'TEAM_NAME.1', 'Date.1', 'OU', 'OU-Cover'], axis=1, inplace=True)
-
-data = data.values
-data = data.astype(float)
+data, margin = FeatureStore("../../Data/features").xy('ML')
 
 x_train = tf.keras.utils.normalize(data, axis=1)
 y_train = np.asarray(margin)
 
-model = tf.keras.models.Sequential()
-model.add(tf.keras.layers.Flatten())
-model.add(tf.keras.layers.Dense(512, activation=tf.nn.relu6))
-model.add(tf.keras.layers.Dense(256, activation=tf.nn.relu6))
-model.add(tf.keras.layers.Dense(128, activation=tf.nn.relu6))
-model.add(tf.keras.layers.Dense(2, activation=tf.nn.softmax))
+config = {'layers': [512, 256, 128], 'learning_rate': 0.001, 'batch_size': 32}
+if '--swept' in sys.argv:  # the best config found by Sweep
+    config.update(TrialStore.open().best('nn_ML'))
+
+model = build_model(config['layers'], 2, config['learning_rate'])
+model.fit(x_train, y_train, epochs=50, validation_split=0.1, batch_size=config['batch_size'], callbacks=[tensorboard, earlyStopping, mcp_save])
 
-model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
-model.fit(x_train, y_train, epochs=50, validation_split=0.1, batch_size=32, callbacks=[tensorboard, earlyStopping, mcp_save])
+# the weights NN_Runner scores with, without importing TensorFlow
+export_weights('../../Models/Trained-Model-ML-' + current_time)
 
 print('Done')
@@ -0,0 +1,43 @@
+import os
+import sys
+
+sys.path.insert(1, os.path.join(sys.path[0], '../..'))
+from src.Utils import nn_training, xgb_training
+from src.Utils.feature_store import FeatureStore
+from src.Utils.sweep import TrialStore, successive_halving
+
+# python -m Sweep <xgb|nn> <ML|UO> searches the space below with successive halving. Finished trials are kept in
+# Data/sweeps.sqlite, so rerunning an interrupted sweep picks up where it stopped. The trainers use the best
+# config with --swept.
+XGB_SPACE = {
+    'max_depth': [3, 4, 6, 8, 12, 20],
+    'eta': [0.01, 0.03, 0.05, 0.1],
+    'subsample': [0.7, 0.85, 1.0],
+    'colsample_bytree': [0.5, 0.75, 1.0],
+    'min_child_weight': [1, 5, 10],
+}
+NN_SPACE = {
+    'layers': [[128], [256, 128], [512, 256, 128]],
+    'learning_rate': [0.0003, 0.001, 0.003],
+    'batch_size': [32, 64, 128],
+}
+CONFIGS = 27  # three rungs of thirds leave one config at full budget
+NUM_CLASSES = {'ML': 2, 'UO': 3}
+
+if __name__ == '__main__':
+    kind, target = sys.argv[1], sys.argv[2]
+    data, labels = FeatureStore("../../Data/features").xy(target)
+    workers = os.cpu_count() or 1
+
+    if kind == 'xgb':
+        params = {'objective': 'multi:softprob', 'num_class': NUM_CLASSES[target]}
+        best, loss = successive_halving(f"xgb_{target}", XGB_SPACE, xgb_training.validation_loss, CONFIGS, 28, 750,
+                                        workers=workers, initializer=xgb_training.init_worker,
+                                        initargs=(data, labels, params, xgb_training.thread_budget(workers)))
+    else:
+        best, loss = successive_halving(f"nn_{target}", NN_SPACE, nn_training.validation_loss, CONFIGS, 2, 50,
+                                        workers=workers, initializer=nn_training.init_worker,
+                                        initargs=(data, labels, NUM_CLASSES[target],
+                                                  xgb_training.thread_budget(workers)))
+    print(f"Best {kind} {target} config: {best} (validation loss {loss:.4f})")
+    print(f"{len(TrialStore.open().results(f'{kind}_{target}'))} trials recorded")
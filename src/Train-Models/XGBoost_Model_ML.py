@@ -1,30 +1,17 @@
-import sqlite3
+import os
+import sys
 
-import numpy as np
-import pandas as pd
-import xgboost as xgb
-from sklearn.metrics import accuracy_score
-from sklearn.model_selection import train_test_split
 from tqdm import tqdm
 
-dataset = "dataset_2012-24_new"
-con = sqlite3.connect("../../Data/dataset.sqlite")
-data = pd.read_sql_query(f"select * from \"{dataset}\"", con, index_col="index")
-con.close()
+sys.path.insert(1, os.path.join(sys.path[0], '../..'))
+from src.Utils.feature_store import FeatureStore
+from src.Utils.sweep import TrialStore
+from src.Utils.xgb_training import save_model, train_seeds
 
-margin = data['Home-Team-Win']
-data.drop(['Score', 'Home-Team-Win', 'TEAM_NAME', 'Date', 'TEAM_NAME.1', 'Date.1', 'OU-Cover', 'OU'],
-          axis=1, inplace=True)
+SEEDS = 300
 
-data = data.values
-
-data = data.astype(float)
-acc_results = []
-for x in tqdm(range(300)):
-    x_train, x_test, y_train, y_test = train_test_split(data, margin, test_size=.1)
-
-    train = xgb.DMatrix(x_train, label=y_train)
-    test = xgb.DMatrix(x_test, label=y_test)
+if __name__ == '__main__':
+    data, margin = FeatureStore("../../Data/features").xy('ML')
 
     param = {
         'max_depth': 3,
@@ -33,17 +20,13 @@ for x in tqdm(range(300)):
         'num_class': 2
     }
     epochs = 750
-
-    model = xgb.train(param, train, epochs)
-    predictions = model.predict(test)
-    y = []
-
-    for z in predictions:
-        y.append(np.argmax(z))
-
-    acc = round(accuracy_score(y_test, y) * 100, 1)
-    print(f"{acc}%")
-    acc_results.append(acc)
-    # only save results if they are the best so far
-    if acc == max(acc_results):
-        model.save_model('../../Models/XGBoost_{}%_ML-4.json'.format(acc))
+    if '--swept' in sys.argv:  # the best config found by Sweep
+        param.update(TrialStore.open().best('xgb_ML'))
+
+    best = None
+    for run in tqdm(train_seeds(data, margin, param, range(SEEDS), epochs), total=SEEDS):
+        print(f"{run.accuracy}% (seed {run.seed}, {run.rounds} rounds)")
+        # only save results if they are the best so far
+        if best is None or run.accuracy >= best.accuracy:
+            best = run
+            save_model(run.model, '../../Models/XGBoost_{}%_ML-4.json'.format(run.accuracy))
@@ -1,11 +1,43 @@
-def expected_value(Pwin, odds):
+import numpy as np
+
+
+def round_half_even(values, ndigits=2):
+    """
+    Element-wise round() with Python's semantics. np.round scales by 10**ndigits first, which can land on the
+    other side of a .5 tie than the exact decimal value does, so those few elements fall back to round().
+    """
+    values = np.asarray(values, dtype=float)
+    scaled = values * 10 ** ndigits
+    rounded = np.atleast_1d(np.round(values, ndigits))
+    near_tie = np.atleast_1d(np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+    if near_tie.any():
+        rounded[near_tie] = [round(float(v), ndigits) for v in np.atleast_1d(values)[near_tie]]
+    return rounded.reshape(values.shape)
+
+
+def payouts(odds):
+    """
+    Profit on a 100 unit stake for an array of American odds.
+    """
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore'):
+        return np.where(odds > 0, odds, (100 / (-1 * odds)) * 100)
+
+
+def expected_values(Pwin, odds):
+    """
+    Expected value per 100 units for any broadcastable grid of win probabilities and American odds,
+    e.g. probabilities (games, 1, sides) against odds (games, books, sides).
+    """
+    Pwin = np.asarray(Pwin, dtype=float)
     Ploss = 1 - Pwin
-    Mwin = payout(odds)
-    return round((Pwin * Mwin) - (Ploss * 100), 2)
+    Mwin = payouts(odds)
+    return round_half_even((Pwin * Mwin) - (Ploss * 100), 2)
+
+
+def expected_value(Pwin, odds):
+    return float(expected_values(Pwin, odds))
 
 
 def payout(odds):
-    if odds > 0:
-        return odds
-    else:
-        return (100 / (-1 * odds)) * 100
+    return float(payouts(odds))
@@ -1,17 +1,39 @@
+import numpy as np
+
+from src.Utils.Expected_Value import round_half_even
+
+
+def american_to_decimals(american_odds):
+    """
+    Converts an array of American odds to decimal odds (European odds).
+    """
+    american_odds = np.asarray(american_odds, dtype=float)
+    with np.errstate(divide='ignore'):
+        decimal_odds = np.where(american_odds >= 100, american_odds / 100, 100 / np.abs(american_odds))
+    return round_half_even(decimal_odds, 2)
+
+
+def kelly_fractions(american_odds, model_prob):
+    """
+    Percentage of the bankroll to wager for any broadcastable grid of American odds and model probabilities,
+    e.g. odds (games, books, sides) against probabilities (games, 1, sides). Negative edges are clipped to 0.
+    """
+    model_prob = np.asarray(model_prob, dtype=float)
+    decimal_odds = american_to_decimals(american_odds)
+    bankroll_fraction = round_half_even((100 * (decimal_odds * model_prob - (1 - model_prob))) / decimal_odds, 2)
+    return np.where(bankroll_fraction > 0, bankroll_fraction, 0.0)
+
+
 def american_to_decimal(american_odds):
     """
     Converts American odds to decimal odds (European odds).
     """
-    if american_odds >= 100:
-        decimal_odds = (american_odds / 100)
-    else:
-        decimal_odds = (100 / abs(american_odds))
-    return round(decimal_odds, 2)
+    return float(american_to_decimals(american_odds))
+
 
 def calculate_kelly_criterion(american_odds, model_prob):
     """
     Calculates the fraction of the bankroll to be wagered on each bet
     """
-    decimal_odds = american_to_decimal(american_odds)
-    bankroll_fraction = round((100 * (decimal_odds * model_prob - (1 - model_prob))) / decimal_odds, 2)
-    return bankroll_fraction if bankroll_fraction > 0 else 0
\ No newline at end of file
+    bankroll_fraction = float(kelly_fractions(american_odds, model_prob))
+    return bankroll_fraction if bankroll_fraction > 0 else 0
@@ -0,0 +1,59 @@
+# src/Utils/backfill.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class TokenBucket:
+    """ Thread-safe rate limiter: `rate` tokens per second on average, bursts of up to `capacity`.
+    acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = capacity
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+def backfill(jobs, fetch, write_batch, workers=4, batch_size=50):
+    """
+    Runs fetch(job) for every job on at most `workers` threads and passes finished [(job, result), ...]
+    to write_batch() in groups of `batch_size`, always from the calling thread, so each group can be one
+    transaction. Failed jobs are not written; returns {job: exception} for them so a rerun can retry.
+    """
+    errors, batch = {}, []
+    pool = ThreadPoolExecutor(max_workers=workers)
+    futures = {pool.submit(fetch, job): job for job in jobs}
+    try:
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                batch.append((job, future.result()))
+            except Exception as e:
+                errors[job] = e
+                continue
+            if len(batch) >= batch_size:
+                write_batch(batch)
+                batch = []
+        if batch:
+            write_batch(batch)
+    finally:
+        # on an error or Ctrl-C, drop the queued fetches instead of finishing the whole history first
+        pool.shutdown(wait=True, cancel_futures=True)
+    return errors
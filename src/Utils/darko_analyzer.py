@@ -1,24 +1,69 @@
 # advanced_dark_analysis.py
 
+from datetime import date
+
+import numpy as np
 import pandas as pd
-from colorama import Fore, Style, init
+from colorama import Fore, Style
 from src.Utils import Kelly_Criterion as kc
-def deep_dark_analysis(
-    today_matches,
-    xgb_out,       
-    darko_sums,    
-    team_metrics,  
-    dpm_threshold=1.0,
-    odds_data=None,
-    kelly_criterion=False
-):
+def build_dark_table(today_matches, xgb_out, darko_sums, team_metrics, odds_data=None):
+    """
+    One row per game with the XGB pick, Darko sums, synergy, EV, Kelly and team metrics.
+    Kelly fractions for the whole slate are computed in one array op (NaN where there are no odds).
+    """
+    rows = []
+    for (home, away) in today_matches:
+        xinfo = xgb_out.get((home, away), {})
+        game_odds = (odds_data or {}).get(f"{home}:{away}")
+        (dh, da) = darko_sums.get((home, away), (0, 0))
+        xgb_side = xinfo.get("winner_side", "N/A")
+        darko_side = "home" if dh - da >= 0 else "away"
+        row = {
+            "date": str(date.today()),
+            "home_team": home,
+            "away_team": away,
+            "has_odds": game_odds is not None,
+            "home_ml": game_odds[home]["money_line_odds"] if game_odds else None,
+            "away_ml": game_odds[away]["money_line_odds"] if game_odds else None,
+            "total": game_odds["under_over_odds"] if game_odds else None,
+            "xgb_side": xgb_side,
+            "home_prob": xinfo.get("home_prob", 0.0),
+            "away_prob": xinfo.get("away_prob", 0.0),
+            "ev_home": xinfo.get("ev_home", 0.0),
+            "ev_away": xinfo.get("ev_away", 0.0),
+            "darko_home": dh,
+            "darko_away": da,
+            "darko_side": darko_side,
+            "ml_synergy": xgb_side == darko_side,
+        }
+        for team, prefix in [(home, "home"), (away, "away")]:
+            metrics = team_metrics.get(team, {})
+            row[f"{prefix}_dpm"] = metrics.get("weighted_dpm", 0)
+            row[f"{prefix}_off"] = metrics.get("off_split", 0)
+            row[f"{prefix}_def"] = metrics.get("def_split", 0)
+            row[f"{prefix}_lineup"] = metrics.get("lineup_strength", 0)
+        rows.append(row)
+
+    table = pd.DataFrame(rows)
+    if table.empty:
+        return table
+    for column in ("home_ml", "away_ml"):  # nullable ints, so games without odds don't turn -150 into -150.0
+        table[column] = pd.to_numeric(table[column]).round().astype("Int64")
+    odds = np.where(table["has_odds"].to_numpy()[:, None],
+                    table[["home_ml", "away_ml"]].to_numpy(dtype=float, na_value=np.nan), np.nan)
+    kelly = kc.kelly_fractions(odds, table[["home_prob", "away_prob"]].to_numpy(dtype=float))
+    table["kelly_home"] = np.where(table["has_odds"], kelly[:, 0], np.nan)
+    table["kelly_away"] = np.where(table["has_odds"], kelly[:, 1], np.nan)
+    return table
+
+
+def render_dark_table(table, kelly_criterion=False):
     """
     Enhanced synergy display that separates:
     1. Moneyline synergy (XGB side matches Darko side)
     2. EV synergy (XGB-chosen side has positive EV)
     3. Kelly Criterion allocation when -kc flag is passed
     """
-    init(autoreset=True)
     border = "=" * 80
     separator = "-" * 80
     
@@ -26,26 +71,12 @@ def deep_dark_analysis(
     print(f"{Fore.CYAN}{'DEEP DARK (DARKO + XGBOOST) ANALYSIS':^80}{Style.RESET_ALL}")
     print(f"{Fore.CYAN}{border}{Style.RESET_ALL}\n")
 
-    for (home, away) in today_matches:
-        # Get all the same data as before
-        xinfo = xgb_out.get((home, away), {})
-        xgb_side = xinfo.get("winner_side", "N/A")
-        home_prob = xinfo.get("home_prob", 0.0)
-        away_prob = xinfo.get("away_prob", 0.0)
-        ev_home = xinfo.get("ev_home", 0.0)
-        ev_away = xinfo.get("ev_away", 0.0)
-        
-        (dh, da) = darko_sums.get((home, away), (0, 0))
-        margin = dh - da
-        darko_side = "home" if margin >= 0 else "away"
-        
+    for row in table.itertuples(index=False):
+        home, away = row.home_team, row.away_team
+
         # Format game header
-        if odds_data and f"{home}:{away}" in odds_data:
-            game_odds = odds_data[f"{home}:{away}"]
-            home_ml = game_odds[home]["money_line_odds"]
-            away_ml = game_odds[away]["money_line_odds"]
-            total = game_odds["under_over_odds"]
-            match_title = f"[{away} {away_ml:>4}] @ [{home} {home_ml:>4}] (O/U: {total:>6})"
+        if row.has_odds:
+            match_title = f"[{away} {row.away_ml:>4}] @ [{home} {row.home_ml:>4}] (O/U: {row.total:>6})"
         else:
             match_title = f"{away} @ {home}"
 
@@ -54,17 +85,16 @@ def deep_dark_analysis(
         print(f"{separator}")
 
         # XGB & Probabilities line
-        xgb_text = f"XGB Pick: {xgb_side.upper()} (Home: {home_prob*100:.1f}%, Away: {away_prob*100:.1f}%)"
+        xgb_text = f"XGB Pick: {row.xgb_side.upper()} (Home: {row.home_prob*100:.1f}%, Away: {row.away_prob*100:.1f}%)"
         print(f"|{xgb_text:^78}|")
 
         # Darko daily sums
-        darko_text = f"Darko: {darko_side.upper()} (Home: {dh}, Away: {da})"
+        darko_text = f"Darko: {row.darko_side.upper()} (Home: {row.darko_home}, Away: {row.darko_away})"
         print(f"|{darko_text:^78}|")
 
         # Synergy lines (centered)
-        ml_synergy = xgb_side == darko_side
-        ml_color = Fore.GREEN if ml_synergy else Fore.RED
-        ml_msg = "AGREE" if ml_synergy else "DISAGREE"
+        ml_color = Fore.GREEN if row.ml_synergy else Fore.RED
+        ml_msg = "AGREE" if row.ml_synergy else "DISAGREE"
         ml_text = f"ML Synergy: {ml_color}{ml_msg:^8}{Style.RESET_ALL}"
         print(f"|{ml_text:^78}|")
 
@@ -73,29 +103,23 @@ def deep_dark_analysis(
 
 
         # EV line (centered with colors)
-        ev_text = f"EV: {home} ({Fore.GREEN if ev_home > 0 else Fore.RED}{ev_home:>6.2f}{Style.RESET_ALL}) | " \
-                 f"{away} ({Fore.GREEN if ev_away > 0 else Fore.RED}{ev_away:>6.2f}{Style.RESET_ALL})"
+        ev_text = f"EV: {home} ({Fore.GREEN if row.ev_home > 0 else Fore.RED}{row.ev_home:>6.2f}{Style.RESET_ALL}) | " \
+                 f"{away} ({Fore.GREEN if row.ev_away > 0 else Fore.RED}{row.ev_away:>6.2f}{Style.RESET_ALL})"
         print(f"|{ev_text:^78}|")
 
         # Kelly line if enabled
-        if kelly_criterion and odds_data and f"{home}:{away}" in odds_data:
-            game_odds = odds_data[f"{home}:{away}"]
-            home_odds = game_odds[home]["money_line_odds"]
-            away_odds = game_odds[away]["money_line_odds"]
-            kelly_home = kc.calculate_kelly_criterion(home_odds, home_prob)
-            kelly_away = kc.calculate_kelly_criterion(away_odds, away_prob)
-            kelly_text = f"Kelly: {home} ({kelly_home:>5.1f}%) | {away} ({kelly_away:>5.1f}%)"
+        if kelly_criterion and row.has_odds:
+            kelly_text = f"Kelly: {home} ({row.kelly_home:>5.1f}%) | {away} ({row.kelly_away:>5.1f}%)"
             print(f"|{kelly_text:^78}|")
 
         print(f"{separator}")
 
         # Team Metrics (aligned in columns)
-        for team, label in [(home, "HOME"), (away, "AWAY")]:
-            metrics = team_metrics.get(team, {})
-            dpm = metrics.get("weighted_dpm", 0)
-            off = metrics.get("off_split", 0)
-            def_val = metrics.get("def_split", 0)
-            lineup = metrics.get("lineup_strength", 0)
+        for team, prefix in [(home, "home"), (away, "away")]:
+            dpm = getattr(row, f"{prefix}_dpm")
+            off = getattr(row, f"{prefix}_off")
+            def_val = getattr(row, f"{prefix}_def")
+            lineup = getattr(row, f"{prefix}_lineup")
             
             metrics_text = f"{team:.<25} DPM: {dpm:>6.2f} | Off: {off:>6.2f} | Def: {def_val:>6.2f} | BestLU: {lineup:>6.2f}"
             print(f"|{metrics_text:^78}|")
@@ -105,3 +129,20 @@ def deep_dark_analysis(
     print(f"{Fore.CYAN}{border}{Style.RESET_ALL}")
     print(f"{Fore.CYAN}{'END OF DEEP DARK ANALYSIS':^80}{Style.RESET_ALL}")
     print(f"{Fore.CYAN}{border}{Style.RESET_ALL}\n")
+
+
+def deep_dark_analysis(
+    today_matches,
+    xgb_out,       
+    darko_sums,    
+    team_metrics,  
+    dpm_threshold=1.0,
+    odds_data=None,
+    kelly_criterion=False
+):
+    """
+    Builds the Darko table and prints it; returns the table.
+    """
+    table = build_dark_table(today_matches, xgb_out, darko_sums, team_metrics, odds_data)
+    render_dark_table(table, kelly_criterion)
+    return table
@@ -0,0 +1,160 @@
+# src/Utils/dataset_builder.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from . import storage
+from .team_stats_store import ROW_COLUMN, TeamStatsStore
+from .teams import UNKNOWN, snapshot_rows, team_ids
+
+TEAMS_PER_SNAPSHOT = 30  # days whose snapshot is missing teams are skipped
+WATERMARK_TABLE = 'dataset_watermarks'
+
+
+def season_games(odds_df, snapshots, season):
+    """
+    Joins a season's games to the stats snapshot of their date in one pass, finding each team's row
+    through the franchise table (teams.snapshot_rows).
+    `odds_df` has the odds table columns (Date, Home, Away, OU, Points, Win_Margin, Days_Rest_*);
+    `snapshots` holds every daily snapshot of the season with Date and `index` (row position) columns.
+    Returns one row per game: the home team's stats, the away team's stats suffixed '.1', then the targets.
+    """
+    snapshots = snapshots.sort_values(['Date', ROW_COLUMN], kind='stable')
+    position = snapshots.groupby('Date').cumcount().to_numpy()
+    stats = snapshots.drop(columns=[ROW_COLUMN]).set_index([snapshots['Date'].to_numpy(), position])
+    complete = snapshots['Date'].value_counts()
+    complete = complete.index[complete == TEAMS_PER_SNAPSHOT]
+
+    games = odds_df[odds_df['Date'].isin(complete)]
+    home_rows = snapshot_rows(season, team_ids(games['Home']))
+    away_rows = snapshot_rows(season, team_ids(games['Away']))
+    unknown = set(games['Home'][home_rows == UNKNOWN]) | set(games['Away'][away_rows == UNKNOWN])
+    if unknown:
+        raise KeyError(f"No stats row for {sorted(unknown)}")
+
+    dates = games['Date'].to_numpy()
+    home = stats.reindex(pd.MultiIndex.from_arrays([dates, home_rows]))
+    away = stats.reindex(pd.MultiIndex.from_arrays([dates, away_rows]))
+    frame = pd.concat([home.reset_index(drop=True),
+                       away.reset_index(drop=True).rename(columns=lambda col: f"{col}.1")], axis=1)
+
+    points, ou = games['Points'].to_numpy(dtype=float), games['OU'].to_numpy(dtype=float)
+    frame = frame.drop(columns=['TEAM_ID', 'TEAM_ID.1'])
+    frame['Score'] = points
+    frame['Home-Team-Win'] = np.where(games['Win_Margin'].to_numpy(dtype=float) > 0, 1, 0)
+    frame['OU'] = ou
+    frame['OU-Cover'] = np.select([points < ou, points > ou], [0, 1], 2)
+    frame['Days-Rest-Home'] = games['Days_Rest_Home'].to_numpy()
+    frame['Days-Rest-Away'] = games['Days_Rest_Away'].to_numpy()
+    return frame
+
+
+def build_season(season, odds_db, team_db, after=None):
+    """
+    Loads a season's odds table and its stats snapshots once each and returns season_games() for it.
+    With `after` (YYYY-MM-DD), only odds rows dated after it are read and joined.
+    """
+    # pooled per process, so a worker building several seasons opens each database once
+    where, params = ('where "Date" > ?', [after]) if after else ('', [])
+    odds_df = pd.read_sql_query(f"select * from \"odds_{season}_new\" {where}", storage.connect(odds_db),
+                                index_col="index", params=params)
+    if odds_df.empty:
+        return pd.DataFrame()
+    snapshots = TeamStatsStore.open(team_db).read_range(odds_df['Date'].min(), odds_df['Date'].max())
+    return season_games(odds_df, snapshots, season)
+
+
+def cast_features(frame):
+    """ Stats and target columns to float; TEAM_* and Date columns keep their types. """
+    for field in frame.columns.values:
+        if 'TEAM_' in field or 'Date' in field:
+            continue
+        frame[field] = frame[field].astype(float)
+    return frame
+
+
+def build_seasons(seasons, odds_db, team_db, workers=None, after=None):
+    """
+    Builds every season on its own process; `after` maps seasons to the date they were last built through.
+    Returns {season: frame} in `seasons` order, with empty frames for seasons that have nothing new.
+    """
+    seasons = list(seasons)
+    after = after or {}
+    workers = workers or min(len(seasons), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        frames = pool.map(build_season, seasons, [odds_db] * len(seasons), [team_db] * len(seasons),
+                          [after.get(season) for season in seasons])
+        return {season: cast_features(frame) for season, frame in zip(seasons, frames)}
+
+
+def build_dataset(seasons, odds_db, team_db, workers=None):
+    """
+    Builds every season on its own process and stacks them in `seasons` order.
+    Stats and target columns are cast to float; TEAM_* and Date columns keep their types.
+    """
+    return pd.concat(build_seasons(seasons, odds_db, team_db, workers).values(), ignore_index=True)
+
+
+def read_watermarks(con, table):
+    """ {season: last game date built into `table`}. """
+    if not storage.table_exists(con, WATERMARK_TABLE):
+        return {}
+    return dict(con.execute(f'select "Season", "Through" from {WATERMARK_TABLE} where "Dataset" = ?', (table,)))
+
+
+def needs_full_build(con, table):
+    """ Whether `table` has nothing to build on: missing, or left without watermarks by an older build. """
+    return not storage.table_exists(con, table) or not read_watermarks(con, table)
+
+
+def update_dataset(seasons, odds_db, team_db, con, table, full=False, workers=None):
+    """
+    Incremental build: joins only the odds rows dated after each season's watermark, appends them to `table`
+    in the dataset database `con` and moves the watermarks in the same transaction. With `full`, or when
+    needs_full_build(), every season is rebuilt and the table replaced in one transaction, so an interrupted
+    build leaves the previous table and watermarks as they were.
+    Days skipped for an incomplete stats snapshot before a watermark are not revisited; run a full build for those.
+    Returns the new rows (all rows for a full build).
+    """
+    full = full or needs_full_build(con, table)
+    frames = build_seasons(seasons, odds_db, team_db, workers, after=None if full else read_watermarks(con, table))
+    frame = pd.concat(frames.values(), ignore_index=True)
+    with con:
+        con.execute('begin')  # sqlite3 only opens transactions implicitly before DML, and the DDL belongs in it
+        con.execute(f'create table if not exists {WATERMARK_TABLE} ("Dataset" TEXT, "Season" TEXT, "Through" TEXT, '
+                    f'primary key ("Dataset", "Season"))')
+        if full:
+            con.execute(f'delete from {WATERMARK_TABLE} where "Dataset" = ?', (table,))
+            con.execute(f'drop table if exists "{table}"')
+            storage.create_table(con, table, frame.head(0).reset_index(names='index'), 'index')
+        offset = con.execute(f'select count(*) from "{table}"').fetchone()[0]
+        storage.insert_rows(con, table, ['index', *frame.columns],
+                            ((offset + i, *row) for i, row in enumerate(storage.frame_rows(frame))))
+        con.executemany(f'insert or replace into {WATERMARK_TABLE} values (?, ?, ?)',
+                        [(table, season, season_frame['Date'].max()) for season, season_frame in frames.items()
+                         if not season_frame.empty])
+    frame.index += offset
+    return frame
+
+
+def sync_feature_store(con, table, store, season_ranges, rewrite=False):
+    """
+    Rewrites the feature store files (see feature_store.FeatureStore) of every season whose row count differs
+    from the dataset table's, or of every season with `rewrite`. The table is the source of truth, so games
+    missing from the store after a failed write, or duplicated in it, are repaired by the next run.
+    Returns the seasons rewritten.
+    """
+    from .feature_store import season_labels, to_arrow
+
+    labels = season_labels(pd.read_sql_query(f'select "Date" from "{table}" order by "index"', con)['Date'],
+                           season_ranges)
+    counts = pd.Series(labels).value_counts()
+    stale = [season for season in counts.index
+             if rewrite or not os.path.exists(store.path(season)) or store.num_rows(season) != counts[season]]
+    if stale:
+        rows = cast_features(pd.read_sql_query(f'select * from "{table}" order by "index"', con, index_col='index'))
+        for season in stale:
+            store.write_table(season, to_arrow(rows[labels == season].reset_index(drop=True)))
+    return sorted(stale)
@@ -0,0 +1,133 @@
+# src/Utils/feature_store.py
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+FEATURE_STORE_DIR = 'Data/features'
+TEXT_COLUMNS = ['TEAM_NAME', 'Date', 'TEAM_NAME.1', 'Date.1']
+LABEL_COLUMNS = ['Score', 'Home-Team-Win', 'OU-Cover', 'OU']
+TARGETS = {'ML': 'Home-Team-Win', 'UO': 'OU-Cover'}
+
+
+def season_labels(dates, season_ranges):
+    """
+    Season of each YYYY-MM-DD date, from {season: {'start_date': ..., 'end_date': ...}} as in config.toml.
+    """
+    dates = pd.to_datetime(pd.Series(dates)).to_numpy()
+    labels = np.full(len(dates), None, dtype=object)
+    for season, value in season_ranges.items():
+        start = np.datetime64(datetime.strptime(value['start_date'], "%Y-%m-%d"))
+        end = np.datetime64(datetime.strptime(value['end_date'], "%Y-%m-%d"))
+        labels[(dates >= start) & (dates <= end)] = season
+    if pd.isna(labels).any():
+        raise ValueError(f"{int(pd.isna(labels).sum())} games fall outside every season range")
+    return labels
+
+
+def to_arrow(frame):
+    """ Numeric columns as float32, text columns as strings; NaN stays a value so columns map without copies. """
+    import pyarrow as pa
+
+    arrays = [pa.array(frame[column].astype(str).to_numpy(dtype=object)) if column in TEXT_COLUMNS
+              else pa.array(frame[column].to_numpy(dtype=np.float32)) for column in frame.columns]
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in frame.columns])
+
+
+class FeatureStore:
+    """ The games dataset as one uncompressed Arrow IPC file per season under `root` (needs pyarrow).
+    Files are memory-mapped on load, so only the projected columns are ever read from disk,
+    and numeric columns are float32 buffers handed to NumPy without conversion.
+    """
+
+    def __init__(self, root=FEATURE_STORE_DIR):
+        self.root = root
+
+    def path(self, season):
+        return os.path.join(self.root, f"{season}.arrow")
+
+    def seasons(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(file[:-len('.arrow')] for file in os.listdir(self.root) if file.endswith('.arrow'))
+
+    def num_rows(self, season):
+        import pyarrow as pa
+
+        with pa.memory_map(self.path(season), 'r') as source:
+            return pa.ipc.open_file(source).read_all().num_rows
+
+    def write_table(self, season, table):
+        import pyarrow as pa
+
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.path(season) + '.tmp'
+        with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, self.path(season))
+
+    def write(self, frame, season_ranges):
+        """
+        Splits the dataset into seasons by date (see season_labels) and replaces each season's file atomically.
+        """
+        labels = season_labels(frame['Date'], season_ranges)
+        for season in pd.unique(labels):
+            self.write_table(season, to_arrow(frame[labels == season].reset_index(drop=True)))
+
+    def append(self, frame, season_ranges):
+        """
+        Adds new games to the files of their seasons; seasons without new games are left untouched.
+        """
+        import pyarrow as pa
+
+        if frame.empty:
+            return
+        labels = season_labels(frame['Date'], season_ranges)
+        for season in pd.unique(labels):
+            table = to_arrow(frame[labels == season].reset_index(drop=True))
+            if os.path.exists(self.path(season)):
+                with pa.OSFile(self.path(season), 'rb') as source:  # read fully so the file can be replaced
+                    table = pa.concat_tables([pa.ipc.open_file(source).read_all(), table])
+            self.write_table(season, table)
+
+    def load(self, seasons=None, columns=None):
+        """
+        A pyarrow Table over the memory-mapped files of `seasons` (all by default), projected to `columns`.
+        """
+        import pyarrow as pa
+
+        tables = []
+        for season in seasons or self.seasons():
+            table = pa.ipc.open_file(pa.memory_map(self.path(season), 'r')).read_all()
+            tables.append(table.select(columns) if columns is not None else table)
+        if not tables:
+            raise FileNotFoundError(f"No seasons in the feature store at {self.root}; run Create_Games first.")
+        return pa.concat_tables(tables)
+
+    def to_frame(self, seasons=None, columns=None):
+        return self.load(seasons, columns).to_pandas()
+
+    def feature_columns(self, target='ML', seasons=None):
+        """
+        The trainers' feature layout: every stats column, plus the O/U line last for the 'UO' target.
+        """
+        names = self.load(seasons[:1] if seasons else self.seasons()[:1]).column_names
+        features = [name for name in names if name not in TEXT_COLUMNS and name not in LABEL_COLUMNS]
+        return features + ['OU'] if target == 'UO' else features
+
+    def xy(self, target='ML', seasons=None, dtype=np.float32):
+        """
+        (X, y) for `target` ('ML' or 'UO'). X is one (n_games, n_features) `dtype` matrix built straight from
+        the mapped column buffers; y holds the integer labels.
+        """
+        columns = self.feature_columns(target, seasons)
+        table = self.load(seasons, columns + [TARGETS[target]])
+        x = np.empty((table.num_rows, len(columns)), dtype=dtype)
+        for i, column in enumerate(columns):
+            offset = 0
+            for chunk in table.column(column).chunks:  # one chunk per season file
+                x[offset:offset + len(chunk), i] = chunk.to_numpy()
+                offset += len(chunk)
+        y = table.column(TARGETS[target]).to_numpy().astype(int)
+        return x, y
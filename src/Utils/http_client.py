@@ -0,0 +1,76 @@
+# src/Utils/http_client.py
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Data', 'http_cache')
+DEFAULT_TTL = 3600  # seconds; reruns within the hour reuse the cached response
+FOREVER = float('inf')  # for responses that never change, e.g. past dates
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HttpClient:
+    """ One pooled requests.Session shared by every fetch. Requests time out, are retried with exponential
+    backoff, and JSON responses are cached on disk keyed by URL for `ttl` seconds (0 disables the cache,
+    FOREVER keeps entries indefinitely).
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=DEFAULT_TTL, timeout=DEFAULT_TIMEOUT, retries=3, backoff_factor=1.0,
+                 pool_size=10):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.timeout = timeout
+        retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUSES,
+                      allowed_methods=frozenset(['GET']))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def cache_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def read_cache(self, url, ttl):
+        path = self.cache_path(url)
+        if ttl == 0 or not os.path.exists(path):
+            return None
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_cache(self, url, data):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_path(url))
+
+    def get_json(self, url, headers=None, ttl=None):
+        """
+        Returns the decoded JSON for `url`, from the disk cache when fresh. `ttl` overrides the client default.
+        Raises requests exceptions once retries are exhausted.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        cached = self.read_cache(url, ttl)
+        if cached is not None:
+            return cached
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if ttl != 0:
+            self.write_cache(url, data)
+        return data
+
+
+@lru_cache(maxsize=None)
+def get_http_client():
+    return HttpClient()
@@ -0,0 +1,46 @@
+# src/Utils/nn_training.py
+import numpy as np
+
+VALIDATION_SIZE = 0.1
+PATIENCE = 10
+
+# per-process state set up once by init_worker
+worker = {}
+
+
+def build_model(layers, num_classes, learning_rate=0.001):
+    """ The trainers' network: relu6 Dense layers of the given widths and a softmax over `num_classes`. """
+    import tensorflow as tf
+
+    model = tf.keras.models.Sequential()
+    model.add(tf.keras.layers.Flatten())
+    for units in layers:
+        model.add(tf.keras.layers.Dense(units, activation=tf.nn.relu6))
+    model.add(tf.keras.layers.Dense(num_classes, activation=tf.nn.softmax))
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate), loss='sparse_categorical_crossentropy',
+                  metrics=['accuracy'])
+    return model
+
+
+def init_worker(x, y, num_classes, nthread=1):
+    """ Keeps the row-normalized dataset in the worker and limits TensorFlow to `nthread` threads. """
+    import tensorflow as tf
+
+    tf.config.threading.set_intra_op_parallelism_threads(nthread)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    worker['x'], worker['y'], worker['num_classes'] = tf.keras.utils.normalize(x, axis=1), np.asarray(y), num_classes
+
+
+def validation_loss(config, epochs):
+    """
+    Sweep objective: the lowest val_loss of a network built from `config` ('layers', 'learning_rate',
+    'batch_size') within `epochs`, on the trainers' last-10% validation split.
+    """
+    import tensorflow as tf
+
+    tf.keras.utils.set_random_seed(0)
+    model = build_model(config['layers'], worker['num_classes'], config.get('learning_rate', 0.001))
+    history = model.fit(worker['x'], worker['y'], epochs=epochs, validation_split=VALIDATION_SIZE,
+                        batch_size=config.get('batch_size', 32), verbose=0,
+                        callbacks=[tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=PATIENCE)])
+    return float(min(history.history['val_loss']))
@@ -0,0 +1,125 @@
+# src/Utils/odds_ingester.py
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from .backfill import TokenBucket
+from .storage import insert_rows, table_exists
+
+WATERMARK_TABLE = 'odds_watermarks'
+ODDS_COLUMNS = {
+    'Date': 'TEXT', 'Home': 'TEXT', 'Away': 'TEXT', 'OU': 'REAL', 'Spread': 'REAL', 'ML_Home': 'REAL', 'ML_Away': 'REAL',
+    'Points': 'REAL', 'Win_Margin': 'REAL', 'Days_Rest_Home': 'INTEGER', 'Days_Rest_Away': 'INTEGER',
+}
+NO_PREVIOUS_GAME_REST = timedelta(days=7)  # start of season, big number
+BATCH_DAYS = 14  # days committed (rows plus watermark) per transaction
+
+
+def scoreboard_games(day):
+    from sbrscrape import Scoreboard
+    sb = Scoreboard(date=day)
+    return sb.games if hasattr(sb, "games") else []
+
+
+def game_rows(games, day, teams_last_played, sportsbook):
+    """
+    One odds row per game that has `sportsbook` lines. Updates `teams_last_played` for every game,
+    including the ones without odds, so days of rest stay right for the next day.
+    """
+    rows = []
+    for game in games:
+        rested = {}
+        for side in ('home_team', 'away_team'):
+            team = game[side]
+            rested[side] = day - teams_last_played[team] if team in teams_last_played else NO_PREVIOUS_GAME_REST
+            teams_last_played[team] = day
+        try:
+            rows.append({
+                'Date': str(day),
+                'Home': game['home_team'],
+                'Away': game['away_team'],
+                'OU': game['total'][sportsbook],
+                'Spread': game['away_spread'][sportsbook],
+                'ML_Home': game['home_ml'][sportsbook],
+                'ML_Away': game['away_ml'][sportsbook],
+                'Points': game['away_score'] + game['home_score'],
+                'Win_Margin': game['home_score'] - game['away_score'],
+                'Days_Rest_Home': rested['home_team'].days,
+                'Days_Rest_Away': rested['away_team'].days
+            })
+        except KeyError:
+            print(f"No {sportsbook} odds data found for game: {game}")
+    return rows
+
+
+def read_watermark(con, season):
+    """ The last date already ingested for `season`, or None. """
+    if not table_exists(con, WATERMARK_TABLE):
+        return None
+    row = con.execute(f'select "Through" from {WATERMARK_TABLE} where "Season" = ?', (season,)).fetchone()
+    return datetime.strptime(row[0], "%Y-%m-%d").date() if row else None
+
+
+def last_played(con, season):
+    """ Each team's latest stored game date in the season's table. """
+    if not table_exists(con, season):
+        return {}
+    teams = pd.read_sql_query(f'select "Date", "Home", "Away" from "{season}"', con)
+    teams = pd.concat([teams[['Date', 'Home']].set_axis(['Date', 'Team'], axis=1),
+                       teams[['Date', 'Away']].set_axis(['Date', 'Team'], axis=1)])
+    latest = teams.groupby('Team')['Date'].max()
+    return {team: datetime.strptime(day[:10], "%Y-%m-%d").date() for team, day in latest.items()}
+
+
+def write_batch(con, season, rows, through):
+    """ Appends `rows` to the season's table and moves its watermark to `through` in one transaction. """
+    with con:
+        offset = con.execute(f'select count(*) from "{season}"').fetchone()[0]
+        insert_rows(con, season, ['index', *ODDS_COLUMNS],
+                    [(offset + i, *(row[column] for column in ODDS_COLUMNS)) for i, row in enumerate(rows)])
+        con.execute(f'insert or replace into {WATERMARK_TABLE} values (?, ?)', (season, str(through)))
+
+
+def ingest_season(con, season, start_date, end_date, fetch_games=scoreboard_games, sportsbook='fanduel',
+                  workers=4, limiter=None, today=None, batch_days=BATCH_DAYS):
+    """
+    Fetches the season's days after its watermark, up to yesterday, on `workers` threads. Days are consumed in
+    date order and committed every `batch_days` days, rows and watermark together, so a failed fetch only loses
+    the batch it falls in and the next run resumes after the last committed day.
+    A season whose watermark has reached `end_date` (or yesterday) is not fetched at all. Returns the rows written.
+    """
+    yesterday = (today or date.today()) - timedelta(days=1)
+    watermark = read_watermark(con, season)
+    first = max(start_date, watermark + timedelta(days=1)) if watermark else start_date
+    last = min(end_date, yesterday)
+    if first > last:
+        return 0
+    days = [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+    limiter = limiter or TokenBucket(0.5, capacity=workers)
+
+    def fetch(day):
+        limiter.acquire()
+        print("Getting odds data: ", day)
+        return fetch_games(day)
+
+    with con:
+        if watermark is None and table_exists(con, season):
+            con.execute(f'drop table "{season}"')  # written before watermarks existed; rebuilt from scratch
+        con.execute(f'create table if not exists "{season}" ("index" INTEGER, '
+                    + ', '.join(f'"{column}" {kind}' for column, kind in ODDS_COLUMNS.items()) + ')')
+        con.execute(f'create table if not exists {WATERMARK_TABLE} ("Season" TEXT PRIMARY KEY, "Through" TEXT)')
+
+    # days of rest need the games in date order, which pool.map keeps
+    teams_last_played = last_played(con, season) if watermark else {}
+    written, rows = 0, []
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for i, (day, games) in enumerate(zip(days, pool.map(fetch, days)), start=1):
+            rows.extend(game_rows(games, day, teams_last_played, sportsbook))
+            if i % batch_days == 0 or day == last:
+                write_batch(con, season, rows, day)
+                written, rows = written + len(rows), []
+    finally:
+        pool.shutdown(cancel_futures=True)  # after a failed day, don't keep fetching days that won't be written
+    return written
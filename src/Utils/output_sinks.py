@@ -0,0 +1,82 @@
+# src/Utils/output_sinks.py
+import os
+from datetime import date
+
+from colorama import deinit, init
+
+
+class TerminalSink:
+    """
+    Prints each table with the renderer registered for its name, e.g. {'predictions': render_predictions}.
+    colorama wraps stdout while a table renders, so the colours work on Windows consoles and reset after every line.
+    """
+
+    def __init__(self, renderers, **options):
+        self.renderers = renderers
+        self.options = options
+
+    def write(self, name, table):
+        init(autoreset=True)
+        try:
+            self.renderers[name](table, **self.options)
+        finally:
+            deinit()
+
+
+class JsonLinesSink:
+    """ Appends one JSON object per row to <directory>/<name>.jsonl. """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def write(self, name, table):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, f"{name}.jsonl"), "a", encoding="utf-8") as f:
+            table.to_json(f, orient="records", lines=True)
+
+
+class CsvSink:
+    """ Appends rows to <directory>/<name>.csv, writing the header only when the file is new. """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def write(self, name, table):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{name}.csv")
+        table.to_csv(path, mode="a", header=not os.path.exists(path), index=False)
+
+
+class ParquetSink:
+    """
+    Writes <directory>/<name>_<YYYYMMDD>.parquet (needs pyarrow), or <name>_<model>_<YYYYMMDD>.parquet for a
+    single model's table, so each model of a run gets its own file. Reruns on the same day replace the file.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def write(self, name, table):
+        os.makedirs(self.directory, exist_ok=True)
+        if 'model' in table.columns and table['model'].nunique() == 1:
+            name = f"{name}_{table['model'].iloc[0]}"
+        table.to_parquet(os.path.join(self.directory, f"{name}_{date.today().strftime('%Y%m%d')}.parquet"), index=False)
+
+
+FILE_SINKS = {
+    'jsonl': JsonLinesSink,
+    'csv': CsvSink,
+    'parquet': ParquetSink,
+}
+
+
+def make_sink(spec, renderers, **options):
+    """
+    'terminal' => TerminalSink; 'jsonl:<dir>', 'csv:<dir>' or 'parquet:<dir>' => file sink writing under <dir>.
+    """
+    kind, _, directory = spec.partition(':')
+    if kind == 'terminal':
+        return TerminalSink(renderers, **options)
+    if kind not in FILE_SINKS:
+        raise ValueError(f"Unknown output '{spec}', expected terminal, jsonl:<dir>, csv:<dir> or parquet:<dir>.")
+    return FILE_SINKS[kind](directory or 'logs')
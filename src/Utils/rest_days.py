@@ -0,0 +1,26 @@
+# src/Utils/rest_days.py
+import numpy as np
+import pandas as pd
+
+FIRST_GAME_REST = 10  # start of season, big number
+MAX_REST = 9  # longer breaks (and out-of-order rows) are capped here
+
+
+def rest_days(dates, home, away, first_game=FIRST_GAME_REST, cap=MAX_REST):
+    """
+    Days since each side's previous appearance, for games listed in row order.
+    Home and away appearances are stacked (home before away within a row), grouped by team and differenced
+    in one pass; a team's first appearance gets `first_game`, and gaps outside 1..cap-1 days become `cap`.
+    Returns (home_rest, away_rest) integer arrays.
+    """
+    dates = pd.to_datetime(pd.Series(dates)).to_numpy()
+    n = len(dates)
+    appearances = pd.DataFrame({
+        'team': np.concatenate([np.asarray(home, dtype=object), np.asarray(away, dtype=object)]),
+        'date': np.concatenate([dates, dates]),
+        'order': np.concatenate([np.arange(n) * 2, np.arange(n) * 2 + 1]),
+    }).sort_values('order')
+    gap = appearances.groupby('team', sort=False)['date'].diff().dt.days
+    rest = np.where(gap.isna(), first_game, np.where((gap > 0) & (gap < cap), gap, cap)).astype(int)
+    rest = pd.Series(rest, index=appearances.index).sort_index().to_numpy()
+    return rest[:n], rest[n:]
@@ -0,0 +1,60 @@
+# src/Utils/schedule_index.py
+from datetime import timedelta
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+SCHEDULE_CSV = 'Data/nba-2024-UTC.csv'
+NO_PREVIOUS_GAME_REST = 7  # start of season, big number
+
+
+class ScheduleIndex:
+    """ Parses a season schedule once and keeps each team's game start times as a sorted datetime64 array.
+    Every lookup is a binary search (np.searchsorted) on that team's array.
+    """
+
+    def __init__(self, schedule_df):
+        teams = np.concatenate([schedule_df['Home Team'].to_numpy(), schedule_df['Away Team'].to_numpy()])
+        dates = np.concatenate([schedule_df['Date'].to_numpy(dtype='datetime64[ns]')] * 2)
+        order = np.lexsort((dates, teams))
+        teams, dates = teams[order], dates[order]
+        starts = np.flatnonzero(np.r_[True, teams[1:] != teams[:-1]])
+        stops = np.r_[starts[1:], len(teams)]
+        self.game_dates = {teams[start]: dates[start:stop] for start, stop in zip(starts, stops)}
+
+    @classmethod
+    def from_csv(cls, schedule_csv=SCHEDULE_CSV):
+        return cls(pd.read_csv(schedule_csv, parse_dates=['Date'], date_format='%d/%m/%Y %H:%M'))
+
+    def games_played(self, team, when):
+        """Number of the team's games starting at or before `when`."""
+        return int(np.searchsorted(self.game_dates.get(team, np.array([], dtype='datetime64[ns]')), np.datetime64(when, 'ns'), side='right'))
+
+    def last_game(self, team, when):
+        """Start time of the team's latest game at or before `when`, or None."""
+        played = self.games_played(team, when)
+        return pd.Timestamp(self.game_dates[team][played - 1]).to_pydatetime() if played else None
+
+    def rest_days(self, team, when, default=NO_PREVIOUS_GAME_REST):
+        """
+        Days off counted the way the models were fed: (1 day + when - last game).days,
+        or `default` when the team hasn't played yet.
+        """
+        last = self.last_game(team, when)
+        if last is None:
+            return default
+        return (timedelta(days=1) + when - last).days
+
+    def is_back_to_back(self, team, when):
+        """True if the team also played the day before `when`."""
+        return self.rest_days(team, when) <= 1
+
+    def games_in_last(self, team, when, n_days):
+        """Games started in the `n_days` window ending at `when` (inclusive)."""
+        return self.games_played(team, when) - self.games_played(team, when - timedelta(days=n_days))
+
+
+@lru_cache(maxsize=None)
+def load_schedule_index(schedule_csv=SCHEDULE_CSV):
+    return ScheduleIndex.from_csv(schedule_csv)
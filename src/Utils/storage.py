@@ -0,0 +1,112 @@
+# src/Utils/storage.py
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Data')
+ODDS_DB = os.path.join(DATA_DIR, 'OddsData.sqlite')
+TEAM_DB = os.path.join(DATA_DIR, 'TeamData.sqlite')
+DATASET_DB = os.path.join(DATA_DIR, 'dataset.sqlite')
+
+PRAGMAS = {
+    'journal_mode': 'WAL',  # readers don't block the writer
+    'synchronous': 'NORMAL',  # safe with WAL, no fsync per transaction
+    'cache_size': -64000,  # KiB, about 64 MB of page cache
+    'temp_store': 'MEMORY',
+    'busy_timeout': 30000,  # ms to wait for another writer instead of failing
+}
+# SQLite's host-parameter limit per statement; 999 before 3.32
+MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+pool = threading.local()
+
+
+def connect(path):
+    """
+    The calling thread's shared connection to `path`, opened once with PRAGMAS applied.
+    Connections are never shared across threads or forked processes; a closed one is reopened.
+    """
+    path = os.path.abspath(path)
+    if getattr(pool, 'pid', None) != os.getpid():
+        pool.pid, pool.connections = os.getpid(), {}
+    con = pool.connections.get(path)
+    if con is not None:
+        try:
+            con.execute('select 1')
+            return con
+        except sqlite3.ProgrammingError:  # closed by its user
+            pass
+    con = sqlite3.connect(path)
+    for name, value in PRAGMAS.items():
+        con.execute(f'pragma {name} = {value}')
+    pool.connections[path] = con
+    return con
+
+
+def quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sql_type(dtype):
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+
+def table_exists(con, table):
+    return con.execute("select 1 from sqlite_master where type = 'table' and name = ?", (table,)).fetchone() is not None
+
+
+def insert_rows(con, table, columns, rows, verb='insert'):
+    """
+    Inserts an iterable of row tuples with multi-row VALUES statements sized to the parameter limit.
+    Runs inside the caller's transaction; `verb` may be 'insert or replace'.
+    """
+    columns = list(columns)
+    chunk = max(1, MAX_VARIABLES // len(columns))
+    row_sql = '(' + ', '.join('?' * len(columns)) + ')'
+    prefix = f'{verb} into {quote(table)} ({", ".join(map(quote, columns))}) values '
+    batch = []
+    for row in rows:
+        batch.extend(row)
+        if len(batch) == chunk * len(columns):
+            con.execute(prefix + ', '.join([row_sql] * chunk), batch)
+            batch = []
+    if batch:
+        con.execute(prefix + ', '.join([row_sql] * (len(batch) // len(columns))), batch)
+
+
+def frame_rows(frame):
+    """ Row tuples of plain Python values, with NaN/NaT as NULL. """
+    return frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
+
+
+def create_table(con, table, frame, index_label=None):
+    """
+    Creates `table` with the frame's columns and dtypes, plus an index on `index_label` as to_sql does.
+    Runs inside the caller's transaction.
+    """
+    con.execute(f'create table {quote(table)} ('
+                + ', '.join(f'{quote(column)} {sql_type(frame[column].dtype)}' for column in frame.columns) + ')')
+    if index_label is not None:
+        con.execute(f'create index if not exists {quote("ix_" + table + "_" + index_label)} '
+                    f'on {quote(table)} ({quote(index_label)})')
+
+
+def write_frame(con, table, frame, if_exists='replace', index=True, index_label='index'):
+    """
+    DataFrame.to_sql replacement: creates (or replaces) the table from the frame's dtypes and bulk-inserts it
+    in one explicit transaction. The index is written as `index_label` with an index on it, as to_sql does.
+    """
+    if index:
+        frame = frame.reset_index(names=index_label)
+    with con:
+        if if_exists == 'replace':
+            con.execute(f'drop table if exists {quote(table)}')
+        if not table_exists(con, table):
+            create_table(con, table, frame, index_label if index else None)
+        insert_rows(con, table, frame.columns, frame_rows(frame))
@@ -0,0 +1,102 @@
+# src/Utils/sweep.py
+import itertools
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import storage
+
+SWEEP_DB = os.path.join(storage.DATA_DIR, 'sweeps.sqlite')
+TRIALS_TABLE = 'trials'
+
+
+def sample_configs(space, n, seed=0):
+    """
+    Up to `n` distinct configs drawn from `space` ({name: [values]}); the whole grid when it has no more than `n`.
+    """
+    names = sorted(space)
+    grid = [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+    return grid if len(grid) <= n else random.Random(seed).sample(grid, n)
+
+
+def config_key(config):
+    return json.dumps(config, sort_keys=True)
+
+
+def budgets(min_budget, max_budget, eta=3):
+    """ Budget of each rung: min_budget, times `eta` per rung, ending with max_budget. """
+    rungs = [min_budget]
+    while rungs[-1] * eta < max_budget:
+        rungs.append(rungs[-1] * eta)
+    return rungs + [max_budget] if rungs[-1] < max_budget else rungs
+
+
+class TrialStore:
+    """ Every finished trial as (Sweep, Config, Budget, Loss), so an interrupted sweep resumes where it stopped. """
+
+    def __init__(self, con):
+        self.con = con
+        self.con.execute(f'create table if not exists {TRIALS_TABLE} ("Sweep" TEXT, "Config" TEXT, "Budget" INTEGER, '
+                         f'"Loss" REAL, primary key ("Sweep", "Config", "Budget"))')
+
+    @classmethod
+    def open(cls, path=SWEEP_DB):
+        return cls(storage.connect(path))
+
+    def losses(self, sweep, budget):
+        """ {config key: loss} of the trials finished at `budget`. """
+        return dict(self.con.execute(f'select "Config", "Loss" from {TRIALS_TABLE} where "Sweep" = ? and "Budget" = ?',
+                                     (sweep, budget)))
+
+    def record(self, sweep, key, budget, loss):
+        with self.con:
+            self.con.execute(f'insert or replace into {TRIALS_TABLE} values (?, ?, ?, ?)', (sweep, key, budget, loss))
+
+    def results(self, sweep):
+        """ (config, budget, loss) of every trial, best loss first within the largest budget. """
+        rows = self.con.execute(f'select "Config", "Budget", "Loss" from {TRIALS_TABLE} where "Sweep" = ? '
+                                f'order by "Budget" desc, "Loss" is null, "Loss"', (sweep,))  # NaN losses are stored as NULL
+        return [(json.loads(key), budget, loss) for key, budget, loss in rows]
+
+    def best(self, sweep):
+        """ The config with the lowest loss at the largest budget any trial of `sweep` reached. """
+        results = self.results(sweep)
+        if not results:
+            raise ValueError(f"No trials recorded for sweep {sweep}; run Sweep first.")
+        return results[0][0]
+
+
+def rank(loss):
+    """ NaN losses are read back from the store as None; both rank (and print) as inf. """
+    return math.inf if loss is None or math.isnan(loss) else loss
+
+
+def successive_halving(sweep, space, objective, n_configs, min_budget, max_budget, eta=3, store=None, workers=None,
+                       initializer=None, initargs=(), seed=0):
+    """
+    Runs objective(config, budget) -> validation loss for `n_configs` configs from `space` at min_budget, then
+    re-runs the best 1/eta of them at eta times the budget, and so on up to max_budget. Trials run on a process
+    pool set up by `initializer(*initargs)` and are recorded in `store` as they finish; trials already there are
+    not run again. Returns (best config, its loss at the last rung, inf when it had none).
+    """
+    store = store or TrialStore.open()
+    configs = sample_configs(space, n_configs, seed)
+    workers = workers or min(len(configs), os.cpu_count() or 1)
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+    try:
+        for budget in budgets(min_budget, max_budget, eta):
+            done = store.losses(sweep, budget)
+            futures = {pool.submit(objective, config, budget): config_key(config) for config in configs
+                       if config_key(config) not in done}
+            for future in as_completed(futures):
+                done[futures[future]] = float(future.result())
+                store.record(sweep, futures[future], budget, done[futures[future]])
+            configs = sorted(configs, key=lambda config: rank(done[config_key(config)]))
+            print(f"{sweep}: budget {budget}, best loss {rank(done[config_key(configs[0])]):.4f} of {len(configs)} configs")
+            if budget < max_budget:
+                configs = configs[:max(1, len(configs) // eta)]
+    finally:
+        pool.shutdown(cancel_futures=True)
+    return configs[0], rank(done[config_key(configs[0])])
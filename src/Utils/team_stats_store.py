@@ -0,0 +1,156 @@
+# src/Utils/team_stats_store.py
+import re
+
+import pandas as pd
+
+from . import storage
+from .storage import quote, sql_type
+
+TEAM_DATA_DB = storage.TEAM_DB
+TEAM_STATS_TABLE = 'team_stats'
+FETCHED_TABLE = 'fetched_dates'  # every snapshot date written, including days the API had no rows for
+DATE_TABLE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+ROW_COLUMN = 'index'  # position of the team within its daily snapshot, as in the old per-date tables
+
+
+class TeamStatsStore:
+    """ Every daily league stats snapshot in one long table keyed by (Date, TEAM_ID), replacing the
+    one-table-per-date layout of TeamData.sqlite. Columns follow the stats.nba.com headers and are
+    created from the first snapshot written.
+    """
+
+    def __init__(self, con):
+        self.con = con
+
+    @classmethod
+    def open(cls, path=TEAM_DATA_DB):
+        return cls(storage.connect(path))
+
+    def close(self):
+        self.con.close()
+
+    def columns(self):
+        return [row[1] for row in self.con.execute(f'pragma table_info({quote(TEAM_STATS_TABLE)})')]
+
+    def ensure_table(self, df):
+        """
+        Creates the table and its indexes from the snapshot's columns, or adds any columns it lacks.
+        """
+        existing = self.columns()
+        if not existing:
+            columns = ', '.join(f'{quote(column)} {sql_type(df[column].dtype)}' for column in df.columns)
+            self.con.execute(f'create table {quote(TEAM_STATS_TABLE)} ({quote(ROW_COLUMN)} INTEGER, {columns}, '
+                             f'primary key ("Date", "TEAM_ID"))')
+            self.con.execute(f'create index if not exists team_stats_team_date on {quote(TEAM_STATS_TABLE)} '
+                             f'("TEAM_ID", "Date")')
+            return
+        for column in df.columns:
+            if column not in existing:
+                self.con.execute(f'alter table {quote(TEAM_STATS_TABLE)} add column {quote(column)} '
+                                 f'{sql_type(df[column].dtype)}')
+
+    def insert(self, df):
+        """
+        Bulk upserts snapshot rows in one transaction; `df` needs Date and TEAM_ID columns and may carry an
+        `index` column with each team's position within its day (numbered per date when missing).
+        """
+        with self.con:
+            self.insert_rows(df)
+
+    def insert_rows(self, df):
+        if df.empty:
+            return
+        if ROW_COLUMN not in df.columns:
+            df = df.assign(**{ROW_COLUMN: df.groupby('Date').cumcount()})
+        data = df.drop(columns=[ROW_COLUMN])
+        self.ensure_table(data)
+        columns = [ROW_COLUMN] + list(data.columns)
+        storage.insert_rows(self.con, TEAM_STATS_TABLE, columns, storage.frame_rows(df[columns]),
+                            verb='insert or replace')
+
+    def write_snapshot(self, date, df):
+        """
+        Replaces the stored snapshot for `date` (YYYY-MM-DD) with `df`, one row per team.
+        """
+        self.write_snapshots([(date, df)])
+
+    def write_snapshots(self, snapshots):
+        """
+        Replaces the snapshot of every (date, df) pair in one transaction and records the dates as fetched.
+        """
+        with self.con:
+            self.con.execute(f'create table if not exists {quote(FETCHED_TABLE)} ("Date" TEXT PRIMARY KEY, "Rows" INTEGER)')
+            for date, df in snapshots:
+                df = df.assign(Date=str(date)).reset_index(drop=True)
+                df[ROW_COLUMN] = df.index
+                if self.columns():
+                    self.con.execute(f'delete from {quote(TEAM_STATS_TABLE)} where "Date" = ?', (str(date),))
+                self.insert_rows(df)
+                self.con.execute(f'insert or replace into {quote(FETCHED_TABLE)} values (?, ?)', (str(date), len(df)))
+
+    def fetched_dates(self):
+        """
+        Dates already written, whether or not the API returned rows for them.
+        """
+        fetched = set(self.dates())
+        if storage.table_exists(self.con, FETCHED_TABLE):
+            fetched.update(date for (date,) in self.con.execute(f'select "Date" from {quote(FETCHED_TABLE)}'))
+        return fetched
+
+    def dates(self):
+        if not self.columns():
+            return []
+        return [row[0] for row in self.con.execute(f'select distinct "Date" from {quote(TEAM_STATS_TABLE)} order by "Date"')]
+
+    def read_range(self, start=None, end=None, team_ids=None):
+        """
+        Snapshots with `start` <= Date <= `end` (either bound optional), ordered by date then row position,
+        optionally restricted to `team_ids`.
+        """
+        if not self.columns():
+            return pd.DataFrame(columns=[ROW_COLUMN])
+        clauses, params = [], []
+        if start is not None:
+            clauses.append('"Date" >= ?')
+            params.append(str(start))
+        if end is not None:
+            clauses.append('"Date" <= ?')
+            params.append(str(end))
+        if team_ids is not None:
+            team_ids = [int(team_id) for team_id in team_ids]
+            clauses.append(f'"TEAM_ID" in ({", ".join("?" * len(team_ids))})')
+            params.extend(team_ids)
+        where = f' where {" and ".join(clauses)}' if clauses else ''
+        return pd.read_sql_query(f'select * from {quote(TEAM_STATS_TABLE)}{where} order by "Date", {quote(ROW_COLUMN)}',
+                                 self.con, params=params)
+
+    def read_date(self, date):
+        """
+        One day's snapshot shaped like the old per-date table: indexed by `index`, teams in their original order.
+        """
+        return self.read_range(date, date).set_index(ROW_COLUMN)
+
+
+def legacy_date_tables(con):
+    return [name for (name,) in con.execute("select name from sqlite_master where type = 'table' order by name")
+            if DATE_TABLE_PATTERN.match(name)]
+
+
+def migrate_date_tables(con, drop=True):
+    """
+    Copies every per-date table of TeamData.sqlite into the long team_stats table, then drops the
+    per-date tables (unless `drop` is False). Returns the number of tables migrated.
+    """
+    store = TeamStatsStore(con)
+    tables = legacy_date_tables(con)
+    for table in tables:
+        df = pd.read_sql_query(f'select * from {quote(table)}', con)
+        if ROW_COLUMN not in df.columns:
+            df[ROW_COLUMN] = df.index
+        store.insert(df.assign(Date=table))
+    if drop:
+        with con:
+            for table in tables:
+                con.execute(f'drop table {quote(table)}')
+        con.execute('vacuum')
+    return len(tables)
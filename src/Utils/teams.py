@@ -0,0 +1,138 @@
+# src/Utils/teams.py
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .Dictionaries import team_codes, team_index_07, team_index_08, team_index_12, team_index_13, team_index_14, \
+    team_index_current
+
+Franchise = namedtuple('Franchise', ['team_id', 'abbreviation', 'name', 'aliases'])
+
+# One row per franchise, keyed by its stats.nba.com TEAM_ID (stable across relocations and renames).
+# `name` is the current stats.nba.com TEAM_NAME; aliases cover former names and the spellings other sources use.
+FRANCHISES = [
+    Franchise(1610612737, 'ATL', 'Atlanta Hawks', ()),
+    Franchise(1610612738, 'BOS', 'Boston Celtics', ()),
+    Franchise(1610612751, 'BKN', 'Brooklyn Nets', ('New Jersey Nets', 'NJN')),
+    Franchise(1610612766, 'CHA', 'Charlotte Hornets', ('Charlotte Bobcats',)),
+    Franchise(1610612741, 'CHI', 'Chicago Bulls', ()),
+    Franchise(1610612739, 'CLE', 'Cleveland Cavaliers', ()),
+    Franchise(1610612742, 'DAL', 'Dallas Mavericks', ()),
+    Franchise(1610612743, 'DEN', 'Denver Nuggets', ()),
+    Franchise(1610612765, 'DET', 'Detroit Pistons', ()),
+    Franchise(1610612744, 'GSW', 'Golden State Warriors', ()),
+    Franchise(1610612745, 'HOU', 'Houston Rockets', ()),
+    Franchise(1610612754, 'IND', 'Indiana Pacers', ()),
+    Franchise(1610612746, 'LAC', 'LA Clippers', ('Los Angeles Clippers',)),
+    Franchise(1610612747, 'LAL', 'Los Angeles Lakers', ('LA Lakers',)),
+    Franchise(1610612763, 'MEM', 'Memphis Grizzlies', ()),
+    Franchise(1610612748, 'MIA', 'Miami Heat', ()),
+    Franchise(1610612749, 'MIL', 'Milwaukee Bucks', ()),
+    Franchise(1610612750, 'MIN', 'Minnesota Timberwolves', ()),
+    Franchise(1610612740, 'NOP', 'New Orleans Pelicans', ('New Orleans Hornets', 'NOH')),
+    Franchise(1610612752, 'NYK', 'New York Knicks', ()),
+    Franchise(1610612760, 'OKC', 'Oklahoma City Thunder', ('Seattle SuperSonics', 'SEA')),
+    Franchise(1610612753, 'ORL', 'Orlando Magic', ()),
+    Franchise(1610612755, 'PHI', 'Philadelphia 76ers', ()),
+    Franchise(1610612756, 'PHX', 'Phoenix Suns', ()),
+    Franchise(1610612757, 'POR', 'Portland Trail Blazers', ()),
+    Franchise(1610612758, 'SAC', 'Sacramento Kings', ()),
+    Franchise(1610612759, 'SAS', 'San Antonio Spurs', ()),
+    Franchise(1610612761, 'TOR', 'Toronto Raptors', ()),
+    Franchise(1610612762, 'UTA', 'Utah Jazz', ()),
+    Franchise(1610612764, 'WAS', 'Washington Wizards', ()),
+]
+
+TEAM_IDS = np.array([franchise.team_id for franchise in FRANCHISES], dtype=np.int64)
+TEAM_NAMES = np.array([franchise.name for franchise in FRANCHISES], dtype=object)
+UNKNOWN = -1
+
+
+def name_keys(names):
+    """ Case, space and punctuation-insensitive lookup keys: 'LA Clippers' and 'LAClippers' both give 'laclippers'. """
+    return pd.Series(names, dtype=object).astype(str).str.lower().str.replace(r'[^a-z0-9]', '', regex=True)
+
+
+def build_alias_index():
+    names, ids = [], []
+    for franchise in FRANCHISES:
+        for name in (franchise.name, franchise.abbreviation) + franchise.aliases:
+            names.append(name)
+            ids.append(franchise.team_id)
+    # SBR location codes, e.g. 'GoldenState' or 'LAClippers'
+    by_name = dict(zip(name_keys(names), ids))
+    for code, name in team_codes.items():
+        names.append(code)
+        ids.append(by_name[name_keys([name])[0]])
+    keys = name_keys(names)
+    first = ~keys.duplicated().to_numpy()
+    return pd.Index(keys[first]), np.asarray(ids, dtype=np.int64)[first]
+
+
+ALIAS_INDEX, ALIAS_IDS = build_alias_index()
+TEAM_ID_INDEX = pd.Index(TEAM_IDS)
+
+
+def team_ids(names):
+    """
+    Resolves any name form (full name, former name, abbreviation, SBR code) to the franchise TEAM_ID
+    in one vectorized lookup; unknown names give UNKNOWN (-1).
+    """
+    positions = ALIAS_INDEX.get_indexer(name_keys(names))
+    return np.where(positions >= 0, ALIAS_IDS[positions], UNKNOWN)
+
+
+def team_names(ids):
+    """ Current stats.nba.com name for each TEAM_ID; None for unknown IDs. """
+    positions = TEAM_ID_INDEX.get_indexer(np.asarray(ids, dtype=np.int64))
+    return np.where(positions >= 0, TEAM_NAMES[positions], None)
+
+
+def canonical_names(names):
+    """ The current name for every recognised team; unrecognised names are returned unchanged. """
+    names = np.asarray(names, dtype=object)
+    canonical = team_names(team_ids(names))
+    return np.where(pd.isna(canonical), names, canonical)
+
+
+def snapshot_order(team_index):
+    rows = np.full(len(FRANCHISES), UNKNOWN, dtype=np.int64)
+    positions = TEAM_ID_INDEX.get_indexer(team_ids(list(team_index)))
+    if (positions < 0).any():
+        raise ValueError(f"Unknown teams in snapshot order: {np.asarray(list(team_index))[positions < 0]}")
+    rows[positions] = list(team_index.values())
+    return rows
+
+
+# Row of each franchise (in FRANCHISES order) within a daily stats snapshot, per era of team names
+SNAPSHOT_ROWS = {
+    '2007-08': snapshot_order(team_index_07),
+    '2008-09': snapshot_order(team_index_08),
+    '2012-13': snapshot_order(team_index_12),
+    '2013-14': snapshot_order(team_index_13),
+    '2014-15': snapshot_order(team_index_14),
+    'current': snapshot_order(team_index_current),
+}
+
+
+def snapshot_era(season):
+    """ The SNAPSHOT_ROWS era a season (e.g. '2013-14') belongs to; None stands for the current season. """
+    if season == '2007-08':
+        return '2007-08'
+    if season in ('2008-09', '2009-10', '2010-11', '2011-12'):
+        return '2008-09'
+    if season in ('2012-13', '2013-14'):
+        return season
+    if season is None or season in ('2022-23', '2023-24'):
+        return 'current'
+    return '2014-15'
+
+
+def snapshot_rows(season, ids):
+    """
+    Row position of each TEAM_ID within a daily stats snapshot of `season` (None for the current season),
+    as one array lookup; UNKNOWN for teams that aren't in that season's snapshot.
+    """
+    positions = TEAM_ID_INDEX.get_indexer(np.asarray(ids, dtype=np.int64))
+    return np.where(positions >= 0, SNAPSHOT_ROWS[snapshot_era(season)][positions], UNKNOWN)
@@ -1,10 +1,10 @@
-import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
-import requests
 
-from .Dictionaries import team_index_current
+from .http_client import get_http_client
+from .teams import UNKNOWN, team_ids
 
 games_header = {
     'user-agent': 'Mozilla/5.0 (Windows NT 6.2; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) '
@@ -27,19 +27,33 @@ data_headers = {
 }
 
 
-def get_json_data(url):
-    raw_data = requests.get(url, headers=data_headers)
+def fetch_concurrently(fetchers):
+    """
+    Runs independent zero-argument fetch callables on a thread pool, so the wall time is roughly the slowest one.
+    Returns ({name: result}, {name: exception}); a failed fetch is reported instead of aborting the others.
+    """
+    results, errors = {}, {}
+    with ThreadPoolExecutor(max_workers=max(len(fetchers), 1)) as pool:
+        futures = {name: pool.submit(fetch) for name, fetch in fetchers.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+    return results, errors
+
+
+def get_json_data(url, ttl=None):
     try:
-        json = raw_data.json()
+        json = get_http_client().get_json(url, headers=data_headers, ttl=ttl)
     except Exception as e:
         print(e)
         return {}
     return json.get('resultSets')
 
 
-def get_todays_games_json(url):
-    raw_data = requests.get(url, headers=games_header)
-    json = raw_data.json()
+def get_todays_games_json(url, ttl=None):
+    json = get_http_client().get_json(url, headers=games_header, ttl=ttl)
     return json.get('gs').get('g')
 
 
@@ -64,19 +78,55 @@ def create_todays_games(input_list):
 
 
 def create_todays_games_from_odds(input_dict):
-    games = []
-    for game in input_dict.keys():
-        home_team, away_team = game.split(":")
-        if home_team not in team_index_current or away_team not in team_index_current:
-            continue
-        games.append([home_team, away_team])
-    return games
+    games = [game.split(":") for game in input_dict.keys()]
+    known = (team_ids([team for game in games for team in game]).reshape(-1, 2) != UNKNOWN).all(axis=1)
+    return [[home_team, away_team] for (home_team, away_team), ok in zip(games, known) if ok]
+
+
+def normalize_sbr_dates(date_strings):
+    """
+    Converts a whole column of SBR season dates ('2019-20-1022': season start year, then MMDD) to datetime64.
+    Months up to August belong to the season's second year, as does every row after the calendar rolls over
+    from December to January, so games played late in the following year (the 2020 bubble) keep that year.
+    Rows are expected in table order. Values already in YYYY-MM-DD form are parsed as is; anything else is NaT.
+    """
+    date_strings = pd.Series(date_strings, dtype=object)
+    parts = date_strings.str.extract(r'^(\d{4})-\d+-(\d\d)(\d\d)$').astype(float)
+    start_year, month, day = parts[0], parts[1], parts[2]
+    rolled_over = month.lt(month.cummax()).cummax()
+    year = start_year + ((month <= 8) | rolled_over)
+    sbr = pd.to_datetime(pd.DataFrame({'year': year, 'month': month, 'day': day}), errors='coerce')
+    iso = pd.to_datetime(date_strings.where(start_year.isna()), format='%Y-%m-%d', errors='coerce')
+    return sbr.fillna(iso)
 
 
 def get_date(date_string):
-    year1, month, day = re.search(r'(\d+)-\d+-(\d\d)(\d\d)', date_string).groups()
-    year = year1 if int(month) > 8 else int(year1) + 1
-    return datetime.strptime(f"{year}-{month}-{day}", '%Y-%m-%d')
+    return normalize_sbr_dates([date_string])[0].to_pydatetime()
+
+
+def normalize(x, axis=-1, order=2):
+    """
+    NumPy copy of tf.keras.utils.normalize, so normalizing features doesn't require importing TensorFlow.
+    """
+    l2 = np.atleast_1d(np.linalg.norm(x, order, axis))
+    l2[l2 == 0] = 1
+    return x / np.expand_dims(l2, axis)
+
+
+def moneyline_odds(home_team_odds, away_team_odds):
+    """
+    (n_games, 2) array of [away, home] American odds, lined up with the models' [away_prob, home_prob] columns.
+    Games missing either side's odds get NaN on both sides.
+    """
+    odds = [[away, home] if home and away else [np.nan, np.nan] for home, away in zip(home_team_odds, away_team_odds)]
+    return np.array(odds, dtype=float).reshape(-1, 2)
+
+
+def build_uo_data(frame_ml, todays_games_uo):
+    """
+    Appends the O/U line to the money line features without copying the frame.
+    """
+    return np.column_stack((frame_ml.to_numpy(dtype=float), np.asarray(todays_games_uo, dtype=float)))
 
 
 
@@ -98,14 +148,12 @@ def build_darko_sums(daily_csv, today_matches):
         raise ValueError("Could not find PTS column in daily CSV.")
     df[pts_col] = pd.to_numeric(df[pts_col], errors="coerce")
 
-    sums_by_team = df.groupby("SearchTeam")[pts_col].sum().to_dict()
-
-    out = {}
-    for (home, away) in today_matches:
-        home_pts = sums_by_team.get(home, 0.0)
-        away_pts = sums_by_team.get(away, 0.0)
-        out[(home, away)] = (home_pts, away_pts)
-    return out
+    # keyed by franchise ID, so DARKO's team spelling doesn't have to match the odds feed's
+    sums_by_team = df.groupby(team_ids(df["SearchTeam"]))[pts_col].sum().drop(UNKNOWN, errors="ignore")
+    ids = team_ids([team for match in today_matches for team in match]).reshape(-1, 2)
+    home_pts = sums_by_team.reindex(ids[:, 0], fill_value=0.0).tolist()
+    away_pts = sums_by_team.reindex(ids[:, 1], fill_value=0.0).tolist()
+    return {(home, away): pts for (home, away), pts in zip(today_matches, zip(home_pts, away_pts))}
 
 def load_skill_data(skill_csv):
     df_skill = pd.read_csv(skill_csv)
@@ -0,0 +1,142 @@
+# src/Utils/walk_forward.py
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from . import storage
+from .Expected_Value import payouts
+from .feature_store import TARGETS, FeatureStore
+from .teams import team_ids
+
+FOLD_CACHE_DIR = os.path.join(storage.DATA_DIR, 'folds')
+MIN_TRAIN_SEASONS = 3
+OU_ODDS = -110  # the odds tables only carry the total, so both sides are priced at standard juice
+PUSH_CLASS = {'ML': None, 'UO': 2}  # an O/U push refunds the stake
+
+Fold = namedtuple('Fold', ['season', 'x_train', 'y_train', 'x_test', 'y_test', 'odds_test'])
+
+
+def season_odds(con, season):
+    """ Date, TEAM_ID.home, TEAM_ID.away and moneylines of a season's odds table; empty when it doesn't exist. """
+    columns = ['Date', 'TEAM_ID.home', 'TEAM_ID.away', 'ML_Home', 'ML_Away']
+    table = f'odds_{season}_new'
+    if not storage.table_exists(con, table):
+        return pd.DataFrame({'Date': pd.Series(dtype=object), 'TEAM_ID.home': pd.Series(dtype='int64'),
+                             'TEAM_ID.away': pd.Series(dtype='int64'), 'ML_Home': pd.Series(dtype=float),
+                             'ML_Away': pd.Series(dtype=float)})
+    odds = pd.read_sql_query(f'select "Date", "Home", "Away", "ML_Home", "ML_Away" from "{table}"', con)
+    odds['TEAM_ID.home'], odds['TEAM_ID.away'] = team_ids(odds['Home']), team_ids(odds['Away'])
+    return odds[columns].drop_duplicates(['Date', 'TEAM_ID.home', 'TEAM_ID.away'])
+
+
+def class_odds(games, odds, target):
+    """
+    American odds of betting on each class of `target` for every game, NaN where there is no bet:
+    ML is [away, home] from the moneylines, UO is [under, over, push] at OU_ODDS with no bet on a push.
+    """
+    if target == 'UO':
+        return np.tile(np.array([OU_ODDS, OU_ODDS, np.nan]), (len(games), 1))
+    keys = pd.DataFrame({'Date': games['Date'].to_numpy(), 'TEAM_ID.home': team_ids(games['TEAM_NAME']),
+                         'TEAM_ID.away': team_ids(games['TEAM_NAME.1'])})
+    joined = keys.merge(odds, on=['Date', 'TEAM_ID.home', 'TEAM_ID.away'], how='left')
+    return joined[['ML_Away', 'ML_Home']].to_numpy(dtype=float)
+
+
+def fold_metrics(probabilities, y, odds, push_class=None):
+    """
+    Accuracy, log-loss and flat-stake ROI of one fold. Every game is bet one unit on its most likely class
+    unless that class has no odds; ROI is profit per unit staked.
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    y = np.asarray(y, dtype=int)
+    picks = np.argmax(probabilities, axis=1)
+    rows = np.arange(len(y))
+    picked_odds = odds[rows, picks]
+    bets = ~np.isnan(picked_odds)
+    won = picks == y
+    profit = np.where(won, payouts(np.where(bets, picked_odds, 100)) / 100, -1.0)
+    if push_class is not None:
+        profit = np.where(y == push_class, 0.0, profit)
+    return {
+        'Accuracy': float(np.mean(won)),
+        'Log-Loss': float(-np.mean(np.log(np.clip(probabilities[rows, y], 1e-15, 1)))),
+        'ROI': float(profit[bets].sum() / bets.sum()) if bets.any() else np.nan,
+        'Bets': int(bets.sum()),
+    }
+
+
+class FoldCache:
+    """ Walk-forward folds over the feature store: each season is tested on a model trained on every season before it.
+    Each target's matrices are built once, in season order, into .npy files under `root` and memory-mapped, so a
+    fold is just two slices of them. The cache is rebuilt when the feature store files change.
+    """
+
+    def __init__(self, store=None, root=FOLD_CACHE_DIR, odds_db=storage.ODDS_DB):
+        self.store = store or FeatureStore(os.path.join(storage.DATA_DIR, 'features'))
+        self.root = root
+        self.odds_db = odds_db
+
+    def path(self, target, name):
+        return os.path.join(self.root, target, name)
+
+    def fingerprint(self, target):
+        files = [(season, stat.st_size, stat.st_mtime_ns)
+                 for season, stat in ((season, os.stat(self.store.path(season))) for season in self.store.seasons())]
+        return hashlib.sha256(json.dumps([target, files]).encode()).hexdigest()
+
+    def build(self, target):
+        """ Writes x, y and per-class odds for every game of the store, then the manifest that marks them valid. """
+        os.makedirs(os.path.join(self.root, target), exist_ok=True)
+        seasons = self.store.seasons()
+        x, y = self.store.xy(target, seasons)
+        games = self.store.to_frame(seasons, ['Date', 'TEAM_NAME', 'TEAM_NAME.1'])
+        con = storage.connect(self.odds_db)
+        odds = pd.concat([season_odds(con, season) for season in seasons], ignore_index=True)
+        for name, array in (('x', x), ('y', y), ('odds', class_odds(games, odds, target))):
+            with open(self.path(target, f'{name}.npy.tmp'), 'wb') as file:
+                np.save(file, array)
+            os.replace(self.path(target, f'{name}.npy.tmp'), self.path(target, f'{name}.npy'))
+        sizes = [self.store.load([season], [TARGETS[target]]).num_rows for season in seasons]
+        manifest = {'fingerprint': self.fingerprint(target), 'seasons': seasons,
+                    'offsets': np.concatenate([[0], np.cumsum(sizes)]).tolist()}
+        with open(self.path(target, 'manifest.json.tmp'), 'w') as file:
+            json.dump(manifest, file)
+        os.replace(self.path(target, 'manifest.json.tmp'), self.path(target, 'manifest.json'))
+        return manifest
+
+    def load(self, target):
+        """ (manifest, x, y, odds) with the arrays memory-mapped; builds the cache first when it is missing or stale. """
+        manifest = None
+        if os.path.exists(self.path(target, 'manifest.json')):
+            with open(self.path(target, 'manifest.json')) as file:
+                manifest = json.load(file)
+        if manifest is None or manifest['fingerprint'] != self.fingerprint(target):
+            manifest = self.build(target)
+        arrays = [np.load(self.path(target, f'{name}.npy'), mmap_mode='r') for name in ('x', 'y', 'odds')]
+        return (manifest, *arrays)
+
+    def folds(self, target='ML', min_train_seasons=MIN_TRAIN_SEASONS):
+        """ One Fold per season after the first `min_train_seasons`, in season order. """
+        manifest, x, y, odds = self.load(target)
+        offsets = manifest['offsets']
+        for i, season in enumerate(manifest['seasons'][min_train_seasons:], start=min_train_seasons):
+            start, end = offsets[i], offsets[i + 1]
+            yield Fold(season, x[:start], y[:start], x[start:end], y[start:end], odds[start:end])
+
+
+def evaluate(fit_predict, target='ML', cache=None, min_train_seasons=MIN_TRAIN_SEASONS):
+    """
+    Walk-forward evaluation of a trainer: fit_predict(x_train, y_train, x_test) returns (n_test, n_classes)
+    probabilities. Returns one row per fold with Season, Train and Test sizes, Accuracy, Log-Loss, ROI and Bets.
+    """
+    cache = cache or FoldCache()
+    rows = []
+    for fold in cache.folds(target, min_train_seasons):
+        probabilities = fit_predict(fold.x_train, fold.y_train, fold.x_test)
+        rows.append({'Season': fold.season, 'Train': len(fold.y_train), 'Test': len(fold.y_test),
+                     **fold_metrics(probabilities, fold.y_test, fold.odds_test, PUSH_CLASS[target])})
+    return pd.DataFrame(rows)
@@ -0,0 +1,105 @@
+# src/Utils/xgb_training.py
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+TEST_SIZE = 0.1  # held out for the reported accuracy
+VALIDATION_SIZE = 0.1  # of the remaining rows, watched for early stopping
+EARLY_STOPPING_ROUNDS = 50
+MAX_BIN = 256
+
+TrainingRun = namedtuple('TrainingRun', ['seed', 'accuracy', 'rounds', 'model'])
+
+# per-process state set up once by init_worker
+worker = {}
+
+
+def thread_budget(workers):
+    """ Threads each of `workers` processes may use without oversubscribing the machine. """
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def split_indices(n, seed, test_size=TEST_SIZE, validation_size=VALIDATION_SIZE):
+    """ (train, validation, test) row indices for one seed. """
+    rest, test = train_test_split(np.arange(n), test_size=test_size, random_state=seed)
+    train, validation = train_test_split(rest, test_size=validation_size, random_state=seed)
+    return train, validation, test
+
+
+def init_worker(x, y, params, nthread):
+    """
+    Keeps the dataset in the worker and sketches its histogram bins once; every split quantizes its rows
+    against these cuts instead of re-sketching.
+    """
+    import xgboost as xgb
+
+    worker['x'], worker['y'], worker['nthread'] = x, y, nthread
+    worker['params'] = {**params, 'tree_method': 'hist', 'max_bin': MAX_BIN, 'nthread': nthread}
+    worker['cuts'] = xgb.QuantileDMatrix(x, y, max_bin=MAX_BIN, nthread=nthread)
+
+
+def fit(params, seed, num_rounds, early_stopping_rounds):
+    """ Trains `params` over the worker's params on one seed's split; returns the booster and the test rows. """
+    import xgboost as xgb
+
+    x, y, cuts, nthread = worker['x'], worker['y'], worker['cuts'], worker['nthread']
+    train, validation, test = split_indices(len(y), seed)
+    dtrain = xgb.QuantileDMatrix(x[train], y[train], ref=cuts, nthread=nthread)
+    dvalidation = xgb.QuantileDMatrix(x[validation], y[validation], ref=dtrain, nthread=nthread)  # same cuts
+    booster = xgb.train({**worker['params'], 'seed': seed, **params}, dtrain, num_rounds,
+                        evals=[(dvalidation, 'validation')],
+                        callbacks=[xgb.callback.EarlyStopping(rounds=early_stopping_rounds, save_best=True)],
+                        verbose_eval=False)
+    return booster, test
+
+
+def train_seed(seed, num_rounds, early_stopping_rounds=EARLY_STOPPING_ROUNDS):
+    """
+    Trains on one seed's split, stopping once validation loss hasn't improved for `early_stopping_rounds`,
+    and scores the best iteration on the test rows. Returns a TrainingRun holding the booster as JSON bytes.
+    """
+    import xgboost as xgb
+
+    booster, test = fit({}, seed, num_rounds, early_stopping_rounds)
+    x, y = worker['x'], worker['y']
+    # raw feature values, as the saved model sees them at prediction time
+    predictions = booster.predict(xgb.DMatrix(x[test], nthread=worker['nthread']))
+    accuracy = round(float(np.mean(np.argmax(predictions, axis=1) == y[test])) * 100, 1)
+    return TrainingRun(seed, accuracy, booster.num_boosted_rounds(), bytes(booster.save_raw('json')))
+
+
+def validation_loss(config, num_rounds, early_stopping_rounds=EARLY_STOPPING_ROUNDS):
+    """
+    Sweep objective: the best validation loss of `config` (over the worker's params) within `num_rounds`.
+    Every config trains on seed 0's split, and its test rows are never looked at.
+    """
+    booster, test = fit(config, 0, num_rounds, early_stopping_rounds)
+    return float(booster.best_score)
+
+
+def train_seeds(x, y, params, seeds, num_rounds, workers=None, early_stopping_rounds=EARLY_STOPPING_ROUNDS):
+    """
+    Trains one booster per seed across `workers` processes (one per CPU by default), each limited to its
+    share of the threads, and yields the TrainingRuns as they finish.
+    """
+    seeds = list(seeds)
+    workers = workers or min(len(seeds), os.cpu_count() or 1)
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                               initargs=(x, y, params, thread_budget(workers)))
+    try:
+        futures = [pool.submit(train_seed, seed, num_rounds, early_stopping_rounds) for seed in seeds]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def save_model(model, path):
+    """ Writes a booster's JSON bytes next to `path` and renames it into place, so readers never see half a file. """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(model)
+    os.replace(tmp_path, path)